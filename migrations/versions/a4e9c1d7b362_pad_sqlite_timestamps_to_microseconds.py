@@ -0,0 +1,40 @@
+"""Pad SQLite whole-second timestamps to microseconds
+
+func.now() defaults used to store CURRENT_TIMESTAMP text without
+fractional seconds, while Python-bound values carry six digits. Keyset
+pagination compares the raw text, so the cursor-paginated columns are
+rewritten to the one form func.now() now writes on SQLite. Other
+dialects store real timestamps and are left alone.
+
+Revision ID: a4e9c1d7b362
+Revises: f3c8a2e6b519
+Create Date: 2026-10-16 23:50:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e9c1d7b362'
+down_revision = 'f3c8a2e6b519'
+branch_labels = None
+depends_on = None
+
+# Columns walked by (created_at, id) cursors
+COLUMNS = (('response', 'created_at'), ('respondent_events', 'created_at'))
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for table, column in COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column} = {column} || '.000000' "
+            f"WHERE length({column}) = 19"
+        )
+
+
+def downgrade() -> None:
+    # Padded values stay valid timestamps
+    pass
@@ -0,0 +1,76 @@
+"""Add denormalized survey_id to Response
+
+Revision ID: b7c3e91a2f40
+Revises: 9d9bb9d0e800
+Create Date: 2026-10-16 21:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c3e91a2f40'
+down_revision = '9d9bb9d0e800'
+branch_labels = None
+depends_on = None
+
+# Rows updated per backfill statement; each chunk commits on its own so
+# writers are never blocked for the whole backfill.
+BACKFILL_CHUNK_SIZE = 10000
+
+INDEXES = (
+    ('ix_response_survey_id_created_at', ['survey_id', 'created_at']),
+    ('ix_response_survey_id_user_session_id', ['survey_id', 'user_session_id']),
+    ('ix_response_survey_id_user_id', ['survey_id', 'user_id']),
+)
+
+
+def _backfill_survey_id() -> None:
+    bind = op.get_bind()
+    min_id, max_id = bind.execute(
+        sa.text('SELECT MIN(id), MAX(id) FROM response WHERE survey_id IS NULL')
+    ).one()
+    if min_id is None:
+        return
+
+    backfill = sa.text(
+        """
+        UPDATE response
+        SET survey_id = (
+            SELECT question.survey_id FROM question
+            WHERE question.id = response.question_id
+        )
+        WHERE id >= :start AND id < :end AND survey_id IS NULL
+        """
+    )
+    with op.get_context().autocommit_block():
+        for start in range(min_id, max_id + 1, BACKFILL_CHUNK_SIZE):
+            bind.execute(backfill, {'start': start, 'end': start + BACKFILL_CHUNK_SIZE})
+
+
+def upgrade() -> None:
+    # Plain ADD COLUMN: a batch table rebuild would copy every response.
+    # SQLite cannot add the constraint afterwards, the model declares it.
+    op.add_column('response', sa.Column('survey_id', sa.Integer(), nullable=True))
+    if op.get_bind().dialect.name != 'sqlite':
+        op.create_foreign_key(
+            'fk_response_survey_id_survey', 'response', 'survey', ['survey_id'], ['id']
+        )
+
+    _backfill_survey_id()
+
+    for name, columns in INDEXES:
+        op.create_index(name, 'response', columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='response')
+
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint(
+            'fk_response_survey_id_survey', 'response', type_='foreignkey'
+        )
+    with op.batch_alter_table('response', schema=None) as batch_op:
+        batch_op.drop_column('survey_id')
@@ -0,0 +1,40 @@
+"""Add composite indexes for hot query shapes
+
+Indexes for the full scans reported by tests/performance/audit_indexes.py.
+respondent_surveys (respondent_id, survey_id) lookups are already served
+by the uq_respondent_surveys_respondent_id_survey_id unique index, and
+response (question_id, user_session_id) lookups by the unique index of
+revision e5b1d7a3c402.
+
+Revision ID: d2a6f4c8e913
+Revises: b7c3e91a2f40
+Create Date: 2026-10-16 22:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a6f4c8e913'
+down_revision = 'b7c3e91a2f40'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_response_user_session_id_created_at', 'response', ['user_session_id', 'created_at']),
+    ('ix_response_user_id_created_at', 'response', ['user_id', 'created_at']),
+    ('ix_response_respondent_id', 'response', ['respondent_id']),
+    ('ix_question_survey_id_order', 'question', ['survey_id', 'order']),
+    ('ix_survey_is_active_is_public_id', 'survey', ['is_active', 'is_public', 'id']),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,52 @@
+"""Unique response per question and session, response idempotency key
+
+Duplicate (question_id, user_session_id) responses left by concurrent
+submits are removed first, keeping the earliest one.
+
+Revision ID: e5b1d7a3c402
+Revises: d2a6f4c8e913
+Create Date: 2026-10-16 22:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b1d7a3c402'
+down_revision = 'd2a6f4c8e913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM response
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM response GROUP BY question_id, user_session_id
+        )
+        """
+    )
+    op.create_index(
+        'uq_response_question_id_user_session_id',
+        'response',
+        ['question_id', 'user_session_id'],
+        unique=True,
+    )
+
+    # Plain ADD COLUMN: a batch table rebuild would copy every response
+    op.add_column(
+        'response', sa.Column('idempotency_key', sa.String(length=255), nullable=True)
+    )
+    op.create_index(
+        'uq_response_idempotency_key', 'response', ['idempotency_key'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_response_idempotency_key', table_name='response')
+    with op.batch_alter_table('response', schema=None) as batch_op:
+        batch_op.drop_column('idempotency_key')
+
+    op.drop_index('uq_response_question_id_user_session_id', table_name='response')
@@ -0,0 +1,98 @@
+"""Merge duplicate respondents of a session, unique respondents.session_id
+
+Responses used to create a new respondent per answer, so a session may
+own many respondents. For every session the lowest respondent id is
+kept: responses, events, consent logs and survey participations of the
+duplicates are moved to it, and the duplicates are deleted. When the
+kept respondent and a duplicate both took part in the same survey, the
+participation of the lower respondent id wins.
+
+Revision ID: f3c8a2e6b519
+Revises: e5b1d7a3c402
+Create Date: 2026-10-16 23:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a2e6b519'
+down_revision = 'e5b1d7a3c402'
+branch_labels = None
+depends_on = None
+
+# Respondents that are not the lowest id of their session
+DUPLICATES = """
+    SELECT d.id FROM respondents d
+    WHERE d.session_id IS NOT NULL
+      AND d.id > (SELECT MIN(k.id) FROM respondents k WHERE k.session_id = d.session_id)
+"""
+
+CHILD_TABLES = ('response', 'respondent_events', 'consent_logs', 'respondent_surveys')
+
+
+def _keeper_of(column: str) -> str:
+    return f"""
+        (SELECT MIN(k.id) FROM respondents k
+         WHERE k.session_id = (
+             SELECT d.session_id FROM respondents d WHERE d.id = {column}
+         ))
+    """
+
+
+def upgrade() -> None:
+    # respondent_surveys is unique per (respondent_id, survey_id)
+    op.execute(
+        """
+        DELETE FROM respondent_surveys
+        WHERE id IN (
+            SELECT rs.id FROM respondent_surveys rs
+            JOIN respondents r ON r.id = rs.respondent_id
+            WHERE EXISTS (
+                SELECT 1 FROM respondent_surveys o
+                JOIN respondents ro ON ro.id = o.respondent_id
+                WHERE ro.session_id = r.session_id
+                  AND o.survey_id = rs.survey_id
+                  AND (ro.id < r.id OR (ro.id = r.id AND o.id < rs.id))
+            )
+        )
+        """
+    )
+
+    for table in CHILD_TABLES:
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET respondent_id = {_keeper_of(f'{table}.respondent_id')}
+            WHERE respondent_id IN ({DUPLICATES})
+            """
+        )
+
+    # Self references of merged respondents (column name differs by schema age)
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('respondents')}
+    for column in ('merged_into_id', 'merged_from_id'):
+        if column in columns:
+            op.execute(
+                f"""
+                UPDATE respondents
+                SET {column} = {_keeper_of(f'respondents.{column}')}
+                WHERE {column} IN ({DUPLICATES})
+                """
+            )
+
+    op.execute(f'DELETE FROM respondents WHERE id IN ({DUPLICATES})')
+
+    op.drop_index('ix_respondents_session_id', table_name='respondents')
+    op.create_index(
+        'uq_respondents_session_id', 'respondents', ['session_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    # Merged respondents are not restored
+    op.drop_index('uq_respondents_session_id', table_name='respondents')
+    op.create_index(
+        'ix_respondents_session_id', 'respondents', ['session_id'], unique=False
+    )
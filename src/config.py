@@ -5,7 +5,7 @@ This module contains all application settings using Pydantic Settings
 for environment variable validation and type safety.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -30,6 +30,153 @@ class Settings(BaseSettings):
     database_echo: bool = Field(
         default=False, description="Enable SQLAlchemy query logging"
     )
+    read_database_url: Optional[str] = Field(
+        default=None,
+        description="Read replica URL for analytics queries (primary if unset)",
+    )
+
+    # Database connection pool
+    database_pool_size: int = Field(
+        default=5, ge=1, description="Number of persistent pooled connections"
+    )
+    database_max_overflow: int = Field(
+        default=10, ge=0, description="Connections allowed above the pool size"
+    )
+    database_pool_timeout: float = Field(
+        default=30.0, gt=0, description="Seconds to wait for a pooled connection"
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="Recycle connections older than N seconds (-1 disables)",
+    )
+    database_pool_pre_ping: bool = Field(
+        default=True, description="Test connections for liveness on checkout"
+    )
+    database_connect_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds to wait when opening a connection"
+    )
+
+    # SQLite performance profile (per-connection PRAGMAs)
+    sqlite_performance_profile: bool = Field(
+        default=True, description="Apply SQLite performance PRAGMAs on connect"
+    )
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = (
+        Field(default="WAL", description="SQLite journal mode")
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL", description="SQLite synchronous level"
+    )
+    sqlite_mmap_size: int = Field(
+        default=268435456, ge=0, description="SQLite memory-mapped I/O size in bytes"
+    )
+    sqlite_cache_size: int = Field(
+        default=-64000,
+        description="SQLite page cache size (negative value is KiB, positive is pages)",
+    )
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY", description="SQLite temporary storage location"
+    )
+    sqlite_busy_timeout: int = Field(
+        default=5000, ge=0, description="SQLite busy timeout in milliseconds"
+    )
+
+    # SQLite single-writer queue
+    sqlite_write_queue: bool = Field(
+        default=False,
+        description="Serialize SQLite writers through one queue with group commit",
+    )
+    sqlite_write_queue_max_batch: int = Field(
+        default=100, ge=1, description="Maximum transactions per group commit"
+    )
+    sqlite_write_queue_max_delay_ms: float = Field(
+        default=0.0, ge=0, description="Extra wait for more writers before committing"
+    )
+
+    # SQL query tracking
+    query_tracking_enabled: bool = Field(
+        default=True, description="Count SQL queries and DB time per request"
+    )
+    query_repeat_threshold: int = Field(
+        default=10,
+        ge=1,
+        description="Warn when one statement runs more times than this per request",
+    )
+
+    # Slow query log
+    slow_query_log_enabled: bool = Field(
+        default=True, description="Record SQL statements slower than the threshold"
+    )
+    slow_query_threshold_ms: float = Field(
+        default=200.0, ge=0, description="Slow query threshold in milliseconds"
+    )
+    slow_query_log_size: int = Field(
+        default=100, ge=1, description="Maximum number of slow queries kept"
+    )
+    slow_query_explain: bool = Field(
+        default=True, description="Capture EXPLAIN QUERY PLAN for slow queries"
+    )
+
+    # Answer context cache (question + survey fields used by response submits)
+    answer_context_cache_size: int = Field(
+        default=10000, ge=1, description="Maximum number of cached questions"
+    )
+    answer_context_cache_ttl: float = Field(
+        default=30.0, ge=0, description="Answer context lifetime in seconds, 0 disables"
+    )
+
+    # Session -> respondent resolver cache
+    respondent_cache_size: int = Field(
+        default=10000, ge=1, description="Maximum number of cached sessions"
+    )
+    respondent_cache_redis: bool = Field(
+        default=False, description="Share session -> respondent ids through Redis"
+    )
+    respondent_cache_redis_ttl: int = Field(
+        default=86400, ge=1, description="Redis session -> respondent TTL in seconds"
+    )
+
+    # Write-behind ingestion buffer for responses and respondent events
+    ingestion_buffer_enabled: bool = Field(
+        default=False, description="Group-commit buffered inserts in the background"
+    )
+    ingestion_buffer_max_rows: int = Field(
+        default=10000, ge=1, description="Queued rows before requests get 503"
+    )
+    ingestion_buffer_flush_rows: int = Field(
+        default=500, ge=1, description="Flush when this many rows are queued"
+    )
+    ingestion_buffer_flush_interval_ms: float = Field(
+        default=50.0, gt=0, description="Flush queued rows at least this often"
+    )
+    ingestion_buffer_flush_retries: int = Field(
+        default=3, ge=0, description="Failed flush attempts before new rows get 503"
+    )
+    ingestion_buffer_retry_backoff_ms: float = Field(
+        default=100.0, ge=0, description="Delay before the first flush retry"
+    )
+
+    # Two-tier cache (in-process LRU in front of Redis)
+    tiered_cache_local_size: int = Field(
+        default=10000, ge=1, description="Maximum number of in-process entries"
+    )
+    tiered_cache_local_ttl: float = Field(
+        default=5.0, ge=0, description="In-process entry lifetime in seconds"
+    )
+    tiered_cache_stale_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        description="Serve expired entries this long while refreshing, 0 disables",
+    )
+    tiered_cache_lock_ttl: float = Field(
+        default=5.0, gt=0, description="Cross-worker rebuild lock lifetime in seconds"
+    )
+    tiered_cache_channel: str = Field(
+        default="cache:invalidate", description="Redis pub/sub invalidation channel"
+    )
+    # orjson and msgpack need the "cache" extra
+    cache_codec: Literal["json", "orjson", "msgpack"] = Field(
+        default="json", description="Codec of binary cache values"
+    )
 
     # FastAPI
     api_prefix: str = Field(default="/api", description="API prefix")
@@ -98,6 +245,15 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=60, description="Rate limit per minute")
     rate_limit_per_hour: int = Field(default=1000, description="Rate limit per hour")
+    rate_limit_algorithm: Literal["fixed_window", "sliding_window"] = Field(
+        default="sliding_window", description="Endpoint rate limiter algorithm"
+    )
+    email_batch_rate_limit_per_minute: int = Field(
+        default=10, ge=1, description="Batch email validations per client per minute"
+    )
+    broadcast_rate_limit_per_minute: int = Field(
+        default=5, ge=1, description="Notification broadcasts per client per minute"
+    )
 
     # Push Notifications (VAPID)
     VAPID_PRIVATE_KEY: str = Field(
@@ -5,15 +5,34 @@ This module sets up SQLAlchemy with declarative base and provides
 database session management for the application.
 """
 
+import asyncio
+from bisect import bisect_left
+from collections import deque
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from datetime import datetime
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Optional
 
-from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import greenlet
+from sqlalchemy import MetaData, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.sql.functions import now
+from sqlalchemy.util import await_only
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create metadata with naming convention for better constraint names
 metadata = MetaData(
     naming_convention={
@@ -33,16 +52,412 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+class PoolMetrics:
+    """
+    Connection pool statistics.
+
+    Counts checkouts and timeouts and keeps a cumulative histogram of the
+    time spent waiting for a connection, so workers can be sized against
+    the database instead of guessed.
+    """
+
+    # Upper bounds (ms) of the wait time histogram buckets
+    WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all collected statistics."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_time_total_ms = 0.0
+            self.wait_time_max_ms = 0.0
+            # One slot per bucket plus the +Inf overflow slot
+            self._wait_buckets = [0] * (len(self.WAIT_BUCKETS_MS) + 1)
+
+    def observe_wait(self, wait_ms: float, *, timed_out: bool = False) -> None:
+        """
+        Record a single connection acquisition.
+
+        Args:
+            wait_ms: Time spent waiting for the connection in milliseconds
+            timed_out: Whether the acquisition failed with a pool timeout
+        """
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_time_total_ms += wait_ms
+            self.wait_time_max_ms = max(self.wait_time_max_ms, wait_ms)
+            self._wait_buckets[bisect_left(self.WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def wait_histogram(self) -> dict[str, int]:
+        """
+        Get the cumulative wait time histogram.
+
+        Returns:
+            Mapping of bucket upper bound ("le" in ms, "+Inf" last) to count
+        """
+        with self._lock:
+            histogram = {}
+            running = 0
+            for bound, count in zip(self.WAIT_BUCKETS_MS, self._wait_buckets):
+                running += count
+                histogram[str(bound)] = running
+            histogram["+Inf"] = running + self._wait_buckets[-1]
+            return histogram
+
+    def snapshot(self, pool: Any = None) -> dict[str, Any]:
+        """
+        Get current pool state together with the collected statistics.
+
+        Args:
+            pool: SQLAlchemy pool to read live state from
+
+        Returns:
+            Dictionary with pool metrics
+        """
+        acquisitions = self.checkouts + self.timeouts
+        data: dict[str, Any] = {
+            "pool_class": type(pool).__name__ if pool is not None else None,
+            "checkouts_total": self.checkouts,
+            "timeouts_total": self.timeouts,
+            "wait_time_avg_ms": (
+                round(self.wait_time_total_ms / acquisitions, 3)
+                if acquisitions
+                else 0.0
+            ),
+            "wait_time_max_ms": round(self.wait_time_max_ms, 3),
+            "wait_time_histogram_ms": self.wait_histogram(),
+        }
+
+        # StaticPool/NullPool do not track sizing, only queue pools do
+        def _read(name: str) -> Any:
+            getter = getattr(pool, name, None)
+            return getter() if callable(getter) else None
+
+        data.update(
+            pool_size=_read("size"),
+            checked_in=_read("checkedin"),
+            checked_out=_read("checkedout"),
+            overflow=_read("overflow"),
+        )
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+read_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that reports acquisition wait times to pool_metrics."""
+
+    metrics = pool_metrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.observe_wait(
+                (time.perf_counter() - start) * 1000, timed_out=True
+            )
+            raise
+        self.metrics.observe_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+
+class InstrumentedReadAsyncAdaptedQueuePool(InstrumentedAsyncAdaptedQueuePool):
+    """Queue pool of the read replica engine, reporting to read_pool_metrics."""
+
+    metrics = read_pool_metrics
+
+
+def _is_memory_sqlite(database_url: str) -> bool:
+    """Check whether URL points to an in-memory SQLite database."""
+    return "sqlite" in database_url and (
+        ":memory:" in database_url or database_url.rstrip("/").endswith(":")
+    )
+
+
+def build_engine_options(
+    database_url: str,
+    poolclass: type[AsyncAdaptedQueuePool] = InstrumentedAsyncAdaptedQueuePool,
+) -> dict[str, Any]:
+    """
+    Build create_async_engine keyword arguments from settings.
+
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool,
+    every other database gets a sized, instrumented queue pool.
+
+    Args:
+        database_url: Database connection URL
+        poolclass: Queue pool class used for non in-memory databases
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    connect_args: dict[str, Any] = {"timeout": settings.database_connect_timeout}
+    if "sqlite" in database_url:
+        connect_args["check_same_thread"] = False
+
+    options: dict[str, Any] = {
+        "echo": settings.database_echo,
+        "future": True,
+        "connect_args": connect_args,
+    }
+
+    if not _is_memory_sqlite(database_url):
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+            pool_pre_ping=settings.database_pool_pre_ping,
+        )
+
+    return options
+
+
+def get_sqlite_pragmas() -> dict[str, Any]:
+    """
+    Get the SQLite performance profile configured in settings.
+
+    WAL lets readers proceed while a writer commits, NORMAL synchronous
+    is durable in WAL mode without an fsync per transaction, and the
+    cache/mmap/temp_store settings keep hot pages in memory.
+
+    Returns:
+        Mapping of PRAGMA name to value, in the order they are applied
+    """
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.sqlite_busy_timeout,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+    }
+
+
+def install_sqlite_pragmas(
+    async_engine: AsyncEngine, pragmas: Optional[dict[str, Any]] = None
+) -> None:
+    """
+    Apply PRAGMAs to every new connection of a SQLite engine.
+
+    Args:
+        async_engine: Engine to install the connect listener on
+        pragmas: PRAGMAs to apply, defaults to the settings profile
+    """
+    statements = [
+        f"PRAGMA {name}={value}"
+        for name, value in (pragmas or get_sqlite_pragmas()).items()
+    ]
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+@compiles(now, "sqlite")
+def _sqlite_now(element, compiler, **kw) -> str:
+    """
+    Render func.now() on SQLite as UTC text with microseconds.
+
+    SQLite stores DateTime as text and CURRENT_TIMESTAMP drops fractional
+    seconds, while values bound from Python always carry six digits. Mixed
+    forms of one instant sort apart, so ``(created_at, id)`` keyset pages
+    would repeat rows. strftime('%f') gives milliseconds, padded here to
+    the microsecond form SQLAlchemy writes.
+    """
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+
+
+class SlowQueryLog:
+    """
+    Bounded in-memory log of slow SQL statements.
+
+    Statements slower than the threshold are stored with redacted
+    parameters, the application frame that issued them and, on SQLite,
+    their EXPLAIN QUERY PLAN output.
+    """
+
+    # Statement prefixes EXPLAIN QUERY PLAN can describe
+    EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+    # Caller frames are searched for within the application sources
+    _THIS_FILE = os.path.abspath(__file__)
+    _APP_ROOT = os.path.dirname(_THIS_FILE)
+
+    def __init__(
+        self, threshold_ms: float, max_entries: int = 100, explain: bool = True
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def redact(value: Any) -> Any:
+        """
+        Redact a bound parameter value.
+
+        Numbers, booleans and NULL are kept since they are rarely sensitive
+        and help reproduce the plan; everything else is reduced to its type
+        and length.
+        """
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, (str, bytes)):
+            return f"<{type(value).__name__} len={len(value)}>"
+        return f"<{type(value).__name__}>"
+
+    def _redact_parameters(self, parameters: Any, executemany: bool) -> Any:
+        if executemany:
+            return {"executemany_rows": len(parameters)}
+        if isinstance(parameters, dict):
+            return {key: self.redact(value) for key, value in parameters.items()}
+        return [self.redact(value) for value in parameters or ()]
+
+    def _caller(self) -> Optional[str]:
+        """
+        Find the innermost application frame outside this module.
+
+        Async statements run inside a greenlet spawned by SQLAlchemy, the
+        awaiting application code lives in the parent greenlet's stack.
+        """
+        frames = [sys._getframe(1)]
+        parent = greenlet.getcurrent().parent
+        if parent is not None:
+            frames.append(parent.gr_frame)
+
+        for frame in frames:
+            while frame is not None:
+                filename = os.path.abspath(frame.f_code.co_filename)
+                if filename.startswith(self._APP_ROOT) and filename != self._THIS_FILE:
+                    relative = os.path.relpath(filename, self._APP_ROOT)
+                    return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+                frame = frame.f_back
+        return None
+
+    def _explain(
+        self, conn: Any, statement: str, parameters: Any, executemany: bool
+    ) -> Optional[list[str]]:
+        if (
+            not self.explain
+            or executemany
+            or conn.dialect.name != "sqlite"
+            or not statement.lstrip().upper().startswith(self.EXPLAINABLE)
+        ):
+            return None
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            # Rows are (id, parent, notused, detail)
+            return [row[-1] for row in cursor.fetchall()]
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+        finally:
+            cursor.close()
+
+    def record(
+        self,
+        conn: Any,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        duration_ms: float,
+    ) -> None:
+        """Store a statement that exceeded the threshold."""
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "statement": " ".join(statement.split()),
+            "parameters": self._redact_parameters(parameters, executemany),
+            "caller": self._caller(),
+            "plan": self._explain(conn, statement, parameters, executemany),
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+        logger.warning(
+            f"Slow query ({entry['duration_ms']}ms) from {entry['caller']}: "
+            f"{entry['statement'][:200]}"
+        )
+
+    def install(self, async_engine: AsyncEngine) -> None:
+        """
+        Register cursor listeners that time statements on the engine.
+
+        Args:
+            async_engine: Engine to watch
+        """
+
+        @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+        def _start_timer(conn, cursor, statement, parameters, context, executemany):
+            context._slow_query_start = time.perf_counter()
+
+        @event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+        def _check_duration(conn, cursor, statement, parameters, context, executemany):
+            start = getattr(context, "_slow_query_start", None)
+            if start is None:
+                return
+            duration_ms = (time.perf_counter() - start) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.record(conn, statement, parameters, executemany, duration_ms)
+
+    def entries(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Get recorded slow queries, newest first.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of slow query entries
+        """
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        """Drop all recorded entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_query_threshold_ms,
+    max_entries=settings.slow_query_log_size,
+    explain=settings.slow_query_explain,
+)
+
+
 # Create async engine
 engine = create_async_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    future=True,
-    connect_args={"check_same_thread": False}
-    if "sqlite" in settings.database_url
-    else {},
+    settings.database_url, **build_engine_options(settings.database_url)
 )
 
+if "sqlite" in settings.database_url and settings.sqlite_performance_profile:
+    install_sqlite_pragmas(engine)
+
+if settings.slow_query_log_enabled:
+    slow_query_log.install(engine)
+
 # Create async session maker
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -53,6 +468,85 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
+def make_read_only_url(database_url: str) -> str:
+    """
+    Open a file-based SQLite database in read-only mode.
+
+    Other databases are returned unchanged, read-only access there is a
+    matter of replica configuration and database grants.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        URL that opens the database read-only where supported
+    """
+    if "sqlite" not in database_url or _is_memory_sqlite(database_url):
+        return database_url
+
+    url = make_url(database_url)
+    if url.database and url.database.startswith("file:"):
+        return database_url
+
+    query = dict(url.query)
+    query.update(mode="ro", uri="true")
+    return url.set(database=f"file:{url.database}", query=query).render_as_string(
+        hide_password=False
+    )
+
+
+def get_sqlite_read_pragmas() -> dict[str, Any]:
+    """
+    Get PRAGMAs for read replica connections.
+
+    journal_mode and synchronous only matter for writers, query_only
+    rejects accidental writes even if the file itself is writable.
+
+    Returns:
+        Mapping of PRAGMA name to value
+    """
+    pragmas = {
+        name: value
+        for name, value in get_sqlite_pragmas().items()
+        if name not in ("journal_mode", "synchronous")
+    }
+    pragmas["query_only"] = "ON"
+    return pragmas
+
+
+# Optional read replica engine for analytics and reports
+read_engine: Optional[AsyncEngine] = None
+
+if settings.read_database_url:
+    read_engine = create_async_engine(
+        make_read_only_url(settings.read_database_url),
+        **build_engine_options(
+            settings.read_database_url,
+            poolclass=InstrumentedReadAsyncAdaptedQueuePool,
+        ),
+    )
+    if "sqlite" in settings.read_database_url:
+        install_sqlite_pragmas(
+            read_engine,
+            (
+                get_sqlite_read_pragmas()
+                if settings.sqlite_performance_profile
+                else {"query_only": "ON"}
+            ),
+        )
+    if settings.slow_query_log_enabled:
+        slow_query_log.install(read_engine)
+
+# Read sessions fall back to the primary when no replica is configured
+AsyncReadSessionLocal = sessionmaker(
+    bind=read_engine or engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
 async def create_db_and_tables() -> None:
     """Create database tables."""
     async with engine.begin() as conn:
@@ -76,6 +570,23 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async read-only database session.
+
+    Bound to the read replica when read_database_url is set, otherwise to
+    the primary database. Use it only for queries that tolerate replica lag.
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -95,8 +606,451 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Statements that need the SQLite write lock
+_WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+# Connection info key of the write turn held by a guarded connection
+_WRITE_TURN_KEY = "sqlite_write_turn"
+
+
+class _WriteJob:
+    """
+    A single caller waiting for its turn on the writer connection.
+
+    External jobs are transactions of a guarded engine: they get the turn
+    without the writer connection and write on their own connection.
+    """
+
+    __slots__ = ("turn", "done", "committed", "external")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, external: bool = False):
+        self.turn: asyncio.Future = loop.create_future()
+        self.done: asyncio.Future = loop.create_future()
+        self.committed: asyncio.Future = loop.create_future()
+        self.external = external
+
+
+def _is_write(statement: str, context: Any) -> bool:
+    if context is not None and (
+        context.isinsert or context.isupdate or context.isdelete
+    ):
+        return True
+    return statement.lstrip()[:7].upper().startswith(_WRITE_STATEMENTS)
+
+
+class SQLiteWriteQueue:
+    """
+    Single-writer queue for SQLite.
+
+    All write transactions are funneled through one dedicated connection.
+    Callers take turns on that connection, each inside its own SAVEPOINT,
+    and every batch of callers that queued up while the previous batch was
+    running is committed with a single COMMIT (group commit). Readers keep
+    using the regular pool and are never blocked by writers fighting for
+    the file lock.
+
+    Repository code works unchanged: a session handed out by the queue
+    joins the writer transaction with join_transaction_mode
+    "create_savepoint", so its commit() only releases the savepoint and
+    rollback() only undoes that caller's work.
+
+    Request sessions of the main engine write on their own connections:
+    ``guard_engine`` makes each of them take a turn on the queue before
+    its first write and hold it until its transaction ends, so they wait
+    in line instead of busy-looping on the file lock.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        max_batch: int = 100,
+        max_delay_ms: float = 0.0,
+        turn_timeout_ms: float = 5000.0,
+    ):
+        """
+        Initialize the write queue.
+
+        Args:
+            database_url: SQLite database URL
+            max_batch: Maximum number of transactions per group commit
+            max_delay_ms: Extra time to wait for more writers before a batch
+            turn_timeout_ms: Longest wait of a guarded connection for its turn
+        """
+        self.database_url = database_url
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.turn_timeout = turn_timeout_ms / 1000
+        self._engine: Optional[AsyncEngine] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._stats = {
+            "transactions": 0,
+            "failed_transactions": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "max_batch_size": 0,
+            "guarded_transactions": 0,
+            "guard_timeouts": 0,
+        }
+
+    def _create_engine(self) -> AsyncEngine:
+        options = build_engine_options(self.database_url)
+        if "poolclass" in options:
+            options.update(pool_size=1, max_overflow=0)
+        writer_engine = create_async_engine(self.database_url, **options)
+
+        if settings.sqlite_performance_profile:
+            install_sqlite_pragmas(writer_engine)
+
+        # Let SQLAlchemy, not the sqlite3 driver, control transactions so that
+        # SAVEPOINTs work, and take the write lock up front with IMMEDIATE
+        @event.listens_for(writer_engine.sync_engine, "connect")
+        def _disable_driver_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(writer_engine.sync_engine, "begin")
+        def _begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        return writer_engine
+
+    @property
+    def running(self) -> bool:
+        """Check whether the writer task is running."""
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        """Start the writer task (called lazily on first use)."""
+        if self.running:
+            return
+        if self._engine is None:
+            self._engine = self._create_engine()
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run(), name="sqlite-write-queue")
+
+    async def stop(self) -> None:
+        """Finish queued transactions, stop the writer and close its connection."""
+        if self.running:
+            await self._queue.put(None)
+            await self._worker
+        self._worker = None
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Run a write transaction on the writer connection.
+
+        The block runs when it is this caller's turn; on normal exit the
+        work is committed together with the rest of the batch before the
+        context manager returns.
+
+        Yields:
+            AsyncSession: Session bound to the writer transaction
+        """
+        if not self.running:
+            await self.start()
+
+        job = _WriteJob(asyncio.get_running_loop())
+        await self._queue.put(job)
+
+        try:
+            session: AsyncSession = await job.turn
+        except asyncio.CancelledError:
+            if job.turn.done() and not job.turn.cancelled():
+                # Turn was granted just as we got cancelled, hand it back
+                await job.turn.result().close()
+                job.done.set_result(False)
+            raise
+
+        succeeded = False
+        try:
+            yield session
+            await session.commit()
+            succeeded = True
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+            job.done.set_result(succeeded)
+
+        await job.committed
+
+    def guard_engine(self, guarded_engine: AsyncEngine) -> None:
+        """
+        Serialize the write transactions of another engine with the queue.
+
+        A connection of ``guarded_engine`` takes a turn before its first
+        INSERT, UPDATE or DELETE and keeps it until the connection goes
+        back to the pool, that is until its transaction has ended.
+
+        Args:
+            guarded_engine: Engine of the same SQLite database
+        """
+        sync_engine = guarded_engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _take_turn(conn, cursor, statement, parameters, context, executemany):
+            if _WRITE_TURN_KEY not in conn.info and _is_write(statement, context):
+                conn.info[_WRITE_TURN_KEY] = await_only(self._acquire())
+
+        @event.listens_for(sync_engine, "checkin")
+        def _release_on_checkin(dbapi_connection, connection_record):
+            self._release(connection_record.info.pop(_WRITE_TURN_KEY, None))
+
+        @event.listens_for(sync_engine, "invalidate")
+        def _release_on_invalidate(dbapi_connection, connection_record, exception):
+            self._release(connection_record.info.pop(_WRITE_TURN_KEY, None))
+
+    async def _acquire(self) -> _WriteJob:
+        """Wait for a turn of a guarded connection."""
+        if not self.running:
+            await self.start()
+
+        job = _WriteJob(asyncio.get_running_loop(), external=True)
+        await self._queue.put(job)
+        try:
+            # A writer waiting on the queue it holds would never get a turn
+            await asyncio.wait_for(job.turn, self.turn_timeout)
+        except asyncio.TimeoutError:
+            self._stats["guard_timeouts"] += 1
+            raise PoolTimeoutError(
+                f"No SQLite write turn within {self.turn_timeout:.1f}s"
+            ) from None
+        except asyncio.CancelledError:
+            if job.turn.done() and not job.turn.cancelled():
+                job.done.set_result(False)
+            raise
+        return job
+
+    @staticmethod
+    def _release(job: Optional[_WriteJob]) -> None:
+        """Hand the turn of a guarded connection back to the writer loop."""
+        if job is None:
+            return
+
+        def finish() -> None:
+            if not job.done.done():
+                job.done.set_result(True)
+
+        try:
+            # Pool events may run outside the event loop thread
+            job.done.get_loop().call_soon_threadsafe(finish)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    async def _run(self) -> None:
+        """Writer loop: take a batch of callers and group-commit it."""
+        self._stopping = False
+        job = None
+        try:
+            async with self._engine.connect() as conn:
+                while not self._stopping:
+                    if job is None:
+                        job = await self._queue.get()
+                        if job is None:
+                            break
+
+                    if job.external:
+                        await self._run_external(job)
+                        job = None
+                        continue
+
+                    await conn.begin()
+                    batch = []
+                    # A guarded connection waits until this batch is committed
+                    while job is not None and not job.external:
+                        if await self._run_job(conn, job):
+                            batch.append(job)
+                        if len(batch) >= self.max_batch:
+                            job = None
+                            break
+                        job = await self._next_job()
+
+                    await self._commit_batch(conn, batch)
+        except Exception as exc:
+            logger.error(f"SQLite write queue stopped unexpectedly: {exc}")
+            self._fail_pending(exc)
+            raise
+        self._fail_pending(RuntimeError("SQLite write queue is stopped"))
+
+    async def _next_job(self) -> Optional[_WriteJob]:
+        """Get the next queued caller without blocking past max_delay."""
+        try:
+            if self.max_delay > 0:
+                job = await asyncio.wait_for(self._queue.get(), self.max_delay)
+            else:
+                job = self._queue.get_nowait()
+        except (asyncio.QueueEmpty, asyncio.TimeoutError):
+            return None
+
+        if job is None:
+            # Stop requested: finish the current batch, then exit
+            self._stopping = True
+        return job
+
+    async def _run_job(self, conn: Any, job: _WriteJob) -> bool:
+        """Give a caller the writer connection and wait until it is done."""
+        if job.turn.done():
+            # Caller was cancelled while waiting in the queue
+            return False
+
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        job.turn.set_result(session)
+
+        await asyncio.wait([job.done])
+        if job.done.result():
+            self._stats["transactions"] += 1
+            return True
+
+        self._stats["failed_transactions"] += 1
+        return False
+
+    async def _run_external(self, job: _WriteJob) -> None:
+        """Let a guarded connection write and wait until its transaction ends."""
+        if job.turn.done():
+            # Gave up waiting in the queue
+            return
+        job.turn.set_result(None)
+        await asyncio.wait([job.done])
+        self._stats["guarded_transactions"] += 1
+
+    async def _commit_batch(self, conn: Any, jobs: list[_WriteJob]) -> None:
+        """Commit the writer transaction and notify every caller in the batch."""
+        try:
+            await conn.commit()
+        except Exception as exc:
+            logger.error(f"SQLite write queue group commit failed: {exc}")
+            self._stats["failed_batches"] += 1
+            try:
+                await conn.rollback()
+            except Exception as rollback_exc:
+                logger.error(f"SQLite write queue rollback failed: {rollback_exc}")
+            for job in jobs:
+                job.committed.set_exception(exc)
+            return
+
+        self._stats["batches"] += 1
+        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(jobs))
+        for job in jobs:
+            job.committed.set_result(None)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Reject callers still waiting in the queue."""
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job is not None and not job.turn.done():
+                job.turn.set_exception(exc)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get write queue statistics.
+
+        Returns:
+            Dictionary with transaction, batch and queue depth counters
+        """
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "avg_batch_size": (
+                round(self._stats["transactions"] / batches, 2) if batches else 0.0
+            ),
+        }
+
+
+# Optional single-writer queue (SQLite only)
+write_queue: Optional[SQLiteWriteQueue] = (
+    SQLiteWriteQueue(
+        settings.database_url,
+        max_batch=settings.sqlite_write_queue_max_batch,
+        max_delay_ms=settings.sqlite_write_queue_max_delay_ms,
+        turn_timeout_ms=settings.sqlite_busy_timeout,
+    )
+    if "sqlite" in settings.database_url
+    and not _is_memory_sqlite(settings.database_url)
+    and settings.sqlite_write_queue
+    else None
+)
+
+if write_queue is not None:
+    # Request sessions (responses, respondent events, consent logs) write
+    # through the main engine and wait for their turn like queued writers
+    write_queue.guard_engine(engine)
+
+
+@asynccontextmanager
+async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Context manager for a write transaction.
+
+    Routed through the single-writer queue when it is enabled, otherwise
+    behaves exactly like get_db_session. Sessions of get_db_session and
+    get_async_session are serialized with the queue as well, but keep
+    their own connection and commit.
+
+    Yields:
+        AsyncSession: Database session for writes
+    """
+    if write_queue is None:
+        async with get_db_session() as session:
+            yield session
+        return
+
+    async with write_queue.transaction() as session:
+        yield session
+
+
+def get_slow_queries(limit: Optional[int] = None) -> dict[str, Any]:
+    """
+    Get the slow query log.
+
+    Args:
+        limit: Maximum number of entries to return
+
+    Returns:
+        Dictionary with log settings and entries, newest first
+    """
+    return {
+        "enabled": settings.slow_query_log_enabled,
+        "threshold_ms": slow_query_log.threshold_ms,
+        "entries": slow_query_log.entries(limit),
+    }
+
+
+def get_pool_metrics() -> dict[str, Any]:
+    """
+    Get live connection pool metrics for the main and read replica engines.
+
+    Returns:
+        Dictionary with pool state and acquisition statistics
+    """
+    metrics = pool_metrics.snapshot(engine.pool)
+    metrics["write_queue"] = write_queue.stats() if write_queue else None
+    metrics["read_replica"] = (
+        read_pool_metrics.snapshot(read_engine.pool) if read_engine else None
+    )
+    return metrics
+
+
 async def close_db_connection() -> None:
     """Close database connection."""
+    if write_queue is not None:
+        await write_queue.stop()
+    if read_engine is not None:
+        await read_engine.dispose()
     await engine.dispose()
 
 
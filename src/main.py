@@ -18,8 +18,15 @@ from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 
 from config import settings
-from database import close_db_connection, create_db_and_tables
-from middleware import get_ip_whitelist_middleware, get_telegram_middleware
+from database import close_db_connection, create_db_and_tables, engine, read_engine
+from middleware import (
+    get_ip_whitelist_middleware,
+    get_query_counter_middleware,
+    get_telegram_middleware,
+    install_query_tracking,
+)
+from services.ingestion_buffer import ingestion_buffer
+from services.survey_snapshot import survey_snapshot_cache
 
 # Configure logging
 logging.basicConfig(
@@ -55,6 +62,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Failed to initialize Telegram service: {e}")
 
+    # Follow cache invalidations of other workers
+    try:
+        await survey_snapshot_cache.cache.start()
+    except Exception as e:
+        logger.error(f"Failed to subscribe to cache invalidations: {e}")
+
+    # Start write-behind ingestion buffer
+    if ingestion_buffer is not None:
+        await ingestion_buffer.start()
+        logger.info("Ingestion buffer started")
+
     yield
 
     # Shutdown
@@ -68,6 +86,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Error stopping Telegram service: {e}")
 
+    await survey_snapshot_cache.cache.stop()
+
+    # Flush queued rows while the database is still available
+    if ingestion_buffer is not None:
+        try:
+            await ingestion_buffer.stop()
+            logger.info("Ingestion buffer flushed and stopped")
+        except Exception as e:
+            logger.error(f"Error flushing ingestion buffer: {e}")
+
     await close_db_connection()
     logger.info("Database connection closed")
 
@@ -98,6 +126,13 @@ app.add_middleware(telegram_middleware)
 ip_whitelist_middleware = get_ip_whitelist_middleware()
 app.add_middleware(ip_whitelist_middleware)
 
+# Add per-request SQL query counter
+if settings.query_tracking_enabled:
+    install_query_tracking(engine)
+    if read_engine is not None:
+        install_query_tracking(read_engine)
+    app.add_middleware(get_query_counter_middleware())
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -4,6 +4,14 @@ Middleware package for Quiz App.
 This package contains middleware for security, logging, and request processing.
 """
 
+from .query_stats import (
+    QueryCounterMiddleware,
+    QueryStats,
+    get_current_query_stats,
+    get_query_counter_middleware,
+    install_query_tracking,
+    track_queries,
+)
 from .telegram_middleware import (
     TelegramIPWhitelistMiddleware,
     TelegramRequestLogger,
@@ -22,4 +30,10 @@ __all__ = [
     "get_ip_whitelist_middleware",
     "get_request_logger",
     "limiter",
+    "QueryCounterMiddleware",
+    "QueryStats",
+    "get_current_query_stats",
+    "get_query_counter_middleware",
+    "install_query_tracking",
+    "track_queries",
 ]
@@ -0,0 +1,186 @@
+"""
+SQL query instrumentation for Quiz App.
+
+This module counts SQL statements and database time per HTTP request using
+SQLAlchemy cursor events, exposes them as response headers and flags
+statements that repeat suspiciously often within one request (N+1).
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import time
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+# Stats key of requests matching no route, so scanned URLs share one entry
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class QueryStats:
+    """SQL statistics collected for a single unit of work (usually a request)."""
+
+    def __init__(self):
+        self.count = 0
+        self.time_ms = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        """
+        Record one executed statement.
+
+        Args:
+            statement: SQL text with bound parameter placeholders
+            duration_ms: Execution time in milliseconds
+        """
+        self.count += 1
+        self.time_ms += duration_ms
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Get statements executed more than threshold times.
+
+        Args:
+            threshold: Maximum allowed executions of the same statement
+
+        Returns:
+            List of (statement, count), most repeated first
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    """Get statistics of the unit of work being tracked, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect SQL statistics for the enclosed block.
+
+    Works for HTTP requests, background jobs and tests alike; queries
+    run by tasks spawned inside the block are attributed to it as well.
+
+    Yields:
+        QueryStats: Statistics being collected
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def install_query_tracking(async_engine: AsyncEngine) -> None:
+    """
+    Register cursor listeners that feed the current QueryStats.
+
+    Args:
+        async_engine: Engine to instrument
+    """
+    sync_engine = async_engine.sync_engine
+    if getattr(sync_engine, "_query_tracking_installed", False):
+        return
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        context._query_tracking_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        stats = _current_stats.get()
+        start = getattr(context, "_query_tracking_start", None)
+        if stats is not None and start is not None:
+            stats.record(statement, (time.perf_counter() - start) * 1000)
+
+    sync_engine._query_tracking_installed = True
+
+
+def report_query_stats(
+    stats: QueryStats, operation: str, threshold: Optional[int] = None
+) -> list[tuple[str, int]]:
+    """
+    Log N+1 suspects and forward statistics to the monitoring service.
+
+    Args:
+        stats: Collected statistics
+        operation: Name of the tracked operation (e.g. "GET /surveys/active")
+        threshold: Repetition threshold, defaults to settings
+
+    Returns:
+        Statements that exceeded the threshold
+    """
+    threshold = threshold or settings.query_repeat_threshold
+    repeated = stats.repeated(threshold)
+    for statement, count in repeated:
+        logger.warning(
+            f"Possible N+1 in {operation}: statement executed {count} times "
+            f"(threshold {threshold}): {' '.join(statement.split())}"
+        )
+
+    try:
+        from services.monitoring_service import get_monitoring_service
+
+        get_monitoring_service().record_query_stats(
+            operation, stats.count, stats.time_ms, n_plus_one=bool(repeated)
+        )
+    except Exception as e:
+        logger.error(f"Error recording query stats: {e}")
+
+    return repeated
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware exposing per-request SQL query count and database time.
+
+    Adds X-DB-Query-Count and X-DB-Query-Time-Ms headers to every response
+    and warns when one statement repeats more than the configured threshold.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        """Track queries executed while handling the request."""
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        route = request.scope.get("route")
+        path = getattr(route, "path", UNMATCHED_ROUTE)
+        report_query_stats(stats, f"{request.method} {path}")
+
+        response.headers[QUERY_COUNT_HEADER] = str(stats.count)
+        response.headers[QUERY_TIME_HEADER] = f"{stats.time_ms:.2f}"
+        return response
+
+
+def get_query_counter_middleware():
+    """Get query counter middleware class."""
+    return QueryCounterMiddleware
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -45,7 +46,11 @@ class Question(Base):
 
     __tablename__ = "question"
 
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Questions of a survey in display order
+        Index("ix_question_survey_id_order", "survey_id", "order"),
+        {"extend_existing": True},
+    )
     id = Column(Integer, primary_key=True, index=True)
     survey_id = Column(Integer, ForeignKey("survey.id"), nullable=False)
 
@@ -6,10 +6,21 @@ for storing user responses to survey questions.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, func
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+    event,
+    func,
+    select,
+)
 from sqlalchemy.orm import relationship
 
 from database import Base
@@ -20,12 +31,36 @@ class Response(Base):
 
     __tablename__ = "response"
 
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Survey-scoped lookups: listings by date, sessions and users
+        Index("ix_response_survey_id_created_at", "survey_id", "created_at"),
+        Index("ix_response_survey_id_user_session_id", "survey_id", "user_session_id"),
+        Index("ix_response_survey_id_user_id", "survey_id", "user_id"),
+        # One answer per question and session; also serves per-question lookups
+        Index(
+            "uq_response_question_id_user_session_id",
+            "question_id",
+            "user_session_id",
+            unique=True,
+        ),
+        Index("uq_response_idempotency_key", "idempotency_key", unique=True),
+        # Per-session and per-user lookups
+        Index(
+            "ix_response_user_session_id_created_at", "user_session_id", "created_at"
+        ),
+        Index("ix_response_user_id_created_at", "user_id", "created_at"),
+        Index("ix_response_respondent_id", "respondent_id"),
+        {"extend_existing": True},
+    )
     id = Column(Integer, primary_key=True, index=True)
     question_id = Column(Integer, ForeignKey("question.id"), nullable=False)
+    # Denormalized from question.survey_id to avoid joins in survey queries
+    survey_id = Column(Integer, ForeignKey("survey.id"), nullable=True)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=True)
     user_session_id = Column(String(100), nullable=False)
     respondent_id = Column(Integer, ForeignKey("respondents.id"), nullable=True)
+    # Client-supplied Idempotency-Key of the request that created the response
+    idempotency_key = Column(String(255), nullable=True)
 
     # Response data
     answer = Column(JSON, nullable=False)
@@ -45,6 +80,20 @@ class Response(Base):
     respondent = relationship("Respondent", back_populates="responses")
 
 
+@event.listens_for(Response, "before_insert")
+def _fill_survey_id(mapper, connection, target):
+    """Take survey_id from the question when the caller did not set it."""
+    if target.survey_id is None:
+        from models.question import Question
+
+        # Resolved inside the INSERT itself, no extra round trip
+        target.survey_id = (
+            select(Question.survey_id)
+            .where(Question.id == target.question_id)
+            .scalar_subquery()
+        )
+
+
 # Pydantic schemas
 class ResponseBase(BaseModel):
     """Base Response schema with common fields."""
@@ -74,6 +123,7 @@ class ResponseRead(ResponseBase):
 
     id: int
     question_id: int
+    survey_id: Optional[int] = None
     user_id: Optional[int]
     user_session_id: str
     respondent_id: Optional[int]
@@ -90,6 +140,45 @@ class ResponseReadWithQuestion(ResponseRead):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ResponseBatchItem(ResponseBase):
+    """One answer of a batch submission."""
+
+    question_id: int = Field(description="ID of the question being answered")
+
+
+class ResponseBatchCreate(BaseModel):
+    """Schema for submitting all answers of a survey session at once."""
+
+    survey_id: int = Field(description="ID of the survey being answered")
+    user_session_id: str = Field(description="Session ID of the user")
+    user_id: Optional[int] = Field(None, description="ID of the user (if logged in)")
+    respondent_id: Optional[int] = Field(None, description="ID of the respondent")
+    answers: List[ResponseBatchItem] = Field(
+        min_length=1, max_length=500, description="Answers to save"
+    )
+
+
+class ResponseBatchItemResult(BaseModel):
+    """Outcome of one answer of a batch submission."""
+
+    question_id: int
+    status: Literal[
+        "created", "saved", "accepted", "duplicate", "invalid", "unknown_question"
+    ]
+    response_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class ResponseBatchResult(BaseModel):
+    """Schema for the result of a batch submission."""
+
+    survey_id: int
+    saved: int = Field(
+        description="Number of answers stored, or accepted for a buffered write"
+    )
+    results: List[ResponseBatchItemResult]
+
+
 class ResponseSummary(BaseModel):
     """Summary of responses for analytics."""
 
@@ -13,6 +13,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Index,
     Integer,
     String,
     Text,
@@ -29,7 +30,11 @@ class Survey(Base):
 
     __tablename__ = "survey"
 
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Public listings: filter by both flags, page by id
+        Index("ix_survey_is_active_is_public_id", "is_active", "is_public", "id"),
+        {"extend_existing": True},
+    )
     id = Column(Integer, primary_key=True, index=True)
 
     # Basic information
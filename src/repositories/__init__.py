@@ -4,7 +4,9 @@ Repository layer for the Quiz App.
 This module provides the repository layer for data access operations.
 """
 
+from .answer_context import AnswerContext
 from .base import BaseRepository
+from .loader import DataLoader
 from .user import UserRepository
 from .user_data import UserDataRepository
 from .survey import SurveyRepository
@@ -19,7 +21,9 @@ from .respondent_event import RespondentEventRepository
 from .survey_data_requirements import SurveyDataRequirementsRepository
 
 __all__ = [
+    "AnswerContext",
     "BaseRepository",
+    "DataLoader",
     "UserRepository",
     "UserDataRepository",
     "SurveyRepository",
@@ -0,0 +1,191 @@
+"""
+Answer context cache for the Quiz App.
+
+Submitting an answer needs a handful of question and survey fields: the
+question type and options for validation, the survey id to denormalize
+onto the response and whether the survey accepts answers. They are read
+with one JOIN and kept in a process-wide TTL/LRU cache keyed by
+question id, so the hot submit path usually does no read at all.
+
+Entries are evicted when a session commits writes to questions or
+surveys; the TTL bounds staleness for writes made by other processes.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.question import Question
+from models.survey import Survey
+
+# (question_id, survey_id) pairs to evict when the session commits, in
+# ``Session.info``; other sessions keep reading old rows until then
+_PENDING_KEY = "answer_context_evictions"
+
+# Pending pair of a bulk write, drops the whole cache
+_CLEAR = (None, None)
+
+
+@dataclass(frozen=True)
+class AnswerContext:
+    """Question and survey fields needed to accept an answer."""
+
+    question_id: int
+    question_type: str
+    is_required: bool
+    options: Optional[Dict[str, Any]]
+    question_data: Optional[Dict[str, Any]]
+    survey_id: int
+    survey_is_active: bool
+    survey_is_public: bool
+
+
+class AnswerContextCache:
+    """
+    Bounded TTL/LRU cache of answer contexts keyed by question id.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached questions
+            ttl_seconds: Lifetime of an entry, 0 disables caching
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, tuple[float, AnswerContext]]" = OrderedDict()
+        # Listeners run from sync session code, possibly in another thread
+        self._lock = threading.Lock()
+
+    def get(self, question_id: int) -> Optional[AnswerContext]:
+        """
+        Get a cached context.
+
+        Args:
+            question_id: Question ID
+
+        Returns:
+            AnswerContext or None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(question_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[question_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(question_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, context: AnswerContext) -> None:
+        """
+        Cache a context.
+
+        Args:
+            context: Context to cache
+        """
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[context.question_id] = (
+                time.monotonic() + self.ttl_seconds,
+                context,
+            )
+            self._entries.move_to_end(context.question_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict(
+        self, *, question_id: Optional[int] = None, survey_id: Optional[int] = None
+    ) -> None:
+        """
+        Drop the entries of a question or of all questions of a survey.
+
+        Args:
+            question_id: Question ID
+            survey_id: Survey ID
+        """
+        with self._lock:
+            if question_id is not None:
+                self._entries.pop(question_id, None)
+            if survey_id is not None:
+                for key in [
+                    key
+                    for key, (_, context) in self._entries.items()
+                    if context.survey_id == survey_id
+                ]:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Size, hits, misses and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+answer_context_cache = AnswerContextCache(
+    max_size=settings.answer_context_cache_size,
+    ttl_seconds=settings.answer_context_cache_ttl,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_after_flush(session, flush_context):
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, Question):
+            pending.add((obj.id, None))
+        elif isinstance(obj, Survey):
+            pending.add((None, obj.id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_write(orm_execute_state):
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (Question, Survey):
+        orm_execute_state.session.info.setdefault(_PENDING_KEY, set()).add(_CLEAR)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_after_commit(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _CLEAR in pending:
+        answer_context_cache.clear()
+        return
+    for question_id, survey_id in pending:
+        answer_context_cache.evict(question_id=question_id, survey_id=survey_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
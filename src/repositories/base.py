@@ -6,21 +6,108 @@ that can be inherited by specific model repositories.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
-
-from pydantic import BaseModel
-from sqlalchemy import select, update, delete, func
+import base64
+import binascii
+from datetime import datetime
+from functools import lru_cache
+import json
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import (
+    Select,
+    bindparam,
+    select,
+    update,
+    delete,
+    func,
+    insert,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, load_only, selectinload
 
 from database import Base
 
+from .loader import DataLoader, get_loader
+from .unit_of_work import in_unit_of_work
+
 # Type variables for generic repository
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or does not match the query."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode keyset values into an opaque pagination cursor.
+
+    Args:
+        values: Values of the ordering columns of the last returned row
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decode a pagination cursor for the given ordering columns.
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+        columns: Ordering columns the cursor was built for
+
+    Returns:
+        Keyset values converted to the column types
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("cursor length mismatch")
+
+        values = []
+        for column, value in zip(columns, payload):
+            if column.type.python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, column.type.python_type):
+                raise ValueError("cursor value type mismatch")
+            values.append(value)
+        return values
+    except (binascii.Error, TypeError, ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Get a cached TypeAdapter validating a list of schema instances."""
+    return TypeAdapter(List[schema])
+
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
     """
     Base repository class with common CRUD operations.
@@ -40,6 +127,126 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         self.model = model
         self.db = db
 
+    async def _commit(self) -> None:
+        """
+        Finish a write.
+
+        Commits, or only flushes when the session is a request-level unit
+        of work that commits once at the end of the request.
+        """
+        if in_unit_of_work(self.db):
+            await self.db.flush()
+        else:
+            await self.db.commit()
+
+    def _column(self, field_name: str) -> Any:
+        """
+        Get a mapped column attribute by name.
+
+        Args:
+            field_name: Column attribute name
+
+        Returns:
+            Instrumented column attribute
+
+        Raises:
+            ValueError: If the model has no such column
+        """
+        if field_name not in self.model.__mapper__.column_attrs:
+            raise ValueError(
+                f"{self.model.__name__} has no column named '{field_name}'"
+            )
+        return getattr(self.model, field_name)
+
+    def apply_projection(
+        self,
+        query: Select,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        defer_fields: Optional[Sequence[str]] = None,
+    ) -> Select:
+        """
+        Restrict which columns are loaded for the model entity.
+
+        Unloaded columns are fetched lazily on access, which fails under
+        AsyncSession, so only project what the caller actually reads.
+
+        Args:
+            query: Query selecting the model
+            fields: Only load these columns (primary key is always loaded)
+            defer_fields: Load everything except these columns
+
+        Returns:
+            Query with load_only/defer options applied
+        """
+        if fields:
+            query = query.options(
+                load_only(*(self._column(name) for name in fields), raiseload=True)
+            )
+        if defer_fields:
+            query = query.options(
+                *(defer(self._column(name), raiseload=True) for name in defer_fields)
+            )
+        return query
+
+    async def fetch_rows(
+        self, query: Select, *, as_dict: bool = True
+    ) -> List[Union[Dict[str, Any], Tuple[Any, ...]]]:
+        """
+        Execute a column query and return plain rows.
+
+        Rows bypass the identity map and ORM instance construction, which
+        makes them much cheaper than entities for read-only lists.
+
+        Args:
+            query: Query selecting columns (not entities)
+            as_dict: Return dictionaries keyed by column label, or tuples
+
+        Returns:
+            List of dictionaries or tuples
+        """
+        result = await self.db.execute(query)
+        if as_dict:
+            return [dict(row) for row in result.mappings()]
+        return [tuple(row) for row in result]
+
+    async def get_rows(
+        self,
+        fields: Sequence[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        as_dict: bool = True,
+    ) -> List[Union[Dict[str, Any], Tuple[Any, ...]]]:
+        """
+        Get selected columns of multiple records as plain rows.
+
+        Args:
+            fields: Column names to select
+            filters: Equality filters by column name
+            order_by: Column names to order by, defaults to the primary key
+            skip: Number of records to skip
+            limit: Maximum number of records to return, None for all
+            as_dict: Return dictionaries (True) or tuples (False)
+
+        Returns:
+            List of dictionaries or tuples in ``fields`` order
+        """
+        query = select(*(self._column(name) for name in fields))
+
+        for name, value in (filters or {}).items():
+            query = query.where(self._column(name) == value)
+
+        query = query.order_by(
+            *(self._column(name) for name in (order_by or ("id",)))
+        ).offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return await self.fetch_rows(query, as_dict=as_dict)
+
     async def create(self, *, obj_in: CreateSchemaType) -> ModelType:
         """
         Create a new record in the database.
@@ -53,12 +260,17 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         obj_data = obj_in.model_dump()
         db_obj = self.model(**obj_data)
         self.db.add(db_obj)
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(db_obj)
         return db_obj
 
     async def get(
-        self, id: int, *, load_relationships: bool = False
+        self,
+        id: int,
+        *,
+        load_relationships: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        defer_fields: Optional[Sequence[str]] = None,
     ) -> Optional[ModelType]:
         """
         Get a record by ID.
@@ -66,11 +278,14 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         Args:
             id: Record ID
             load_relationships: Whether to load relationships
+            fields: Only load these columns
+            defer_fields: Do not load these columns
 
         Returns:
             Model instance or None
         """
         query = select(self.model).where(self.model.id == id)
+        query = self.apply_projection(query, fields=fields, defer_fields=defer_fields)
 
         if load_relationships:
             # Load all relationships - можно переопределить в наследниках
@@ -80,7 +295,80 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
                 )
 
         result = await self.db.execute(query)
-        return result.scalars().first()
+        db_obj = result.scalars().first()
+
+        if db_obj is not None and fields is None and defer_fields is None:
+            # Later loads of the same record in this request skip the query
+            self.loader().prime(id, db_obj)
+
+        return db_obj
+
+    def loader(
+        self,
+        field_name: str = "id",
+        *,
+        many: bool = False,
+        order_by: Sequence[str] = (),
+    ) -> DataLoader:
+        """
+        Get the session's batching loader for records by a column.
+
+        Loads requested within one event-loop tick are resolved with a
+        single ``WHERE column IN (...)`` query. Loaders live as long as the
+        session (one request) and are dropped on every write.
+
+        Args:
+            field_name: Column to look records up by
+            many: Resolve each key to a list of records instead of one
+            order_by: Columns to order grouped records by
+
+        Returns:
+            DataLoader instance
+        """
+        column = self._column(field_name)
+        order_columns = [self._column(name) for name in order_by]
+
+        async def batch_load(keys: List[Any]) -> Dict[Any, Any]:
+            query = select(self.model).where(column.in_(keys))
+            if order_columns:
+                query = query.order_by(*order_columns)
+            result = await self.db.execute(query)
+            db_objs = result.scalars().all()
+
+            if not many:
+                return {getattr(db_obj, field_name): db_obj for db_obj in db_objs}
+
+            grouped: Dict[Any, List[ModelType]] = {key: [] for key in keys}
+            for db_obj in db_objs:
+                grouped[getattr(db_obj, field_name)].append(db_obj)
+            return grouped
+
+        key = (self.model, field_name, many, tuple(order_by))
+        return get_loader(self.db, key, batch_load)
+
+    async def load(self, id: int) -> Optional[ModelType]:
+        """
+        Get a record by ID through the request's batching loader.
+
+        Args:
+            id: Record ID
+
+        Returns:
+            Model instance or None
+        """
+        return await self.loader().load(id)
+
+    async def load_many(self, ids: Sequence[int]) -> List[Optional[ModelType]]:
+        """
+        Get records by IDs with one batched query.
+
+        Args:
+            ids: Record IDs
+
+        Returns:
+            Model instances (None for missing records) in the order of ids
+        """
+        return await self.loader().load_many(ids)
 
     async def get_by_field(
         self,
@@ -117,6 +405,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         skip: int = 0,
         limit: int = 100,
         load_relationships: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        defer_fields: Optional[Sequence[str]] = None,
     ) -> List[ModelType]:
         """
         Get multiple records with pagination.
@@ -125,11 +415,14 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
             skip: Number of records to skip
             limit: Maximum number of records to return
             load_relationships: Whether to load relationships
+            fields: Only load these columns
+            defer_fields: Do not load these columns
 
         Returns:
             List of model instances
         """
         query = select(self.model).offset(skip).limit(limit)
+        query = self.apply_projection(query, fields=fields, defer_fields=defer_fields)
 
         if load_relationships:
             for relationship in self.model.__mapper__.relationships:
@@ -140,6 +433,107 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def paginate_by_cursor(
+        self,
+        query: Select,
+        *,
+        order_by: Sequence[Any],
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        descending: bool = False,
+        scalars: bool = True,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Apply keyset pagination to a query and fetch one page.
+
+        Rows are ordered by ``order_by`` (which must end with a unique
+        column) and the page starts right after the row the cursor points
+        to, so the cost does not grow with the page number like OFFSET.
+
+        Args:
+            query: Base query without ORDER BY/OFFSET/LIMIT
+            order_by: Ordering columns, e.g. (Model.created_at, Model.id)
+            cursor: Cursor from the previous page, None for the first page
+            limit: Maximum number of records to return
+            descending: Whether to walk from the newest rows
+            scalars: Return ORM instances (True) or result rows (False)
+
+        Returns:
+            Tuple of (items, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        if cursor:
+            values = decode_cursor(cursor, order_by)
+            keys = tuple_(*order_by) if len(order_by) > 1 else order_by[0]
+            bound = tuple_(*values) if len(order_by) > 1 else values[0]
+            query = query.where(keys < bound if descending else keys > bound)
+
+        if not scalars:
+            # Select keyset values under known labels, whatever the row shape
+            query = query.add_columns(
+                *(column.label(f"_cursor_{i}") for i, column in enumerate(order_by))
+            )
+
+        query = query.order_by(
+            *(column.desc() if descending else column.asc() for column in order_by)
+        ).limit(limit + 1)
+
+        result = await self.db.execute(query)
+        items = list(result.scalars().all() if scalars else result.all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            if scalars:
+                next_cursor = encode_cursor(
+                    [getattr(last, column.key) for column in order_by]
+                )
+            else:
+                next_cursor = encode_cursor(
+                    [last._mapping[f"_cursor_{i}"] for i in range(len(order_by))]
+                )
+
+        return items, next_cursor
+
+    async def get_multi_by_cursor(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        load_relationships: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        defer_fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Get multiple records with keyset pagination by ID.
+
+        Args:
+            cursor: Cursor from the previous page, None for the first page
+            limit: Maximum number of records to return
+            load_relationships: Whether to load relationships
+            fields: Only load these columns
+            defer_fields: Do not load these columns
+
+        Returns:
+            Tuple of (model instances, next_cursor)
+        """
+        query = self.apply_projection(
+            select(self.model), fields=fields, defer_fields=defer_fields
+        )
+
+        if load_relationships:
+            for relationship in self.model.__mapper__.relationships:
+                query = query.options(
+                    selectinload(getattr(self.model, relationship.key))
+                )
+
+        return await self.paginate_by_cursor(
+            query, order_by=(self.model.id,), cursor=cursor, limit=limit
+        )
+
     async def update(
         self,
         *,
@@ -166,7 +560,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
                 setattr(db_obj, field, value)
 
         self.db.add(db_obj)
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(db_obj)
         return db_obj
 
@@ -183,7 +577,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         db_obj = await self.get(id=id)
         if db_obj:
             await self.db.delete(db_obj)
-            await self.db.commit()
+            await self._commit()
         return db_obj
 
     async def remove(self, id: int) -> Optional[ModelType]:
@@ -222,53 +616,134 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         db_obj = await self.get(id=id)
         return db_obj is not None
 
-    async def bulk_create(self, *, objs_in: List[CreateSchemaType]) -> List[ModelType]:
+    def _prepare_bulk_rows(
+        self,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        schema: Optional[Type[CreateSchemaType]] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Create multiple records in bulk.
+        Validate and serialize bulk payloads in a single pass.
 
         Args:
-            objs_in: List of Pydantic schemas with create data
+            objs_in: Pydantic schemas or raw dictionaries
+            schema: Schema to validate against, defaults to the type of the
+                first payload when it is a Pydantic model
 
         Returns:
-            List of created model instances
+            List of column dictionaries
+        """
+        if schema is None and isinstance(objs_in[0], BaseModel):
+            schema = type(objs_in[0])
+
+        if schema is None:
+            return [dict(obj) for obj in objs_in]
+
+        adapter = _list_adapter(schema)
+        return adapter.dump_python(adapter.validate_python(objs_in))
+
+    async def bulk_create(
+        self,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        schema: Optional[Type[CreateSchemaType]] = None,
+    ) -> List[ModelType]:
         """
-        db_objs = []
-        for obj_in in objs_in:
-            obj_data = obj_in.model_dump()
-            db_obj = self.model(**obj_data)
-            db_objs.append(db_obj)
+        Create multiple records in bulk.
+
+        Rows are inserted with multi-row INSERT ... RETURNING statements, so
+        created instances come back fully populated without a refresh per
+        row. Use bulk_insert when the instances are not needed.
 
-        self.db.add_all(db_objs)
-        await self.db.commit()
+        Args:
+            objs_in: Pydantic schemas or dictionaries with create data
+            schema: Schema to validate dictionaries against
 
-        for db_obj in db_objs:
-            await self.db.refresh(db_obj)
+        Returns:
+            List of created model instances in input order
+        """
+        if not objs_in:
+            return []
+
+        rows = self._prepare_bulk_rows(objs_in, schema)
+        result = await self.db.scalars(insert(self.model).returning(self.model), rows)
+        # sort_by_parameter_order would degrade to one INSERT per row on
+        # SQLite; autoincrement ids are assigned in VALUES order instead
+        db_objs = sorted(result.all(), key=lambda db_obj: db_obj.id)
+        ids = [db_obj.id for db_obj in db_objs]
+        await self._commit()
+
+        if self.db.sync_session.expire_on_commit and not in_unit_of_work(self.db):
+            # Reload all instances with one query instead of one per row
+            await self.db.execute(
+                select(self.model)
+                .where(self.model.id.in_(ids))
+                .execution_options(populate_existing=True)
+            )
 
         return db_objs
 
-    async def bulk_update(self, *, updates: List[Dict[str, Any]]) -> int:
+    async def bulk_insert(
+        self,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        schema: Optional[Type[CreateSchemaType]] = None,
+    ) -> int:
+        """
+        Insert multiple records without returning them.
+
+        Fast path for imports, event logging and seeding: rows are sent
+        with executemany and no instances are loaded into the session.
+
+        Args:
+            objs_in: Pydantic schemas or dictionaries with create data
+            schema: Schema to validate dictionaries against
+
+        Returns:
+            Number of inserted records
+        """
+        if not objs_in:
+            return 0
+
+        rows = self._prepare_bulk_rows(objs_in, schema)
+        await self.db.execute(insert(self.model), rows)
+        await self._commit()
+        return len(rows)
+
+    async def bulk_update(self, *, updates: Sequence[Dict[str, Any]]) -> int:
         """
         Update multiple records in bulk.
 
+        Updates are grouped by the set of columns they change, and each
+        group runs as one executemany UPDATE ... WHERE id = ? statement.
+
         Args:
             updates: List of update dictionaries with 'id' and update fields
 
         Returns:
             Number of updated records
         """
-        updated_count = 0
+        table = self.model.__table__
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
         for update_data in updates:
-            record_id = update_data.pop("id")
-            if update_data:  # Only update if there are fields to update
-                query = (
-                    update(self.model)
-                    .where(self.model.id == record_id)
-                    .values(**update_data)
-                )
-                result = await self.db.execute(query)
-                updated_count += result.rowcount
+            fields = tuple(sorted(key for key in update_data if key != "id"))
+            if not fields:  # Only update if there are fields to update
+                continue
+            params = {f"_{field}": update_data[field] for field in fields}
+            params["_id"] = update_data["id"]
+            groups.setdefault(fields, []).append(params)
 
-        await self.db.commit()
+        updated_count = 0
+        for fields, params in groups.items():
+            # Bind names are prefixed: names equal to columns are reserved
+            query = (
+                update(table)
+                .where(table.c.id == bindparam("_id"))
+                .values({field: bindparam(f"_{field}") for field in fields})
+            )
+            result = await self.db.execute(query, params)
+            updated_count += result.rowcount
+
+        await self._commit()
         return updated_count
 
     async def bulk_delete(self, *, ids: List[int]) -> int:
@@ -283,7 +758,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         """
         query = delete(self.model).where(self.model.id.in_(ids))
         result = await self.db.execute(query)
-        await self.db.commit()
+        await self._commit()
         return result.rowcount
 
     async def get_by_field_list(
@@ -126,7 +126,7 @@ class ConsentLogRepository(
                 consent.details = {}
             consent.details["revocation_reason"] = revocation_reason
 
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(consent)
         return consent
 
@@ -3,12 +3,15 @@ Repository dependencies for the Quiz App.
 
 This module provides dependency functions for injecting repositories
 into FastAPI endpoints using the Depends pattern.
+
+Repositories share the request's session in unit of work mode: writes
+only flush and the request commits once at the end (see unit_of_work).
 """
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_async_session
+from database import get_async_read_session
 
 # Import repositories
 from .user import UserRepository
@@ -30,11 +33,12 @@ from .respondent_survey import RespondentSurveyRepository
 from .consent_log import ConsentLogRepository
 from .respondent_event import RespondentEventRepository
 from .survey_data_requirements import SurveyDataRequirementsRepository
+from .unit_of_work import get_unit_of_work_session
 
 
 # User Repository Dependency
 def get_user_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> UserRepository:
     """
     Get UserRepository instance as a dependency.
@@ -50,7 +54,7 @@ def get_user_repository(
 
 # Survey Repository Dependency
 def get_survey_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> SurveyRepository:
     """
     Get SurveyRepository instance as a dependency.
@@ -66,7 +70,7 @@ def get_survey_repository(
 
 # Question Repository Dependency
 def get_question_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> QuestionRepository:
     """
     Get QuestionRepository instance as a dependency.
@@ -82,7 +86,7 @@ def get_question_repository(
 
 # Response Repository Dependency
 def get_response_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> ResponseRepository:
     """
     Get ResponseRepository instance as a dependency.
@@ -98,7 +102,7 @@ def get_response_repository(
 
 # User Data Repository Dependency
 def get_user_data_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> UserDataRepository:
     """
     Get UserDataRepository instance as a dependency.
@@ -114,7 +118,7 @@ def get_user_data_repository(
 
 # Push Subscription Repository Dependency
 def get_push_subscription_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> PushSubscriptionRepository:
     """
     Get PushSubscriptionRepository instance as a dependency.
@@ -130,7 +134,7 @@ def get_push_subscription_repository(
 
 # Push Notification Repository Dependency
 def get_push_notification_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> PushNotificationRepository:
     """
     Get PushNotificationRepository instance as a dependency.
@@ -146,7 +150,7 @@ def get_push_notification_repository(
 
 # Notification Template Repository Dependency
 def get_notification_template_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> NotificationTemplateRepository:
     """
     Get NotificationTemplateRepository instance as a dependency.
@@ -162,7 +166,7 @@ def get_notification_template_repository(
 
 # Notification Analytics Repository Dependency
 def get_notification_analytics_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> NotificationAnalyticsRepository:
     """
     Get NotificationAnalyticsRepository instance as a dependency.
@@ -178,7 +182,7 @@ def get_notification_analytics_repository(
 
 # Profile Repository Dependency
 def get_profile_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> ProfileRepository:
     """
     Get ProfileRepository instance as a dependency.
@@ -194,7 +198,7 @@ def get_profile_repository(
 
 # Respondent Repository Dependency
 def get_respondent_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> RespondentRepository:
     """
     Get RespondentRepository instance as a dependency.
@@ -210,7 +214,7 @@ def get_respondent_repository(
 
 # RespondentSurvey Repository Dependency
 def get_respondent_survey_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> RespondentSurveyRepository:
     """
     Get RespondentSurveyRepository instance as a dependency.
@@ -226,7 +230,7 @@ def get_respondent_survey_repository(
 
 # ConsentLog Repository Dependency
 def get_consent_log_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> ConsentLogRepository:
     """
     Get ConsentLogRepository instance as a dependency.
@@ -242,7 +246,7 @@ def get_consent_log_repository(
 
 # RespondentEvent Repository Dependency
 def get_respondent_event_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> RespondentEventRepository:
     """
     Get RespondentEventRepository instance as a dependency.
@@ -258,7 +262,7 @@ def get_respondent_event_repository(
 
 # SurveyDataRequirements Repository Dependency
 def get_survey_data_requirements_repository(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_unit_of_work_session),
 ) -> SurveyDataRequirementsRepository:
     """
     Get SurveyDataRequirementsRepository instance as a dependency.
@@ -270,3 +274,40 @@ def get_survey_data_requirements_repository(
         SurveyDataRequirementsRepository instance
     """
     return SurveyDataRequirementsRepository(db)
+
+
+# Read-only Repository Dependencies
+#
+# Bound to the read replica when READ_DATABASE_URL is configured, otherwise
+# to the primary database. Use them for analytics and reports only: data may
+# lag behind the primary and writes are rejected.
+
+
+def get_survey_read_repository(
+    db: AsyncSession = Depends(get_async_read_session),
+) -> SurveyRepository:
+    """
+    Get read-only SurveyRepository instance as a dependency.
+
+    Args:
+        db: Read-only database session
+
+    Returns:
+        SurveyRepository instance
+    """
+    return SurveyRepository(db)
+
+
+def get_user_read_repository(
+    db: AsyncSession = Depends(get_async_read_session),
+) -> UserRepository:
+    """
+    Get read-only UserRepository instance as a dependency.
+
+    Args:
+        db: Read-only database session
+
+    Returns:
+        UserRepository instance
+    """
+    return UserRepository(db)
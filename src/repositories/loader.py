@@ -0,0 +1,212 @@
+"""
+Request-scoped batching loaders for the Quiz App.
+
+A DataLoader collects the keys requested within one event-loop tick and
+resolves them with a single batch call, so handlers that fetch related
+rows one at a time issue one ``IN (...)`` query per entity type instead
+of one query per row.
+
+Loaders are stored on the database session, which lives for one request,
+and are dropped whenever the session writes.
+"""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+BatchLoadFn = Callable[[List[Any]], Awaitable[Dict[Any, Any]]]
+
+# Keys of the loader registry in ``Session.info``
+_LOADERS_KEY = "dataloaders"
+_LOCK_KEY = "dataloader_lock"
+
+
+class DataLoader(Generic[KeyType, ValueType]):
+    """
+    Batch and cache key lookups made within one event-loop tick.
+
+    The batch function receives the list of unique keys and returns a
+    mapping from key to value; keys missing from the mapping resolve to
+    None.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: BatchLoadFn,
+        *,
+        max_batch_size: int = 500,
+        cache: bool = True,
+        lock: Optional[asyncio.Lock] = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            batch_load_fn: Coroutine function resolving a list of keys
+            max_batch_size: Maximum number of keys per batch call
+            cache: Keep resolved values for the loader's lifetime
+            lock: Lock serializing batch calls (one per database session)
+        """
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._lock = lock or asyncio.Lock()
+        self._futures: Dict[KeyType, asyncio.Future] = {}
+        self._queue: Dict[KeyType, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: KeyType) -> Optional[ValueType]:
+        """
+        Load a value by key, batched with other loads in the same tick.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Loaded value or None
+        """
+        future = self._futures.get(key) or self._queue.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._queue[key] = future
+            if self.cache:
+                self._futures[key] = future
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+
+        # Shielded: one cancelled caller must not cancel a shared result
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[KeyType]) -> List[Optional[ValueType]]:
+        """
+        Load several values in one batch.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Values in the order of the keys
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: KeyType, value: ValueType) -> None:
+        """
+        Put an already loaded value into the cache.
+
+        Args:
+            key: Key of the value
+            value: Value to cache
+        """
+        if not self.cache or key in self._futures:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, key: Optional[KeyType] = None) -> None:
+        """
+        Forget cached values.
+
+        Args:
+            key: Key to forget, all keys when omitted
+        """
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(key, None)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, {}
+        self._dispatch_scheduled = False
+
+        keys = list(queue)
+        for start in range(0, len(keys), self.max_batch_size):
+            batch = {
+                key: queue[key] for key in keys[start : start + self.max_batch_size]
+            }
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: Dict[KeyType, asyncio.Future]) -> None:
+        try:
+            async with self._lock:
+                values = await self.batch_load_fn(list(batch))
+        except Exception as e:
+            for key, future in batch.items():
+                # Failures are not cached, the next load retries
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+def get_loader(
+    session: AsyncSession, key: Hashable, batch_load_fn: BatchLoadFn
+) -> DataLoader:
+    """
+    Get the session's loader for a key, creating it on first use.
+
+    All loaders of a session share one lock, so their batch queries never
+    run concurrently on the same connection.
+
+    Args:
+        session: Database session the loader belongs to
+        key: Loader identity, e.g. (model, column)
+        batch_load_fn: Batch function used when the loader is created
+
+    Returns:
+        DataLoader instance
+    """
+    loaders = session.info.setdefault(_LOADERS_KEY, {})
+    loader = loaders.get(key)
+    if loader is None:
+        lock = session.info.setdefault(_LOCK_KEY, asyncio.Lock())
+        loader = loaders[key] = DataLoader(batch_load_fn, lock=lock)
+    return loader
+
+
+def clear_loaders(session: Any) -> None:
+    """
+    Drop all loaders of a session.
+
+    Args:
+        session: Sync or async database session
+    """
+    session.info.pop(_LOADERS_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_loaders_after_flush(session, flush_context):
+    clear_loaders(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_loaders_after_write(orm_execute_state):
+    if not orm_execute_state.is_select:
+        clear_loaders(orm_execute_state.session)
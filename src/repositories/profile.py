@@ -181,7 +181,7 @@ class ProfileRepository(BaseRepository[Profile, ProfileCreate, ProfileUpdate]):
         profile = await self.get_by_user_id(user_id)
         if profile:
             profile.profile_picture_url = picture_url
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(profile)
         return profile
 
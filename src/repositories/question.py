@@ -5,11 +5,13 @@ This module provides the question repository with specific methods
 for question-related database operations.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.question import Question, QuestionCreate, QuestionUpdate
+from models.survey import Survey
+from .answer_context import AnswerContext, answer_context_cache
 from .base import BaseRepository
 
 
@@ -22,12 +24,15 @@ class QuestionRepository(BaseRepository[Question, QuestionCreate, QuestionUpdate
         """Initialize QuestionRepository with database session."""
         super().__init__(Question, db)
 
-    async def get_by_survey_id(self, survey_id: int) -> List[Question]:
+    async def get_by_survey_id(
+        self, survey_id: int, *, fields: Optional[Sequence[str]] = None
+    ) -> List[Question]:
         """
         Get questions by survey ID.
 
         Args:
             survey_id: Survey ID
+            fields: Only load these columns (skips JSON payloads when omitted)
 
         Returns:
             List of questions for survey
@@ -37,6 +42,7 @@ class QuestionRepository(BaseRepository[Question, QuestionCreate, QuestionUpdate
             .where(Question.survey_id == survey_id)
             .order_by(Question.order)
         )
+        query = self.apply_projection(query, fields=fields)
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -58,24 +64,82 @@ class QuestionRepository(BaseRepository[Question, QuestionCreate, QuestionUpdate
         result = await self.db.execute(query)
         return result.scalars().all()
 
-    async def get_survey_by_question_id(self, question_id: int):
+    async def load_by_survey_ids(
+        self, survey_ids: Sequence[int]
+    ) -> Dict[int, List[Question]]:
         """
-        Get survey by question ID.
+        Get questions of several surveys with one batched query.
+
+        Args:
+            survey_ids: Survey IDs
+
+        Returns:
+            Mapping of survey ID to its questions ordered by order
+        """
+        loader = self.loader("survey_id", many=True, order_by=("order",))
+        questions = await loader.load_many(survey_ids)
+        return dict(zip(survey_ids, questions))
+
+    async def get_answer_context(self, question_id: int) -> Optional[AnswerContext]:
+        """
+        Get the question and survey fields needed to accept an answer.
+
+        Served from the process-wide answer context cache; a miss costs
+        one question JOIN survey query.
 
         Args:
             question_id: Question ID
 
         Returns:
-            Survey instance or None
+            AnswerContext or None if the question does not exist
         """
-        from models.survey import Survey
-        from sqlalchemy.orm import selectinload
+        context = answer_context_cache.get(question_id)
+        if context is not None:
+            return context
+
+        query = self._answer_context_query().where(Question.id == question_id)
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            return None
+
+        context = AnswerContext(*row)
+        answer_context_cache.put(context)
+        return context
+
+    async def get_answer_contexts_by_survey(
+        self, survey_id: int
+    ) -> List[AnswerContext]:
+        """
+        Get the answer contexts of all questions of a survey.
+
+        Always reads with one query and refreshes the cache entries.
 
+        Args:
+            survey_id: Survey ID
+
+        Returns:
+            Answer contexts ordered by question order
+        """
         query = (
-            select(Question)
-            .options(selectinload(Question.survey))
-            .where(Question.id == question_id)
+            self._answer_context_query()
+            .where(Question.survey_id == survey_id)
+            .order_by(Question.order)
         )
-        result = await self.db.execute(query)
-        question = result.scalars().first()
-        return question.survey if question else None
+        contexts = [AnswerContext(*row) for row in await self.db.execute(query)]
+        for context in contexts:
+            answer_context_cache.put(context)
+        return contexts
+
+    @staticmethod
+    def _answer_context_query():
+        """Question JOIN survey select of the AnswerContext fields."""
+        return select(
+            Question.id,
+            Question.question_type,
+            Question.is_required,
+            Question.options,
+            Question.question_data,
+            Question.survey_id,
+            Survey.is_active,
+            Survey.is_public,
+        ).join(Survey, Question.survey_id == Survey.id)
@@ -8,6 +8,7 @@ for respondent-related database operations including merging functionality.
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy import select, func, or_, and_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -44,6 +45,61 @@ class RespondentRepository(
             "session_id", session_id, load_relationships=True
         )
 
+    async def get_id_by_session_id(self, session_id: str) -> Optional[int]:
+        """
+        Get the ID of the respondent owning a session.
+
+        Reads two columns only; a merged respondent resolves to the
+        respondent it was merged into.
+
+        Args:
+            session_id: Session ID to search for
+
+        Returns:
+            Respondent ID or None
+        """
+        query = select(Respondent.id, Respondent.merged_into_id).where(
+            Respondent.session_id == session_id
+        )
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            return None
+        return row.merged_into_id or row.id
+
+    async def get_or_create_id_by_session(self, *, obj_in: RespondentCreate) -> int:
+        """
+        Get the respondent of ``obj_in.session_id``, creating it if missing.
+
+        Runs INSERT ... ON CONFLICT DO NOTHING RETURNING id, so concurrent
+        first answers of one session end up with the same respondent.
+
+        Args:
+            obj_in: Respondent data used when the respondent is created
+
+        Returns:
+            Respondent ID
+        """
+        columns = Respondent.__table__.columns
+        row = {
+            key: value
+            for key, value in obj_in.model_dump().items()
+            if key in columns
+        }
+
+        is_postgresql = self.db.get_bind().dialect.name == "postgresql"
+        dialect_insert = postgresql.insert if is_postgresql else sqlite.insert
+        query = (
+            dialect_insert(Respondent)
+            .values(**row)
+            .on_conflict_do_nothing(index_elements=["session_id"])
+            .returning(Respondent.id)
+        )
+        respondent_id = (await self.db.execute(query)).scalar()
+        if respondent_id is not None:
+            await self._commit()
+            return respondent_id
+        return await self.get_id_by_session_id(obj_in.session_id)
+
     async def get_by_fingerprint(self, fingerprint: str) -> List[Respondent]:
         """
         Get respondents by browser fingerprint.
@@ -319,7 +375,7 @@ class RespondentRepository(
             if not target.precise_location and source.precise_location:
                 target.precise_location = source.precise_location
 
-            await self.db.commit()
+            await self._commit()
             return True
 
         except Exception:
@@ -390,7 +446,7 @@ class RespondentRepository(
         respondent = await self.get(respondent_id)
         if respondent:
             respondent.last_activity_at = datetime.utcnow()
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(respondent)
         return respondent
 
@@ -461,6 +517,6 @@ class RespondentRepository(
             respondent.is_deleted = True
             respondent.deleted_at = datetime.utcnow()
             respondent.is_active = False
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(respondent)
         return respondent
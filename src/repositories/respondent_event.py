@@ -5,7 +5,7 @@ This module provides the respondent event repository with specific methods
 for managing respondent events and activity tracking.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -88,6 +88,31 @@ class RespondentEventRepository(
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_events_by_respondent_by_cursor(
+        self, respondent_id: int, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[RespondentEvent], Optional[str]]:
+        """
+        Get events for a respondent with keyset pagination, newest first.
+
+        Args:
+            respondent_id: Respondent ID
+            cursor: Cursor from the previous page, None for the first page
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (RespondentEvent instances, next_cursor)
+        """
+        query = select(RespondentEvent).where(
+            RespondentEvent.respondent_id == respondent_id
+        )
+        return await self.paginate_by_cursor(
+            query,
+            order_by=(RespondentEvent.created_at, RespondentEvent.id),
+            cursor=cursor,
+            limit=limit,
+            descending=True,
+        )
+
     async def get_events_by_type(
         self, event_type: str, *, skip: int = 0, limit: int = 100
     ) -> List[RespondentEvent]:
@@ -503,7 +528,7 @@ class RespondentEventRepository(
             RespondentEvent.created_at < cutoff_time
         )
         await self.db.execute(delete_query)
-        await self.db.commit()
+        await self._commit()
 
         return events_to_delete
 
@@ -158,7 +158,7 @@ class RespondentSurveyRepository(
         ):
             participation.status = "in_progress"
 
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(participation)
         return participation
 
@@ -191,7 +191,7 @@ class RespondentSurveyRepository(
             if "time_spent_seconds" in completion_data:
                 participation.time_spent_seconds = completion_data["time_spent_seconds"]
 
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(participation)
         return participation
 
@@ -215,7 +215,7 @@ class RespondentSurveyRepository(
         participation.status = "abandoned"
         participation.last_activity_at = datetime.utcnow()
 
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(participation)
         return participation
 
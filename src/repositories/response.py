@@ -5,12 +5,15 @@ This module provides the response repository with specific methods
 for response-related database operations.
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from models.question import Question
 from models.response import Response, ResponseCreate, ResponseRead
 from .base import BaseRepository
+from .unit_of_work import in_unit_of_work
 
 
 class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
@@ -22,6 +25,178 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         """Initialize ResponseRepository with database session."""
         super().__init__(Response, db)
 
+    async def _rows_with_survey_ids(
+        self,
+        objs_in: Sequence[Union[ResponseCreate, Dict[str, Any]]],
+        schema: Optional[Type[ResponseCreate]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Serialize bulk payloads and fill in missing survey IDs.
+
+        Core inserts bypass the ORM before_insert hook, so survey IDs are
+        looked up here with one query for all questions involved.
+
+        Args:
+            objs_in: Response schemas or dictionaries
+            schema: Schema to validate dictionaries against
+
+        Returns:
+            List of column dictionaries with survey_id set
+        """
+        rows = self._prepare_bulk_rows(objs_in, schema)
+        question_ids = {
+            row["question_id"] for row in rows if row.get("survey_id") is None
+        }
+        if question_ids:
+            result = await self.db.execute(
+                select(Question.id, Question.survey_id).where(
+                    Question.id.in_(question_ids)
+                )
+            )
+            survey_ids = dict(result.all())
+            for row in rows:
+                if row.get("survey_id") is None:
+                    row["survey_id"] = survey_ids.get(row["question_id"])
+        return rows
+
+    def _upsert_insert(self):
+        """INSERT construct of the bound dialect, with ON CONFLICT support."""
+        is_postgresql = self.db.get_bind().dialect.name == "postgresql"
+        dialect_insert = postgresql.insert if is_postgresql else sqlite.insert
+        return dialect_insert(Response)
+
+    async def bulk_create(
+        self,
+        *,
+        objs_in: Sequence[Union[ResponseCreate, Dict[str, Any]]],
+        schema: Optional[Type[ResponseCreate]] = None,
+    ) -> List[Response]:
+        """Create responses in bulk, keeping survey_id consistent."""
+        if not objs_in:
+            return []
+        rows = await self._rows_with_survey_ids(objs_in, schema)
+        return await super().bulk_create(objs_in=rows)
+
+    async def bulk_insert(
+        self,
+        *,
+        objs_in: Sequence[Union[ResponseCreate, Dict[str, Any]]],
+        schema: Optional[Type[ResponseCreate]] = None,
+    ) -> int:
+        """Insert responses in bulk, keeping survey_id consistent."""
+        if not objs_in:
+            return 0
+        rows = await self._rows_with_survey_ids(objs_in, schema)
+        return await super().bulk_insert(objs_in=rows)
+
+    async def create_if_absent(
+        self,
+        *,
+        obj_in: ResponseCreate,
+        idempotency_key: Optional[str] = None,
+        survey_id: Optional[int] = None,
+    ) -> Tuple[Optional[Response], bool]:
+        """
+        Insert a response unless it conflicts with an existing one.
+
+        Runs a single INSERT ... ON CONFLICT DO NOTHING RETURNING, so the
+        uniqueness of (question_id, user_session_id) and of the idempotency
+        key is enforced by the database even for concurrent submits. The
+        existing response is only looked up when the insert was skipped.
+
+        Args:
+            obj_in: Response data
+            idempotency_key: Client-supplied Idempotency-Key, if any
+            survey_id: Survey of the question, looked up in the INSERT if None
+
+        Returns:
+            Tuple of (response, created). On conflict the response is the
+            one stored under the idempotency key or, failing that, for the
+            same question and session.
+        """
+        row = obj_in.model_dump()
+        row["idempotency_key"] = idempotency_key
+        if survey_id is None:
+            # Statement-level inserts skip the before_insert hook
+            survey_id = (
+                select(Question.survey_id)
+                .where(Question.id == row["question_id"])
+                .scalar_subquery()
+            )
+        row["survey_id"] = survey_id
+
+        query = (
+            self._upsert_insert()
+            .values(**row)
+            .on_conflict_do_nothing()
+            .returning(Response)
+        )
+        result = await self.db.scalars(query)
+        db_obj = result.first()
+
+        if db_obj is not None:
+            await self._commit()
+            if self.db.sync_session.expire_on_commit and not in_unit_of_work(self.db):
+                await self.db.refresh(db_obj)
+            return db_obj, True
+
+        existing = None
+        if idempotency_key is not None:
+            existing = await self.get_by_idempotency_key(idempotency_key)
+        if existing is None:
+            existing = await self.get_by_question_and_session(
+                obj_in.question_id, obj_in.user_session_id
+            )
+        return existing, False
+
+    async def insert_many_if_absent(
+        self, rows: List[Dict[str, Any]], *, overwrite_answer: bool = False
+    ) -> List[Response]:
+        """
+        Insert several responses with one multi-row statement.
+
+        Rows conflicting with an existing (question_id, user_session_id)
+        response are skipped or, with ``overwrite_answer``, replace its
+        answer. Rows must carry survey_id.
+
+        Args:
+            rows: Response column values
+            overwrite_answer: Update the answer of conflicting responses
+
+        Returns:
+            Inserted (and, with overwrite_answer, updated) responses
+        """
+        if not rows:
+            return []
+
+        query = self._upsert_insert().values(rows)
+        if overwrite_answer:
+            query = query.on_conflict_do_update(
+                index_elements=["question_id", "user_session_id"],
+                set_={"answer": query.excluded.answer},
+            )
+        else:
+            query = query.on_conflict_do_nothing()
+        query = query.returning(Response).execution_options(populate_existing=True)
+
+        responses = (await self.db.scalars(query)).all()
+        await self._commit()
+        return list(responses)
+
+    async def get_by_idempotency_key(self, idempotency_key: str) -> Optional[Response]:
+        """
+        Get response by the Idempotency-Key it was created with.
+
+        Args:
+            idempotency_key: Client-supplied Idempotency-Key
+
+        Returns:
+            Response or None
+        """
+        query = select(Response).where(Response.idempotency_key == idempotency_key)
+        result = await self.db.execute(query)
+        return result.scalars().first()
+
     async def get_by_question_id(self, question_id: int) -> List[Response]:
         """
         Get responses by question ID.
@@ -70,13 +245,11 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         Returns:
             List of responses from public surveys
         """
-        from models.question import Question
         from models.survey import Survey
 
         query = (
             select(Response)
-            .join(Question, Response.question_id == Question.id)
-            .join(Survey, Question.survey_id == Survey.id)
+            .join(Survey, Response.survey_id == Survey.id)
             .where(
                 Response.user_session_id == user_session_id,
                 Survey.is_public == True,
@@ -105,7 +278,11 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         return result.scalars().first()
 
     async def get_by_user_session_and_survey(
-        self, user_session_id: str, survey_id: int
+        self,
+        user_session_id: str,
+        survey_id: int,
+        *,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Response]:
         """
         Get responses by user session and survey.
@@ -113,21 +290,20 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         Args:
             user_session_id: User session ID
             survey_id: Survey ID
+            fields: Only load these columns (e.g. skip the answer payload)
 
         Returns:
             List of responses for user and survey
         """
-        from models.question import Question
-
         query = (
             select(Response)
-            .join(Question, Response.question_id == Question.id)
             .where(
+                Response.survey_id == survey_id,
                 Response.user_session_id == user_session_id,
-                Question.survey_id == survey_id,
             )
             .order_by(Response.created_at.desc())
         )
+        query = self.apply_projection(query, fields=fields)
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -159,12 +335,9 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         Returns:
             List of responses for survey
         """
-        from models.question import Question
-
         query = (
             select(Response)
-            .join(Question, Response.question_id == Question.id)
-            .where(Question.survey_id == survey_id)
+            .where(Response.survey_id == survey_id)
             .order_by(Response.created_at.desc())
         )
         result = await self.db.execute(query)
@@ -183,14 +356,11 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         Returns:
             List of user responses for survey
         """
-        from models.question import Question
-
         query = (
             select(Response)
-            .join(Question, Response.question_id == Question.id)
             .where(
+                Response.survey_id == survey_id,
                 Response.user_id == user_id,
-                Question.survey_id == survey_id,
             )
             .order_by(Response.created_at.desc())
         )
@@ -207,13 +377,8 @@ class ResponseRepository(BaseRepository[Response, ResponseCreate, dict]):
         Returns:
             Number of responses for survey
         """
-        from models.question import Question
         from sqlalchemy import func
 
-        query = (
-            select(func.count(Response.id))
-            .join(Question, Response.question_id == Question.id)
-            .where(Question.survey_id == survey_id)
-        )
+        query = select(func.count(Response.id)).where(Response.survey_id == survey_id)
         result = await self.db.execute(query)
         return result.scalar() or 0
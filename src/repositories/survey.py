@@ -5,7 +5,7 @@ This module provides the survey repository with specific methods
 for survey-related database operations.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -91,6 +91,28 @@ class SurveyRepository(BaseRepository[Survey, SurveyCreate, SurveyUpdate]):
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_active_public_surveys_by_cursor(
+        self, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Survey], Optional[str]]:
+        """
+        Get active public surveys with keyset pagination by ID.
+
+        Args:
+            cursor: Cursor from the previous page, None for the first page
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (active public surveys, next_cursor)
+        """
+        query = (
+            select(Survey)
+            .where(Survey.is_active == True)
+            .where(Survey.is_public == True)
+        )
+        return await self.paginate_by_cursor(
+            query, order_by=(Survey.id,), cursor=cursor, limit=limit
+        )
+
     async def get_survey_stats(self, survey_id: int) -> Dict[str, Any]:
         """
         Get survey statistics.
@@ -109,12 +131,11 @@ class SurveyRepository(BaseRepository[Survey, SurveyCreate, SurveyUpdate]):
                     COUNT(DISTINCT r.user_session_id) as unique_respondents,
                     COUNT(r.id) as total_responses,
                     COUNT(DISTINCT r.user_id) as authenticated_users,
-                    COUNT(DISTINCT q.id) as total_questions,
+                    COUNT(DISTINCT r.question_id) as total_questions,
                     MIN(r.created_at) as first_response,
                     MAX(r.created_at) as last_response
                 FROM response r
-                JOIN question q ON r.question_id = q.id
-                WHERE q.survey_id = :survey_id
+                WHERE r.survey_id = :survey_id
             """
             )
 
@@ -128,18 +149,16 @@ class SurveyRepository(BaseRepository[Survey, SurveyCreate, SurveyUpdate]):
                     COUNT(DISTINCT r.user_session_id) as started,
                     COUNT(DISTINCT complete_sessions.session_id) as completed
                 FROM response r
-                JOIN question q ON r.question_id = q.id
                 LEFT JOIN (
                     SELECT r2.user_session_id as session_id
                     FROM response r2
-                    JOIN question q2 ON r2.question_id = q2.id
-                    WHERE q2.survey_id = :survey_id
+                    WHERE r2.survey_id = :survey_id
                     GROUP BY r2.user_session_id
-                    HAVING COUNT(DISTINCT q2.id) = (
+                    HAVING COUNT(DISTINCT r2.question_id) = (
                         SELECT COUNT(id) FROM question WHERE survey_id = :survey_id
                     )
                 ) complete_sessions ON r.user_session_id = complete_sessions.session_id
-                WHERE q.survey_id = :survey_id
+                WHERE r.survey_id = :survey_id
             """
             )
 
@@ -440,7 +440,7 @@ class SurveyDataRequirementsRepository(
             return None
 
         requirements.gdpr_compliant = gdpr_compliant
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(requirements)
         return requirements
 
@@ -462,7 +462,7 @@ class SurveyDataRequirementsRepository(
             return None
 
         requirements.consent_required = consent_required
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(requirements)
         return requirements
 
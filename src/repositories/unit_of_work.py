@@ -0,0 +1,102 @@
+"""
+Request-level unit of work for the Quiz App.
+
+Repositories normally commit after every write. A session opened through
+``get_unit_of_work_session`` is marked as a unit of work instead:
+repository writes only flush (so generated IDs and defaults are available
+right away) and the whole request is committed once at the end.
+
+FastAPI runs the cleanup of ``yield`` dependencies after the response has
+been sent, so routers using these sessions set ``UnitOfWorkRoute`` as their
+route class. It commits before the response goes out, which means a failed
+commit turns into an error response instead of being lost.
+"""
+
+from collections.abc import AsyncGenerator
+from typing import Any, Callable, Coroutine
+
+from fastapi import Depends, Request
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from database import get_async_session
+
+# Key of the unit of work marker in ``Session.info``
+_UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """
+    Check whether a session defers its commit to the end of the request.
+
+    Args:
+        session: Database session
+
+    Returns:
+        True if repositories should only flush
+    """
+    return session.info.get(_UNIT_OF_WORK_KEY, False)
+
+
+async def get_unit_of_work_session(
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get the request's database session in unit of work mode.
+
+    The session is committed by ``UnitOfWorkRoute`` before the response is
+    sent. Routes with another route class get it committed when the
+    dependency is cleaned up.
+
+    Args:
+        request: Current request
+        db: Database session
+
+    Yields:
+        AsyncSession: Database session
+    """
+    db.info[_UNIT_OF_WORK_KEY] = True
+    request.state.unit_of_work = db
+    try:
+        yield db
+    except Exception:
+        await db.rollback()
+        raise
+    else:
+        if db.in_transaction():
+            await db.commit()
+
+
+async def _finish_unit_of_work(request: Request, *, commit: bool) -> None:
+    db = getattr(request.state, "unit_of_work", None)
+    if db is None or not db.in_transaction():
+        return
+    if commit:
+        await db.commit()
+    else:
+        await db.rollback()
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Route that commits the request's unit of work before responding.
+
+    Successful responses are committed; error responses and exceptions
+    roll the transaction back.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except Exception:
+                await _finish_unit_of_work(request, commit=False)
+                raise
+            await _finish_unit_of_work(request, commit=response.status_code < 400)
+            return response
+
+        return unit_of_work_handler
@@ -5,7 +5,7 @@ This module provides the user repository with specific methods
 for user-related database operations.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -157,6 +157,34 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def search_users_by_cursor(
+        self, search_term: str, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[User], Optional[str]]:
+        """
+        Search users by username, email, or display name with keyset pagination.
+
+        Args:
+            search_term: Search term to match
+            cursor: Cursor from the previous page, None for the first page
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (matching user instances, next_cursor)
+        """
+        search_pattern = f"%{search_term}%"
+        query = select(User).where(
+            or_(
+                User.username.ilike(search_pattern),
+                User.email.ilike(search_pattern),
+                User.display_name.ilike(search_pattern),
+                User.first_name.ilike(search_pattern),
+                User.last_name.ilike(search_pattern),
+            )
+        )
+        return await self.paginate_by_cursor(
+            query, order_by=(User.id,), cursor=cursor, limit=limit
+        )
+
     async def activate_user(self, user_id: int) -> Optional[User]:
         """
         Activate user by ID.
@@ -170,7 +198,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         user = await self.get(user_id)
         if user:
             user.is_active = True
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(user)
         return user
 
@@ -187,7 +215,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         user = await self.get(user_id)
         if user:
             user.is_active = False
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(user)
         return user
 
@@ -204,7 +232,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         user = await self.get(user_id)
         if user:
             user.is_verified = True
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(user)
         return user
 
@@ -223,6 +251,6 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         user = await self.get(user_id)
         if user:
             user.last_login = datetime.utcnow()
-            await self.db.commit()
+            await self._commit()
             await self.db.refresh(user)
         return user
@@ -6,9 +6,9 @@ including survey management, user management, and system statistics.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select, text
 
 from models.question import Question
@@ -16,14 +16,21 @@ from models.response import Response
 from models.survey import Survey
 from models.user import User
 from schemas.survey import SurveyCreate, SurveyRead, SurveyUpdate
+from schemas.pagination import CursorPage
 from schemas.user import UserResponse
-from repositories.dependencies import get_user_repository, get_survey_repository
+from repositories.base import InvalidCursorError
+from repositories.dependencies import (
+    get_survey_read_repository,
+    get_survey_repository,
+    get_user_repository,
+)
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.user import UserRepository
 from repositories.survey import SurveyRepository
 from routers.auth import get_admin_user
 from schemas.admin import SuccessResponse
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.get("/dashboard", response_model=dict)
@@ -44,11 +51,15 @@ async def get_admin_dashboard(
         responses_count = await survey_repo.db.execute(select(func.count(Response.id)))
         users_count = await user_repo.db.execute(select(func.count(User.id)))
 
-        # Get recent surveys
-        recent_surveys = await survey_repo.get_multi(skip=0, limit=5)
+        # Get recent surveys (plain rows, only the columns shown)
+        recent_surveys = await survey_repo.get_rows(
+            ["id", "title", "is_active", "is_public", "created_at"], limit=5
+        )
 
         # Get recent users
-        recent_users = await user_repo.get_multi(skip=0, limit=5)
+        recent_users = await user_repo.get_rows(
+            ["id", "display_name", "username", "telegram_id", "created_at"], limit=5
+        )
 
         return {
             "statistics": {
@@ -58,23 +69,17 @@ async def get_admin_dashboard(
                 "users_total": users_count.scalar(),
             },
             "recent_surveys": [
-                {
-                    "id": survey.id,
-                    "title": survey.title,
-                    "is_active": survey.is_active,
-                    "is_public": survey.is_public,
-                    "created_at": survey.created_at.isoformat(),
-                }
+                {**survey, "created_at": survey["created_at"].isoformat()}
                 for survey in recent_surveys
             ],
             "recent_users": [
                 {
-                    "id": user.id,
-                    "display_name": user.display_name
-                    or user.username
-                    or f"User {user.id}",
-                    "is_telegram_user": user.telegram_id is not None,
-                    "created_at": user.created_at.isoformat(),
+                    "id": user["id"],
+                    "display_name": user["display_name"]
+                    or user["username"]
+                    or f"User {user['id']}",
+                    "is_telegram_user": user["telegram_id"] is not None,
+                    "created_at": user["created_at"].isoformat(),
                 }
                 for user in recent_users
             ],
@@ -239,22 +244,35 @@ async def delete_survey(
         )
 
 
-@router.get("/surveys/{survey_id}/responses", response_model=list[dict])
+@router.get(
+    "/surveys/{survey_id}/responses",
+    response_model=Union[list[dict], CursorPage[dict]],
+)
 async def get_survey_responses(
     survey_id: int,
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor; pass an empty value for the first page"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Page size in cursor mode"),
     admin_user: User = Depends(get_admin_user),
     survey_repo: SurveyRepository = Depends(get_survey_repository),
 ):
     """
     Get all responses for a survey (admin only).
 
+    Without ``cursor`` all responses are returned ordered by question.
+    With ``cursor`` responses are paged newest first and wrapped in a
+    CursorPage with ``next_cursor``.
+
     Args:
         survey_id: Survey ID
+        cursor: Keyset pagination cursor
+        limit: Page size in cursor mode
         admin_user: Current admin user
         survey_repo: Survey repository
 
     Returns:
-        List of responses
+        List of responses or a page of responses
     """
     try:
         # Check if survey exists
@@ -283,12 +301,23 @@ async def get_survey_responses(
             .select_from(Response)
             .join(Question, Response.question_id == Question.id)
             .outerjoin(User, Response.user_id == User.id)
-            .where(Question.survey_id == survey_id)
-            .order_by(Question.order, Response.created_at.desc())
+            .where(Response.survey_id == survey_id)
         )
 
-        result = await survey_repo.db.execute(query)
-        responses_raw = result.all()
+        next_cursor = None
+        if cursor is not None:
+            responses_raw, next_cursor = await survey_repo.paginate_by_cursor(
+                query,
+                order_by=(Response.created_at, Response.id),
+                cursor=cursor or None,
+                limit=limit,
+                descending=True,
+                scalars=False,
+            )
+        else:
+            query = query.order_by(Question.order, Response.created_at.desc())
+            result = await survey_repo.db.execute(query)
+            responses_raw = result.all()
 
         # Return simple list of responses
         responses_list = []
@@ -309,6 +338,9 @@ async def get_survey_responses(
             }
             responses_list.append(response_data)
 
+        if cursor is not None:
+            return CursorPage[dict](items=responses_list, next_cursor=next_cursor)
+
         # Sort by question order and creation date
         responses_list.sort(key=lambda x: (x["question_order"], x["created_at"]))
 
@@ -316,6 +348,8 @@ async def get_survey_responses(
 
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -327,15 +361,17 @@ async def get_survey_responses(
 async def get_survey_analytics(
     survey_id: int,
     admin_user: User = Depends(get_admin_user),
-    survey_repo: SurveyRepository = Depends(get_survey_repository),
+    survey_repo: SurveyRepository = Depends(get_survey_read_repository),
 ):
     """
     Get survey analytics (admin only).
 
+    Aggregates are read from the read replica when one is configured.
+
     Args:
         survey_id: Survey ID
         admin_user: Current admin user
-        survey_repo: Survey repository
+        survey_repo: Read-only survey repository
 
     Returns:
         Survey analytics data
@@ -358,13 +394,14 @@ async def get_survey_analytics(
                 func.count(func.distinct(Response.user_id)).label(
                     "authenticated_users"
                 ),
-                func.count(func.distinct(Question.id)).label("total_questions"),
+                func.count(func.distinct(Response.question_id)).label(
+                    "total_questions"
+                ),
                 func.min(Response.created_at).label("first_response"),
                 func.max(Response.created_at).label("last_response"),
             )
             .select_from(Response)
-            .join(Question, Response.question_id == Question.id)
-            .where(Question.survey_id == survey_id)
+            .where(Response.survey_id == survey_id)
         )
 
         result = await survey_repo.db.execute(analytics_query)
@@ -374,8 +411,7 @@ async def get_survey_analytics(
         started_query = (
             select(func.count(func.distinct(Response.user_session_id)))
             .select_from(Response)
-            .join(Question, Response.question_id == Question.id)
-            .where(Question.survey_id == survey_id)
+            .where(Response.survey_id == survey_id)
         )
         started_result = await survey_repo.db.execute(started_query)
         started_count = started_result.scalar() or 0
@@ -419,28 +455,51 @@ async def get_survey_analytics(
         )
 
 
-@router.get("/users", response_model=list[UserResponse])
+@router.get(
+    "/users", response_model=Union[list[UserResponse], CursorPage[UserResponse]]
+)
 async def get_all_users(
     skip: int = 0,
     limit: int = 100,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor; pass an empty value for the first page"
+    ),
     admin_user: User = Depends(get_admin_user),
     user_repo: UserRepository = Depends(get_user_repository),
 ):
     """
     Get all users (admin only).
 
+    With ``cursor`` the result is a CursorPage paged by user ID and
+    ``skip`` is ignored; without it the offset list is returned as before.
+
     Args:
         skip: Number of users to skip
         limit: Maximum number of users to return
         search: Search term for filtering users
+        cursor: Keyset pagination cursor
         admin_user: Current admin user
         user_repo: User repository
 
     Returns:
-        List of users
+        List of users or a page of users
     """
     try:
+        if cursor is not None:
+            if search:
+                users, next_cursor = await user_repo.search_users_by_cursor(
+                    search, cursor=cursor or None, limit=limit
+                )
+            else:
+                users, next_cursor = await user_repo.get_multi_by_cursor(
+                    cursor=cursor or None, limit=limit
+                )
+            return CursorPage[UserResponse](
+                items=[UserResponse.model_validate(user) for user in users],
+                next_cursor=next_cursor,
+            )
+
         if search:
             users = await user_repo.search_users(search, skip=skip, limit=limit)
         else:
@@ -448,6 +507,8 @@ async def get_all_users(
 
         return [UserResponse.model_validate(user) for user in users]
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
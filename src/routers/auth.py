@@ -21,11 +21,12 @@ from schemas.user import (
     RefreshTokenRequest,
 )
 from repositories.dependencies import get_user_repository
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.user import UserRepository
 from schemas.admin import SuccessResponse
 from services.jwt_service import jwt_service
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 security = HTTPBearer()
 
 
@@ -41,8 +41,11 @@ except ImportError as e:
         return None
 
 
+from database import get_pool_metrics, get_slow_queries, slow_query_log
 from models.user import User
+from services.ingestion_buffer import ingestion_buffer
 from services.jwt_service import get_current_user
+from services.survey_snapshot import survey_snapshot_cache
 
 logger = logging.getLogger(__name__)
 
@@ -329,6 +332,97 @@ async def resolve_alert(alert_id: str, current_user: User = Depends(get_current_
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/database/pool")
+async def get_database_pool_metrics(current_user: User = Depends(get_current_user)):
+    """Get database connection pool metrics."""
+    try:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        return get_pool_metrics()
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting database pool metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/database/ingestion")
+async def get_ingestion_buffer_metrics(current_user: User = Depends(get_current_user)):
+    """Get write-behind ingestion buffer metrics."""
+    try:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        if ingestion_buffer is None:
+            return {"enabled": False}
+        return {"enabled": True, **ingestion_buffer.stats()}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting ingestion buffer metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/database/queries")
+async def get_database_query_stats(current_user: User = Depends(get_current_user)):
+    """Get per-endpoint SQL query counts and database time."""
+    try:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        monitoring_service = get_monitoring_service()
+
+        return {"operations": monitoring_service.get_query_stats()}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting database query stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/database/slow-queries")
+async def get_database_slow_queries(
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Maximum number of entries to return"
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """Get recent slow SQL statements with their query plans."""
+    try:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        return get_slow_queries(limit)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting slow queries: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/database/slow-queries")
+async def clear_database_slow_queries(current_user: User = Depends(get_current_user)):
+    """Clear the slow query log."""
+    try:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        slow_query_log.clear()
+
+        return {"success": True, "message": "Slow query log cleared"}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error clearing slow queries: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/cache/stats")
 async def get_cache_stats(current_user: User = Depends(get_current_user)):
     """Get Redis cache statistics."""
@@ -351,6 +445,24 @@ async def get_cache_stats(current_user: User = Depends(get_current_user)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache/surveys")
+async def get_survey_snapshot_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """Get survey snapshot cache hit/miss statistics."""
+    try:
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        return survey_snapshot_cache.stats()
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting survey snapshot cache stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/cache/flush")
 async def flush_cache(
     pattern: Optional[str] = None, current_user: User = Depends(get_current_user)
@@ -10,6 +10,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 
+from config import settings
 from models.user import User
 from services.jwt_service import get_current_user
 from services.realtime_notifications import (
@@ -18,11 +19,20 @@ from services.realtime_notifications import (
     NotificationType,
     get_notification_service,
 )
+from services.rate_limiter import RateLimiter, current_user_key
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+# A broadcast fans out to every connected user
+broadcast_rate_limit = RateLimiter(
+    settings.broadcast_rate_limit_per_minute,
+    60,
+    scope="notifications:broadcast",
+    key_func=current_user_key,
+)
+
 
 @router.websocket("/ws/{user_id}")
 async def websocket_endpoint(websocket: WebSocket, user_id: int):
@@ -168,7 +178,7 @@ async def get_notification_stats(current_user: User = Depends(get_current_user))
         raise HTTPException(status_code=500, detail="Failed to get stats")
 
 
-@router.post("/broadcast")
+@router.post("/broadcast", dependencies=[Depends(broadcast_rate_limit)])
 async def broadcast_notification(
     notification_data: dict[str, Any], current_user: User = Depends(get_current_user)
 ):
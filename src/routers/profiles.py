@@ -15,6 +15,7 @@ from repositories.dependencies import (
     get_profile_repository,
     get_user_repository,
 )
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.profile import ProfileRepository
 from repositories.user import UserRepository
 from routers.auth import get_current_user
@@ -28,7 +29,9 @@ from schemas.profile import (
 )
 from services.profile_service import ProfileService
 
-router = APIRouter(prefix="/profiles", tags=["profiles"])
+router = APIRouter(
+    prefix="/profiles", tags=["profiles"], route_class=UnitOfWorkRoute
+)
 
 
 # Request/Response models
@@ -8,6 +8,7 @@ from repositories.dependencies import (
     get_push_notification_repository,
     get_notification_analytics_repository,
 )
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.push_notification import (
     PushSubscriptionRepository,
     PushNotificationRepository,
@@ -26,7 +27,9 @@ from schemas.push_notification import (
 )
 from services.push_notification_service import push_service
 
-router = APIRouter(prefix="/notifications", tags=["Push Notifications"])
+router = APIRouter(
+    prefix="/notifications", tags=["Push Notifications"], route_class=UnitOfWorkRoute
+)
 
 
 @router.get("/vapid-key", response_model=VapidKeyResponse)
@@ -12,7 +12,10 @@ from sqlalchemy import text
 from models.survey import Survey
 from models.user import User
 from schemas.user import UserResponse
-from repositories.dependencies import get_survey_repository, get_user_repository
+from repositories.dependencies import (
+    get_survey_read_repository,
+    get_user_read_repository,
+)
 from repositories.survey import SurveyRepository
 from repositories.user import UserRepository
 from routers.auth import get_admin_user, get_current_user
@@ -25,7 +28,7 @@ router = APIRouter()
 async def generate_survey_pdf_report(
     survey_id: int,
     admin_user: User = Depends(get_admin_user),
-    survey_repo: SurveyRepository = Depends(get_survey_repository),
+    survey_repo: SurveyRepository = Depends(get_survey_read_repository),
 ):
     """
     Generate PDF report for a survey (admin only).
@@ -72,7 +75,7 @@ async def generate_survey_pdf_report(
             FROM response r
             JOIN question q ON r.question_id = q.id
             LEFT JOIN user u ON r.user_id = u.id
-            WHERE q.survey_id = :survey_id
+            WHERE r.survey_id = :survey_id
             ORDER BY r.created_at DESC
         """
         )
@@ -111,12 +114,11 @@ async def generate_survey_pdf_report(
                 COUNT(DISTINCT r.user_session_id) as unique_respondents,
                 COUNT(r.id) as total_responses,
                 COUNT(DISTINCT r.user_id) as authenticated_users,
-                COUNT(DISTINCT q.id) as total_questions,
+                COUNT(DISTINCT r.question_id) as total_questions,
                 MIN(r.created_at) as first_response,
                 MAX(r.created_at) as last_response
             FROM response r
-            JOIN question q ON r.question_id = q.id
-            WHERE q.survey_id = :survey_id
+            WHERE r.survey_id = :survey_id
         """
         )
 
@@ -132,18 +134,16 @@ async def generate_survey_pdf_report(
                 COUNT(DISTINCT r.user_session_id) as started,
                 COUNT(DISTINCT CASE WHEN complete_sessions.session_id IS NOT NULL THEN r.user_session_id END) as completed
             FROM response r
-            JOIN question q ON r.question_id = q.id
             LEFT JOIN (
                 SELECT r2.user_session_id as session_id
                 FROM response r2
-                JOIN question q2 ON r2.question_id = q2.id
-                WHERE q2.survey_id = :survey_id
+                WHERE r2.survey_id = :survey_id
                 GROUP BY r2.user_session_id
-                HAVING COUNT(DISTINCT q2.id) = (
+                HAVING COUNT(DISTINCT r2.question_id) = (
                     SELECT COUNT(id) FROM question WHERE survey_id = :survey_id
                 )
             ) complete_sessions ON r.user_session_id = complete_sessions.session_id
-            WHERE q.survey_id = :survey_id
+            WHERE r.survey_id = :survey_id
         """
         )
 
@@ -197,7 +197,7 @@ async def generate_survey_pdf_report(
 async def generate_user_pdf_report(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    user_repo: UserRepository = Depends(get_user_repository),
+    user_repo: UserRepository = Depends(get_user_read_repository),
 ):
     """
     Generate PDF report for a user (user can only generate for themselves unless admin).
@@ -254,7 +254,7 @@ async def generate_user_pdf_report(
                 s.is_public
             FROM response r
             JOIN question q ON r.question_id = q.id
-            JOIN survey s ON q.survey_id = s.id
+            JOIN survey s ON r.survey_id = s.id
             WHERE r.user_id = :user_id
             ORDER BY r.created_at DESC
         """
@@ -290,12 +290,10 @@ async def generate_user_pdf_report(
             """
             SELECT
                 COUNT(r.id) as total_responses,
-                COUNT(DISTINCT s.id) as surveys_participated,
+                COUNT(DISTINCT r.survey_id) as surveys_participated,
                 MIN(r.created_at) as first_response,
                 MAX(r.created_at) as last_response
             FROM response r
-            JOIN question q ON r.question_id = q.id
-            JOIN survey s ON q.survey_id = s.id
             WHERE r.user_id = :user_id
         """
         )
@@ -340,7 +338,7 @@ async def generate_user_pdf_report(
 @router.get("/my-responses/pdf")
 async def generate_my_responses_pdf_report(
     current_user: User = Depends(get_current_user),
-    user_repo: UserRepository = Depends(get_user_repository),
+    user_repo: UserRepository = Depends(get_user_read_repository),
 ):
     """
     Generate PDF report for current user's responses.
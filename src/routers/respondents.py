@@ -17,6 +17,7 @@ from repositories.dependencies import (
     get_consent_log_repository,
     get_user_repository,
 )
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.respondent import RespondentRepository
 from repositories.respondent_event import RespondentEventRepository
 from repositories.consent_log import ConsentLogRepository
@@ -35,7 +36,9 @@ from schemas.respondent import (
 from schemas.consent_log import ConsentLogCreate, ConsentLogResponse
 from services.respondent_service import RespondentService
 
-router = APIRouter(prefix="/respondents", tags=["respondents"])
+router = APIRouter(
+    prefix="/respondents", tags=["respondents"], route_class=UnitOfWorkRoute
+)
 
 
 # Request/Response models
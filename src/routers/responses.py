@@ -6,12 +6,21 @@ with immediate save functionality and no edit capability.
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import JSONResponse
 
+from config import settings
 from models.question import Question
-from models.response import Response, ResponseCreate, ResponseRead, ResponseValidate
+from models.response import (
+    Response,
+    ResponseBatchCreate,
+    ResponseBatchResult,
+    ResponseCreate,
+    ResponseRead,
+    ResponseValidate,
+)
 from models.survey import Survey
 from models.respondent import Respondent, RespondentCreate
 from repositories.dependencies import (
@@ -23,6 +32,7 @@ from repositories.dependencies import (
     get_consent_log_repository,
     get_user_repository,
 )
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.response import ResponseRepository
 from repositories.question import QuestionRepository
 from repositories.survey import SurveyRepository
@@ -30,9 +40,17 @@ from repositories.respondent import RespondentRepository
 from repositories.respondent_event import RespondentEventRepository
 from repositories.consent_log import ConsentLogRepository
 from repositories.user import UserRepository
+from services.answer_validation import answer_validators
+from services.ingestion_buffer import IngestionBufferFull, get_ingestion_buffer
+from services.redis_service import get_redis_service
+from services.respondent_resolver import RespondentResolver
 from services.respondent_service import RespondentService
+from services.response_submission import (
+    ResponseSubmissionService,
+    get_response_submission_service,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 logger = logging.getLogger(__name__)
 
@@ -52,42 +70,62 @@ async def get_respondent_service(
     )
 
 
+async def get_respondent_resolver(
+    respondent_repo: RespondentRepository = Depends(get_respondent_repository),
+) -> RespondentResolver:
+    """Get RespondentResolver instance, backed by Redis when enabled."""
+    redis_service = None
+    if settings.respondent_cache_redis:
+        redis_service = await get_redis_service()
+    return RespondentResolver(respondent_repo, redis_service)
+
+
 @router.post("/", response_model=ResponseRead)
 async def create_response(
     response_data: ResponseCreate,
     request: Request,
     response_repo: ResponseRepository = Depends(get_response_repository),
     question_repo: QuestionRepository = Depends(get_question_repository),
-    respondent_repo: RespondentRepository = Depends(get_respondent_repository),
+    respondent_resolver: RespondentResolver = Depends(get_respondent_resolver),
     respondent_service: RespondentService = Depends(get_respondent_service),
+    idempotency_key: Optional[str] = Header(
+        None, alias="Idempotency-Key", max_length=255
+    ),
 ):
     """
     Create a new response (immediate save).
 
     Saves the response immediately without validation for edit capability.
     Once saved, responses cannot be modified.
+
+    With an ``Idempotency-Key`` header, retries of the same request return
+    the stored response instead of failing as duplicates.
     """
     try:
-        # First validate that the question exists
-        question = await question_repo.get(response_data.question_id)
+        if idempotency_key:
+            # Retries are answered with a single indexed lookup
+            stored = await response_repo.get_by_idempotency_key(idempotency_key)
+            if stored:
+                return _replay_response(stored, response_data)
 
-        if not question:
-            raise HTTPException(status_code=404, detail="Question not found")
-
-        # ФИКС: Сохраняем question_type заранее, чтобы избежать MissingGreenlet в логах
-        question_type = question.question_type
+        # Question and survey fields in one cached lookup
+        context = await question_repo.get_answer_context(response_data.question_id)
 
-        # Get survey to check if it's active
-        survey = await question_repo.get_survey_by_question_id(
-            response_data.question_id
-        )
+        if not context:
+            raise HTTPException(status_code=404, detail="Question not found")
 
-        if not survey or not survey.is_active:
+        if not context.survey_is_active:
             raise HTTPException(status_code=400, detail="Survey is not active")
 
+        # Validate response data with the question's compiled validator
+        if not answer_validators.validate(context, response_data.answer):
+            raise HTTPException(
+                status_code=400, detail="Invalid response data for question type"
+            )
+
         # Get or create respondent if not provided
         if not response_data.respondent_id:
-            # Создаем минимального анонимного респондента через репозиторий
+            # Один анонимный респондент на сессию, создаётся при первом ответе
             respondent_data = RespondentCreate(
                 session_id=response_data.user_session_id,
                 is_anonymous=response_data.user_id is None,
@@ -97,37 +135,96 @@ async def create_response(
                 entry_point="web",
             )
 
-            respondent = await respondent_repo.create(obj_in=respondent_data)
-            response_data.respondent_id = respondent.id
+            response_data.respondent_id = await respondent_resolver.resolve(
+                respondent_data
+            )
 
-        # Check if response already exists for this question and respondent
-        existing_response = await response_repo.get_by_question_and_session(
-            response_data.question_id, response_data.user_session_id
+        # Create the response; the unique (question_id, user_session_id)
+        # constraint rejects duplicates, including concurrent ones
+        response, created = await response_repo.create_if_absent(
+            obj_in=response_data,
+            idempotency_key=idempotency_key,
+            survey_id=context.survey_id,
         )
 
-        if existing_response:
+        if not created:
+            if (
+                idempotency_key
+                and response is not None
+                and response.idempotency_key == idempotency_key
+            ):
+                # A concurrent retry of this request won the insert
+                return _replay_response(response, response_data)
             raise HTTPException(
                 status_code=400,
                 detail="Response already exists for this question. Editing is not allowed.",
             )
 
-        # Validate response data based on question type
-        validation_result = _validate_response_data(question_type, response_data.answer)
+        return ResponseRead.model_validate(response)
 
-        if not validation_result:
-            raise HTTPException(
-                status_code=400, detail="Invalid response data for question type"
-            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create response: {e!s}")
 
-        # Create the response
-        response = await response_repo.create(obj_in=response_data)
 
-        return ResponseRead.model_validate(response)
+@router.post("/batch", response_model=ResponseBatchResult)
+async def create_responses_batch(
+    batch: ResponseBatchCreate,
+    request: Request,
+    submission_service: ResponseSubmissionService = Depends(
+        get_response_submission_service
+    ),
+    respondent_resolver: RespondentResolver = Depends(get_respondent_resolver),
+    prefer: Optional[str] = Header(None),
+):
+    """
+    Create all answers of a survey session at once.
+
+    Answers are validated in one pass against the survey's questions and
+    stored with one multi-row insert in a single transaction. Each answer
+    gets its own result; invalid or duplicate answers do not block the
+    others.
 
+    With ``Prefer: respond-async`` and the ingestion buffer enabled, valid
+    answers are queued for a background group commit and the endpoint
+    answers 202 right away, or 503 while the buffer is full.
+    """
+    buffer = get_ingestion_buffer() if prefer and "respond-async" in prefer else None
+    try:
+        if not batch.respondent_id:
+            batch.respondent_id = await respondent_resolver.resolve(
+                RespondentCreate(
+                    session_id=batch.user_session_id,
+                    is_anonymous=batch.user_id is None,
+                    user_id=batch.user_id,
+                    ip_address=request.client.host if request.client else "unknown",
+                    user_agent=request.headers.get("user-agent"),
+                    entry_point="web",
+                )
+            )
+
+        result = await submission_service.submit_batch(
+            batch.survey_id,
+            batch.user_session_id,
+            batch.answers,
+            user_id=batch.user_id,
+            respondent_id=batch.respondent_id,
+            validators=answer_validators,
+            buffer=buffer,
+        )
+        if buffer is not None:
+            return JSONResponse(status_code=202, content=result.model_dump())
+        return result
+
+    except IngestionBufferFull as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to create response: {e!s}")
+        raise HTTPException(status_code=500, detail=f"Failed to create responses: {e!s}")
 
 
 @router.get("/question/{question_id}", response_model=list[ResponseRead])
@@ -144,14 +241,12 @@ async def get_responses_by_question(
     """
     try:
         # First check if question exists and belongs to public survey
-        question = await question_repo.get(question_id)
+        context = await question_repo.get_answer_context(question_id)
 
-        if not question:
+        if not context:
             raise HTTPException(status_code=404, detail="Question not found")
 
-        # Get survey to check if it's public
-        survey = await question_repo.get_survey_by_question_id(question_id)
-        if not survey or not survey.is_public:
+        if not context.survey_is_public:
             raise HTTPException(
                 status_code=403, detail="Cannot access responses for private survey"
             )
@@ -215,13 +310,15 @@ async def get_survey_progress(
                 status_code=404, detail="Survey not found or not publicly accessible"
             )
 
-        # Get all questions for this survey
-        questions = await question_repo.get_by_survey_id(survey_id)
+        # Get all questions for this survey (without question_data/options)
+        questions = await question_repo.get_by_survey_id(
+            survey_id, fields=["title", "order", "question_type"]
+        )
         total_questions = len(questions)
 
-        # Get user responses for this survey
+        # Get user responses for this survey (without answer payloads)
         user_responses = await response_repo.get_by_user_session_and_survey(
-            user_session_id, survey_id
+            user_session_id, survey_id, fields=["question_id", "created_at"]
         )
 
         answered_questions = len(user_responses)
@@ -290,17 +387,12 @@ async def validate_response_before_save(
         if not question:
             raise HTTPException(status_code=404, detail="Question not found")
 
-        # Get survey to check if it's active
-        survey = await question_repo.get_survey_by_question_id(
-            validation_data.question_id
-        )
-        if not survey or not survey.is_active:
+        context = await question_repo.get_answer_context(validation_data.question_id)
+        if not context or not context.survey_is_active:
             raise HTTPException(status_code=400, detail="Survey is not active")
 
         # Validate response data
-        is_valid = _validate_response_data(
-            question.question_type, validation_data.answer
-        )
+        is_valid = answer_validators.validate(context, validation_data.answer)
         validation_message = (
             None
             if is_valid
@@ -321,160 +413,21 @@ async def validate_response_before_save(
         raise HTTPException(status_code=500, detail=f"Validation failed: {e!s}")
 
 
-def _validate_response_data(question_type: str, answer: dict[str, Any]) -> bool:
+def _replay_response(response: Response, response_data: ResponseCreate) -> ResponseRead:
     """
-    Validate response data based on question type.
-
-    Args:
-        question_type: Question type
-        answer: Response answer data
+    Return a response stored under an Idempotency-Key.
 
-    Returns:
-        True if valid, False otherwise
+    The key must have been used for the same question and session.
     """
-    try:
-        if question_type in ["TEXT", "text"]:
-            # Text questions require a string value
-            value = answer.get("value")
-            return isinstance(value, str) and len(value.strip()) > 0
-
-        elif question_type in ["YES_NO", "boolean"]:
-            # Boolean questions require a boolean value
-            value = answer.get("value")
-            # Accept both boolean and string boolean values
-            if isinstance(value, bool):
-                return True
-            elif isinstance(value, str):
-                return value.lower() in ["true", "false", "yes", "no"]
-            return False
-
-        elif question_type in ["RATING_1_10", "rating"]:
-            # Rating questions require a numeric value within range
-            value = answer.get("value")
-            if not isinstance(value, (int, float)):
-                return False
-
-            # Default range for RATING_1_10 is 1-10
-            min_rating = 1
-            max_rating = 10
-            return min_rating <= value <= max_rating
-
-        elif question_type == "EMAIL":
-            # Email questions require a valid email format
-            email_value = answer.get("value")
-            if not isinstance(email_value, str):
-                return False
-
-            import re
-
-            email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-            return re.match(email_pattern, email_value) is not None
-
-        elif question_type == "PHONE":
-            # Phone questions require a valid phone number format
-            phone_value = answer.get("value")
-            if not isinstance(phone_value, str):
-                return False
-
-            import re
-
-            # Basic phone validation (digits, spaces, hyphens, plus, parentheses)
-            phone_pattern = r"^\+?[\d\s\-\(\)]{7,15}$"
-            return re.match(phone_pattern, phone_value) is not None
-
-        elif question_type == "IMAGE_UPLOAD":
-            # Image upload requires file data
-            file_data = answer.get("file")
-            if not file_data:
-                return False
-
-            # Check if file has required properties
-            return (
-                isinstance(file_data, dict)
-                and "filename" in file_data
-                and "content_type" in file_data
-                and file_data.get("content_type", "").startswith("image/")
-            )
-
-        elif question_type == "FILE_UPLOAD":
-            # File upload requires file data
-            file_data = answer.get("file")
-            if not file_data:
-                return False
-
-            # Check if file has required properties
-            return (
-                isinstance(file_data, dict)
-                and "filename" in file_data
-                and "content_type" in file_data
-                and len(file_data.get("filename", "")) > 0
-            )
-
-        elif question_type == "GEOLOCATION":
-            # Geolocation requires latitude and longitude
-            location = answer.get("location")
-            if not isinstance(location, dict):
-                return False
-
-            lat = location.get("latitude")
-            lng = location.get("longitude")
-
-            return (
-                isinstance(lat, (int, float))
-                and isinstance(lng, (int, float))
-                and -90 <= lat <= 90
-                and -180 <= lng <= 180
-            )
-
-        elif question_type == "NFC_SCAN":
-            # NFC scan requires tag data
-            nfc_data = answer.get("nfc_data")
-            if not isinstance(nfc_data, dict):
-                return False
-
-            # Check if NFC data has required properties
-            return (
-                "tag_id" in nfc_data
-                and "tag_type" in nfc_data
-                and len(nfc_data.get("tag_id", "")) > 0
-            )
-
-        elif question_type == "multiple_choice":
-            # Multiple choice requires a selected option
-            selected = answer.get("selected")
-            if not selected:
-                return False
-
-            # Check if selected option exists in question options
-            question_data = question.question_data or {}
-            options = question_data.get("options", [])
-            return any(opt.get("id") == selected for opt in options)
-
-        elif question_type == "date":
-            # Date questions require a valid date string
-            date_value = answer.get("value")
-            if not isinstance(date_value, str):
-                return False
-
-            try:
-                from datetime import datetime
-
-                datetime.fromisoformat(date_value.replace("Z", "+00:00"))
-                return True
-            except (ValueError, TypeError):
-                return False
-
-        elif question_type == "number":
-            # Number questions require a numeric value
-            value = answer.get("value")
-            return isinstance(value, (int, float))
-
-        else:
-            # Unknown question type - assume valid for now
-            return True
-
-    except Exception:
-        return False
+    if (
+        response.question_id != response_data.question_id
+        or response.user_session_id != response_data.user_session_id
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used for a different request",
+        )
+    return ResponseRead.model_validate(response)
 
 
 def _get_validation_message(question: Question, answer: dict[str, Any]) -> str:
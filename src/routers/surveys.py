@@ -5,7 +5,10 @@ This module contains FastAPI endpoints for managing surveys,
 including public and private surveys with access token support.
 """
 
+from typing import Optional, Union
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -20,42 +23,64 @@ from models.survey import (
     SurveyUpdate,
 )
 from models.user import User
+from repositories.base import InvalidCursorError
 from repositories.dependencies import (
     get_survey_repository,
+    get_survey_read_repository,
     get_question_repository,
     get_user_repository,
 )
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.survey import SurveyRepository
 from repositories.question import QuestionRepository
 from repositories.user import UserRepository
 from routers.auth import get_current_user
+from schemas.pagination import CursorPage
+from services.survey_snapshot import survey_snapshot_cache
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 security = HTTPBearer()
 
 
-@router.get("/active", response_model=list[dict])
+@router.get("/active", response_model=Union[list[dict], CursorPage[dict]])
 async def get_active_public_surveys(
     survey_repo: SurveyRepository = Depends(get_survey_repository),
     question_repo: QuestionRepository = Depends(get_question_repository),
     skip: int = Query(0, ge=0, description="Skip surveys"),
     limit: int = Query(10, ge=1, le=100, description="Limit results"),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor; pass an empty value for the first page"
+    ),
 ):
     """
     Get active public surveys.
 
     Returns a list of active public surveys that users can participate in.
-    Private surveys are not included in this endpoint.
+    Private surveys are not included in this endpoint. With ``cursor`` the
+    surveys are paged by ID and wrapped in a CursorPage with ``next_cursor``.
     """
     try:
-        # Query for active public surveys using repository method
-        surveys = await survey_repo.get_active_public_surveys(skip=skip, limit=limit)
+        next_cursor = None
+        if cursor is not None:
+            page = await survey_repo.get_active_public_surveys_by_cursor(
+                cursor=cursor or None, limit=limit
+            )
+            surveys, next_cursor = page
+        else:
+            # Query for active public surveys using repository method
+            surveys = await survey_repo.get_active_public_surveys(
+                skip=skip, limit=limit
+            )
+
+        # Load questions of all surveys with one query
+        questions_by_survey = await question_repo.load_by_survey_ids(
+            [survey.id for survey in surveys]
+        )
 
         # Convert to dict with questions count
         survey_list = []
         for survey in surveys:
-            # Get questions for this survey
-            questions = await question_repo.get_by_survey_id(survey.id)
+            questions = questions_by_survey[survey.id]
 
             survey_dict = {
                 "id": survey.id,
@@ -76,8 +101,13 @@ async def get_active_public_surveys(
             }
             survey_list.append(survey_dict)
 
+        if cursor is not None:
+            return CursorPage[dict](items=survey_list, next_cursor=next_cursor)
+
         return survey_list
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch active surveys: {e!s}"
@@ -97,31 +127,21 @@ async def get_survey_by_id(
     For private surveys, use the access token endpoint.
     """
     try:
-        # Get survey using repository
-        survey = await survey_repo.get(survey_id)
+        # Cached snapshot of the survey with ordered questions
+        snapshot = await survey_snapshot_cache.get_by_id(
+            survey_id, survey_repo, question_repo
+        )
 
-        if not survey:
+        if not snapshot:
             raise HTTPException(status_code=404, detail="Survey not found")
 
         # Check if survey is public and active
-        if not survey.is_public or not survey.is_active:
+        if not snapshot["is_public"] or not snapshot["is_active"]:
             raise HTTPException(
                 status_code=404, detail="Survey not found or not publicly accessible"
             )
 
-        # Get questions for this survey
-        questions = await question_repo.get_by_survey_id(survey_id)
-
-        # Sort questions by order
-        questions.sort(key=lambda q: q.order)
-
-        # Create response with questions
-        survey_with_questions = SurveyReadWithQuestions(
-            **SurveyRead.model_validate(survey).model_dump(),
-            questions=[QuestionRead.model_validate(q).model_dump() for q in questions],
-        )
-
-        return survey_with_questions
+        return JSONResponse(content=snapshot)
 
     except HTTPException:
         raise
@@ -142,27 +162,17 @@ async def get_private_survey(
     Works for both public and private surveys.
     """
     try:
-        # Get survey by access token using repository
-        survey = await survey_repo.get_by_access_token(access_token)
+        # Cached snapshot of the survey with ordered questions
+        snapshot = await survey_snapshot_cache.get_by_token(
+            access_token, survey_repo, question_repo
+        )
 
-        if not survey or not survey.is_active:
+        if not snapshot or not snapshot["is_active"]:
             raise HTTPException(
                 status_code=404, detail="Survey not found or access token invalid"
             )
 
-        # Get questions for this survey
-        questions = await question_repo.get_by_survey_id(survey.id)
-
-        # Sort questions by order
-        questions.sort(key=lambda q: q.order)
-
-        # Create response with questions
-        survey_with_questions = SurveyReadWithQuestions(
-            **SurveyRead.model_validate(survey).model_dump(),
-            questions=[QuestionRead.model_validate(q).model_dump() for q in questions],
-        )
-
-        return survey_with_questions
+        return JSONResponse(content=snapshot)
 
     except HTTPException:
         raise
@@ -185,23 +195,19 @@ async def get_survey_questions(
     """
     try:
         # Check if survey exists and is public
-        survey = await survey_repo.get(survey_id)
+        snapshot = await survey_snapshot_cache.get_by_id(
+            survey_id, survey_repo, question_repo
+        )
 
-        if not survey:
+        if not snapshot:
             raise HTTPException(status_code=404, detail="Survey not found")
 
-        if not survey.is_public or not survey.is_active:
+        if not snapshot["is_public"] or not snapshot["is_active"]:
             raise HTTPException(
                 status_code=404, detail="Survey not found or not publicly accessible"
             )
 
-        # Get questions for this survey
-        questions = await question_repo.get_by_survey_id(survey_id)
-
-        # Sort questions by order
-        questions.sort(key=lambda q: q.order)
-
-        return [QuestionRead.model_validate(q) for q in questions]
+        return JSONResponse(content=snapshot["questions"])
 
     except HTTPException:
         raise
@@ -224,20 +230,16 @@ async def get_private_survey_questions(
     """
     try:
         # Get survey by access token
-        survey = await survey_repo.get_by_access_token(access_token)
+        snapshot = await survey_snapshot_cache.get_by_token(
+            access_token, survey_repo, question_repo
+        )
 
-        if not survey or not survey.is_active:
+        if not snapshot or not snapshot["is_active"]:
             raise HTTPException(
                 status_code=404, detail="Survey not found or access token invalid"
             )
 
-        # Get questions for this survey
-        questions = await question_repo.get_by_survey_id(survey.id)
-
-        # Sort questions by order
-        questions.sort(key=lambda q: q.order)
-
-        return [QuestionRead.model_validate(q) for q in questions]
+        return JSONResponse(content=snapshot["questions"])
 
     except HTTPException:
         raise
@@ -250,7 +252,7 @@ async def get_private_survey_questions(
 @router.get("/{survey_id}/stats")
 async def get_survey_stats(
     survey_id: int,
-    survey_repo: SurveyRepository = Depends(get_survey_repository),
+    survey_repo: SurveyRepository = Depends(get_survey_read_repository),
 ):
     """
     Get survey statistics.
@@ -12,21 +12,27 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
+from models.response import ResponseBatchItem
 from models.user import User
 from repositories.dependencies import (
-    get_question_repository,
     get_response_repository,
     get_survey_repository,
 )
-from repositories.question import QuestionRepository
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.response import ResponseRepository
 from repositories.survey import SurveyRepository
 from routers.auth import get_current_user
+from services.response_submission import (
+    ResponseSubmissionService,
+    get_response_submission_service,
+)
 from services.telegram_webapp import get_webapp_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/telegram/webapp", tags=["telegram-webapp"])
+router = APIRouter(
+    prefix="/telegram/webapp", tags=["telegram-webapp"], route_class=UnitOfWorkRoute
+)
 
 
 class WebAppAuthRequest(BaseModel):
@@ -116,51 +122,24 @@ async def submit_survey_answers(
     survey_id: int,
     answer_request: SurveyAnswerRequest,
     current_user: User = Depends(get_current_user),
-    question_repo: QuestionRepository = Depends(get_question_repository),
-    response_repo: ResponseRepository = Depends(get_response_repository),
+    submission_service: ResponseSubmissionService = Depends(
+        get_response_submission_service
+    ),
 ):
     """Submit survey answers from Telegram Web App."""
     try:
-        # Get survey questions using repository
-        questions = await question_repo.get_by_survey_id(survey_id)
-
-        if not questions:
-            raise HTTPException(status_code=404, detail="Survey not found")
-
-        # Convert to dict for easier access
-        questions_dict = {q.id: q for q in questions}
-
-        # Save responses
-        saved_responses = []
-
-        for question_id, answer in answer_request.answers.items():
-            if question_id not in questions_dict:
-                continue
-
-            # Check if response already exists
-            existing_response = await response_repo.get_by_question_and_user(
-                question_id, current_user.id
-            )
-
-            if existing_response:
-                # Update existing response
-                existing_response.answer = {"value": answer}
-                updated_response = await response_repo.update(
-                    db_obj=existing_response, obj_in={"answer": {"value": answer}}
-                )
-                saved_responses.append(updated_response)
-            else:
-                # Create new response
-                from models.response import ResponseCreate
-
-                response_data = ResponseCreate(
-                    question_id=question_id,
-                    user_id=current_user.id,
-                    user_session_id=f"webapp_{current_user.id}",
-                    answer={"value": answer},
-                )
-                new_response = await response_repo.create(obj_in=response_data)
-                saved_responses.append(new_response)
+        # Re-submitted answers replace the earlier ones
+        result = await submission_service.submit_batch(
+            survey_id,
+            f"webapp_{current_user.id}",
+            [
+                ResponseBatchItem(question_id=question_id, answer={"value": answer})
+                for question_id, answer in answer_request.answers.items()
+            ],
+            user_id=current_user.id,
+            overwrite_answer=True,
+            require_active=False,
+        )
 
         # Send completion notification
         from services.realtime_notifications import get_notification_service
@@ -176,7 +155,7 @@ async def submit_survey_answers(
 
         return {
             "success": True,
-            "saved_responses": len(saved_responses),
+            "saved_responses": result.saved,
             "message": "Ответы сохранены успешно",
         }
 
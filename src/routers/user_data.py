@@ -9,11 +9,12 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 from models.user_data import UserData, UserDataCreate, UserDataRead, UserDataUpdate
 from repositories.dependencies import get_user_data_repository
+from repositories.unit_of_work import UnitOfWorkRoute
 from repositories.user_data import UserDataRepository
 from schemas.validation import BrowserFingerprint, UserSessionData
 from schemas.admin import SuccessResponse
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/", response_model=UserDataRead)
@@ -5,8 +5,9 @@ This module contains FastAPI endpoints for validating emails,
 phone numbers, and other user input data.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
+from config import settings
 from schemas.validation import (
     EmailValidationRequest,
     EmailValidationResponse,
@@ -14,9 +15,15 @@ from schemas.validation import (
     PhoneValidationResponse,
 )
 from services.email_validation import email_validator
+from services.rate_limiter import RateLimiter
 
 router = APIRouter()
 
+# Batch validation may do up to 100 MX/SMTP lookups per request
+email_batch_rate_limit = RateLimiter(
+    settings.email_batch_rate_limit_per_minute, 60, scope="validation:email_batch"
+)
+
 
 @router.post("/email", response_model=EmailValidationResponse)
 async def validate_email_endpoint(request: EmailValidationRequest):
@@ -50,7 +57,7 @@ async def validate_email_endpoint(request: EmailValidationRequest):
         raise HTTPException(status_code=500, detail=f"Email validation failed: {e!s}")
 
 
-@router.post("/email/batch")
+@router.post("/email/batch", dependencies=[Depends(email_batch_rate_limit)])
 async def validate_emails_batch(
     emails: list[str],
     check_mx: bool = True,
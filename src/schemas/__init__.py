@@ -149,6 +149,7 @@ from .survey_data_requirements import (
     SurveyDataRequirementsBulkResult,
     SurveyDataRequirementsAudit,
 )
+from .pagination import CursorPage
 
 __all__ = [
     # User schemas
@@ -286,4 +287,6 @@ __all__ = [
     "SurveyDataRequirementsBulkUpdate",
     "SurveyDataRequirementsBulkResult",
     "SurveyDataRequirementsAudit",
+    # Pagination schemas
+    "CursorPage",
 ]
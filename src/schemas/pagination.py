@@ -0,0 +1,21 @@
+"""
+Pagination schemas for the Quiz App.
+
+This module contains the response envelope used by list endpoints
+in keyset (cursor) pagination mode.
+"""
+
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+ItemType = TypeVar("ItemType")
+
+
+class CursorPage(BaseModel, Generic[ItemType]):
+    """Schema for a page of results with an opaque continuation cursor."""
+
+    items: list[ItemType] = Field(description="Page items")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor of the next page, null on the last page"
+    )
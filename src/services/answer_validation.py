@@ -0,0 +1,374 @@
+"""
+Answer validation for the Quiz App.
+
+Every question type has one check registered in a table keyed by the
+question type; regular expressions are compiled once at import. The
+per-question configuration a check needs (rating bounds, the set of
+option ids) is parsed from the question's ``options`` and
+``question_data`` once and cached per question id, so validating an
+answer is a dict lookup and a function call.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+import re
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from config import settings
+from models.question import QuestionType
+from repositories.answer_context import AnswerContext
+
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# Digits, spaces, hyphens, plus and parentheses
+PHONE_PATTERN = re.compile(r"^\+?[\d\s\-\(\)]{7,15}$")
+
+BOOLEAN_STRINGS = frozenset({"true", "false", "yes", "no"})
+DEFAULT_MIN_RATING = 1
+DEFAULT_MAX_RATING = 10
+
+
+@dataclass(frozen=True)
+class ValidatorConfig:
+    """Per-question settings of an answer check."""
+
+    min_rating: float = DEFAULT_MIN_RATING
+    max_rating: float = DEFAULT_MAX_RATING
+    option_ids: FrozenSet[Any] = frozenset()
+
+
+AnswerCheck = Callable[[Dict[str, Any], ValidatorConfig], bool]
+
+_CHECKS: Dict[str, AnswerCheck] = {}
+
+
+def register_check(*question_types: str) -> Callable[[AnswerCheck], AnswerCheck]:
+    """
+    Register an answer check for one or more question types.
+
+    Args:
+        question_types: Question types (QuestionType values or legacy names)
+
+    Returns:
+        Decorator registering the check
+    """
+
+    def decorator(check: AnswerCheck) -> AnswerCheck:
+        for question_type in question_types:
+            _CHECKS[str(getattr(question_type, "value", question_type))] = check
+        return check
+
+    return decorator
+
+
+@register_check(QuestionType.TEXT, "text")
+def _check_text(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    value = answer.get("value")
+    return isinstance(value, str) and len(value.strip()) > 0
+
+
+@register_check(QuestionType.YES_NO, "boolean")
+def _check_yes_no(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    value = answer.get("value")
+    if isinstance(value, bool):
+        return True
+    return isinstance(value, str) and value.lower() in BOOLEAN_STRINGS
+
+
+@register_check(QuestionType.RATING_1_10, "rating")
+def _check_rating(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    value = answer.get("value")
+    return (
+        isinstance(value, (int, float))
+        and config.min_rating <= value <= config.max_rating
+    )
+
+
+@register_check(QuestionType.EMAIL)
+def _check_email(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    value = answer.get("value")
+    return isinstance(value, str) and EMAIL_PATTERN.match(value) is not None
+
+
+@register_check(QuestionType.PHONE)
+def _check_phone(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    value = answer.get("value")
+    return isinstance(value, str) and PHONE_PATTERN.match(value) is not None
+
+
+@register_check(QuestionType.IMAGE_UPLOAD)
+def _check_image_upload(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    file_data = answer.get("file")
+    return (
+        isinstance(file_data, dict)
+        and "filename" in file_data
+        and "content_type" in file_data
+        and file_data.get("content_type", "").startswith("image/")
+    )
+
+
+@register_check(QuestionType.FILE_UPLOAD)
+def _check_file_upload(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    file_data = answer.get("file")
+    return (
+        isinstance(file_data, dict)
+        and "content_type" in file_data
+        and len(file_data.get("filename", "")) > 0
+    )
+
+
+@register_check(QuestionType.GEOLOCATION)
+def _check_geolocation(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    location = answer.get("location")
+    if not isinstance(location, dict):
+        return False
+    lat = location.get("latitude")
+    lng = location.get("longitude")
+    return (
+        isinstance(lat, (int, float))
+        and isinstance(lng, (int, float))
+        and -90 <= lat <= 90
+        and -180 <= lng <= 180
+    )
+
+
+@register_check(QuestionType.NFC_SCAN)
+def _check_nfc_scan(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    nfc_data = answer.get("nfc_data")
+    return (
+        isinstance(nfc_data, dict)
+        and "tag_type" in nfc_data
+        and len(nfc_data.get("tag_id", "")) > 0
+    )
+
+
+@register_check("multiple_choice")
+def _check_multiple_choice(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    selected = answer.get("selected")
+    return bool(selected) and selected in config.option_ids
+
+
+@register_check("date")
+def _check_date(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    value = answer.get("value")
+    if not isinstance(value, str):
+        return False
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+@register_check("number")
+def _check_number(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    return isinstance(answer.get("value"), (int, float))
+
+
+def _accept_any(answer: Dict[str, Any], config: ValidatorConfig) -> bool:
+    # Unknown question types are accepted
+    return True
+
+
+@dataclass(frozen=True)
+class CompiledValidator:
+    """Answer check of a question bound to the question's settings."""
+
+    check: AnswerCheck
+    config: ValidatorConfig
+
+    def __call__(self, answer: Dict[str, Any]) -> bool:
+        try:
+            return bool(self.check(answer, self.config))
+        except Exception:
+            return False
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _option_ids(options: Any) -> FrozenSet[Any]:
+    if isinstance(options, dict):
+        options = options.get("options")
+    if not isinstance(options, list):
+        return frozenset()
+    ids = set()
+    for option in options:
+        if isinstance(option, dict):
+            option = option.get("id")
+        if option is not None and not isinstance(option, (dict, list)):
+            ids.add(option)
+    return frozenset(ids)
+
+
+def compile_validator(
+    question_type: str,
+    options: Any = None,
+    question_data: Any = None,
+) -> CompiledValidator:
+    """
+    Build the answer check of a question.
+
+    Rating bounds are read from the ``min``/``max`` keys and option ids
+    from an ``options`` list; values in ``question_data`` take
+    precedence over ``options``.
+
+    Args:
+        question_type: Question type
+        options: Question options
+        question_data: Question data
+
+    Returns:
+        Compiled validator
+    """
+    min_rating, max_rating = DEFAULT_MIN_RATING, DEFAULT_MAX_RATING
+    option_ids: FrozenSet[Any] = frozenset()
+    for source in (options, question_data):
+        option_ids = _option_ids(source) or option_ids
+        if not isinstance(source, dict):
+            continue
+        low, high = _number(source.get("min")), _number(source.get("max"))
+        if low is not None:
+            min_rating = low
+        if high is not None:
+            max_rating = high
+
+    return CompiledValidator(
+        _CHECKS.get(question_type, _accept_any),
+        ValidatorConfig(min_rating, max_rating, option_ids),
+    )
+
+
+class AnswerValidatorRegistry:
+    """
+    Bounded LRU cache of compiled validators keyed by question id.
+
+    An entry is rebuilt when the question's type, options or data differ
+    from the ones it was compiled from.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """
+        Initialize the registry.
+
+        Args:
+            max_size: Maximum number of cached questions
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[tuple, CompiledValidator]]" = (
+            OrderedDict()
+        )
+        self._by_type: Dict[str, CompiledValidator] = {}
+        self._lock = threading.Lock()
+
+    def validator_for(self, context: AnswerContext) -> CompiledValidator:
+        """
+        Get the compiled validator of a question.
+
+        Args:
+            context: Answer context of the question
+
+        Returns:
+            Compiled validator
+        """
+        source = (context.question_type, context.options, context.question_data)
+        with self._lock:
+            entry = self._entries.get(context.question_id)
+            if entry is not None and entry[0] == source:
+                self._entries.move_to_end(context.question_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        validator = compile_validator(*source)
+        with self._lock:
+            self._entries[context.question_id] = (source, validator)
+            self._entries.move_to_end(context.question_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return validator
+
+    def validator_for_type(self, question_type: str) -> CompiledValidator:
+        """
+        Get the validator of a question type with default settings.
+
+        Args:
+            question_type: Question type
+
+        Returns:
+            Compiled validator
+        """
+        validator = self._by_type.get(question_type)
+        if validator is None:
+            validator = self._by_type.setdefault(
+                question_type, compile_validator(question_type)
+            )
+        return validator
+
+    def validate(self, context: AnswerContext, answer: Dict[str, Any]) -> bool:
+        """
+        Validate one answer.
+
+        Args:
+            context: Answer context of the question
+            answer: Answer data
+
+        Returns:
+            True if valid, False otherwise
+        """
+        return self.validator_for(context)(answer)
+
+    def validate_many(
+        self, items: Iterable[Tuple[AnswerContext, Dict[str, Any]]]
+    ) -> List[bool]:
+        """
+        Validate many answers, compiling each question's validator once.
+
+        Args:
+            items: Pairs of answer context and answer data
+
+        Returns:
+            Results in the order of ``items``
+        """
+        validators: Dict[int, CompiledValidator] = {}
+        results = []
+        for context, answer in items:
+            validator = validators.get(context.question_id)
+            if validator is None:
+                validator = validators[context.question_id] = self.validator_for(
+                    context
+                )
+            results.append(validator(answer))
+        return results
+
+    def clear(self) -> None:
+        """Drop all compiled validators."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with size, hit and miss counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Process-wide registry shared by the response endpoints
+answer_validators = AnswerValidatorRegistry(settings.answer_context_cache_size)
+
@@ -0,0 +1,186 @@
+"""
+Binary value codecs for the Redis cache.
+
+Every encoded value starts with one header byte naming its format, so
+the configured codec can change without flushing Redis: readers decode
+every format they know, whatever the writers currently use. Values
+written as text before codecs existed have no header (they start with
+a printable character) and are still decoded.
+
+orjson is the fast JSON codec; msgpack is smaller and keeps datetime,
+date, Decimal and UUID values instead of turning them into strings.
+Both libraries are optional, the stdlib JSON codec is the fallback.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import logging
+from typing import Any, Dict
+import uuid
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# msgpack extension types of values JSON has no type for
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_DECIMAL = 3
+EXT_UUID = 4
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached value cannot be decoded."""
+
+
+class CacheCodec:
+    """Serializer of cache values with a one-byte format header."""
+
+    name = "json"
+    header = 0x01
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize a value with the format header.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Header byte followed by the payload
+        """
+        return bytes((self.header,)) + self.dumps(value)
+
+
+class OrjsonCodec(CacheCodec):
+    """JSON through orjson; datetimes are stored as ISO strings."""
+
+    name = "orjson"
+    header = 0x02
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(CacheCodec):
+    """msgpack with extension types for datetime, date, Decimal and UUID."""
+
+    name = "msgpack"
+    header = 0x03
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return msgpack.ExtType(EXT_DATETIME, value.isoformat().encode())
+        if isinstance(value, date):
+            return msgpack.ExtType(EXT_DATE, value.isoformat().encode())
+        if isinstance(value, Decimal):
+            return msgpack.ExtType(EXT_DECIMAL, str(value).encode())
+        if isinstance(value, uuid.UUID):
+            return msgpack.ExtType(EXT_UUID, value.bytes)
+        return str(value)
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == EXT_DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == EXT_DATE:
+            return date.fromisoformat(data.decode())
+        if code == EXT_DECIMAL:
+            return Decimal(data.decode())
+        if code == EXT_UUID:
+            return uuid.UUID(bytes=data)
+        return msgpack.ExtType(code, data)
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(
+            data, ext_hook=self._ext_hook, raw=False, strict_map_key=False
+        )
+
+
+_CODECS: Dict[str, CacheCodec] = {"json": CacheCodec()}
+if ORJSON_AVAILABLE:
+    _CODECS["orjson"] = OrjsonCodec()
+if MSGPACK_AVAILABLE:
+    _CODECS["msgpack"] = MsgpackCodec()
+
+_BY_HEADER: Dict[int, CacheCodec] = {
+    codec.header: codec for codec in _CODECS.values()
+}
+
+
+def get_codec(name: str) -> CacheCodec:
+    """
+    Get a codec by name, falling back to JSON when it is unavailable.
+
+    Args:
+        name: Codec name (json, orjson or msgpack)
+
+    Returns:
+        Codec instance
+    """
+    codec = _CODECS.get(name)
+    if codec is None:
+        logger.warning(f"Cache codec {name!r} is not available, using json")
+        return _CODECS["json"]
+    return codec
+
+
+def decode(data: bytes) -> Any:
+    """
+    Deserialize a cached value written by any codec.
+
+    Args:
+        data: Stored bytes
+
+    Returns:
+        Deserialized value
+
+    Raises:
+        CacheCodecError: The format is unknown or the payload is invalid
+    """
+    if not data:
+        raise CacheCodecError("Empty cache value")
+
+    codec = _BY_HEADER.get(data[0])
+    if codec is None:
+        if data[0] < 0x20:
+            raise CacheCodecError(f"Unknown cache value format {data[0]:#04x}")
+        # Text written before values had a header, JSON or plain
+        text = data.decode(errors="replace")
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return text
+
+    try:
+        return codec.loads(data[1:])
+    except Exception as e:
+        raise CacheCodecError(f"Invalid {codec.name} cache value: {e}") from e
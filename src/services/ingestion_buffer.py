@@ -0,0 +1,440 @@
+"""
+Write-behind ingestion buffer for the Quiz App.
+
+Already validated rows of append-only tables (responses, respondent
+events) are queued in memory and written by a background task with one
+multi-row INSERT per table every ``flush_rows`` rows or
+``flush_interval_ms`` milliseconds, whichever comes first. A campaign
+spike then costs one transaction per flush instead of one per request.
+
+Memory is bounded: when ``max_rows`` rows are waiting, enqueueing raises
+IngestionBufferFull and endpoints answer 503. Callers that need
+durability await the flush of their rows (``put(..., wait=True)``);
+fire-and-forget callers return right after enqueueing and rely on the
+flush on shutdown. Rows written inside a request transaction are queued
+with ``enqueue_after_commit`` and only reach the buffer once that
+transaction commits, so they never reference rows that were rolled back;
+their capacity is reserved up front, so an accepted row is never dropped
+for lack of room.
+
+Only rows the database rejects are dropped: a flush failing with an
+integrity or data error splits the batch until the offending rows are
+isolated. Any other failure (lock timeout, lost connection) puts the
+rows back at the head of the queue and retries them with backoff; after
+``flush_retries`` failed attempts new rows are refused with
+IngestionBufferFull until a flush succeeds again. Rows still failing
+when the buffer stops are the only ones lost, and that is logged.
+"""
+
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import Any, AsyncContextManager, Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import get_write_session
+from repositories.unit_of_work import in_unit_of_work
+
+logger = logging.getLogger(__name__)
+
+# Rows waiting for the commit of a session, in ``Session.info``
+_PENDING_KEY = "ingestion_pending"
+
+
+class IngestionBufferFull(Exception):
+    """Raised when the buffer holds max_rows rows and cannot accept more."""
+
+
+class _Row:
+    """A queued row and the future of its flush, if someone waits for it."""
+
+    __slots__ = ("model", "values", "flushed", "attempts")
+
+    def __init__(
+        self, model: type, values: Dict[str, Any], flushed: Optional[asyncio.Future]
+    ):
+        self.model = model
+        self.values = values
+        self.flushed = flushed
+        self.attempts = 0
+
+
+def _is_rejected(exc: Exception) -> bool:
+    """Check whether the database rejected the rows themselves."""
+    return isinstance(exc, (IntegrityError, DataError))
+
+
+class IngestionBuffer:
+    """
+    Bounded in-process queue of rows group-committed by a background task.
+
+    Conflicting rows (e.g. a second answer to the same question in the
+    same session) are skipped with ON CONFLICT DO NOTHING instead of
+    failing the whole flush.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_rows: int = 10000,
+        flush_rows: int = 500,
+        flush_interval_ms: float = 50.0,
+        flush_retries: int = 3,
+        retry_backoff_ms: float = 100.0,
+        session_factory: Callable[
+            [], AsyncContextManager[AsyncSession]
+        ] = get_write_session,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_rows: Maximum number of queued rows
+            flush_rows: Flush as soon as this many rows are queued
+            flush_interval_ms: Flush queued rows at least this often
+            flush_retries: Failed attempts of a batch before new rows are refused
+            retry_backoff_ms: Delay before the first retry, doubled per retry
+            session_factory: Context manager yielding a committing session
+        """
+        self.max_rows = max_rows
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_retries = flush_retries
+        self.retry_backoff = retry_backoff_ms / 1000
+        self.session_factory = session_factory
+        self._rows: Deque[_Row] = deque()
+        # Rows accepted by open transactions, released on commit
+        self._reserved = 0
+        # Set while queued rows keep failing, new rows are refused
+        self._failing = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._stats = {
+            "enqueued_rows": 0,
+            "flushed_rows": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "retried_rows": 0,
+            "split_flushes": 0,
+            "dropped_rows": 0,
+            "rejected_rows": 0,
+            "max_flush_size": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Check whether the flush task is running."""
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        """Start the flush task."""
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._worker = asyncio.create_task(self._run(), name="ingestion-buffer")
+
+    async def stop(self) -> None:
+        """Flush every queued row and stop the flush task."""
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._worker
+        self._worker = None
+
+    def enqueue(
+        self, model: type, values: Dict[str, Any], *, wait: bool = False
+    ) -> Optional[asyncio.Future]:
+        """
+        Queue one row.
+
+        Args:
+            model: Mapped class of the target table
+            values: Column values
+            wait: Return a future resolved when the row is committed
+
+        Returns:
+            Flush future when ``wait`` is set, otherwise None
+
+        Raises:
+            IngestionBufferFull: max_rows rows are already queued
+            RuntimeError: The buffer is not running
+            ValueError: Values name columns the table does not have
+        """
+        self._check(model, values)
+        self._reserve(1)
+
+        flushed = asyncio.get_running_loop().create_future() if wait else None
+        self._append(_Row(model, values, flushed))
+        return flushed
+
+    async def put(
+        self, model: type, values: Dict[str, Any], *, wait: bool = False
+    ) -> None:
+        """
+        Queue one row, optionally waiting until it is committed.
+
+        Args:
+            model: Mapped class of the target table
+            values: Column values
+            wait: Return only after the row's flush committed
+
+        Raises:
+            IngestionBufferFull: max_rows rows are already queued
+        """
+        flushed = self.enqueue(model, values, wait=wait)
+        if flushed is not None:
+            await asyncio.shield(flushed)
+
+    def enqueue_after_commit(
+        self, session: AsyncSession, model: type, values: Dict[str, Any]
+    ) -> None:
+        """
+        Queue one row once the session's current transaction commits.
+
+        Capacity is reserved now, so a full buffer still fails the request
+        and the row has room once the transaction commits; the row and its
+        reservation are discarded if the transaction rolls back.
+
+        Args:
+            session: Session whose commit releases the row
+            model: Mapped class of the target table
+            values: Column values
+
+        Raises:
+            IngestionBufferFull: max_rows rows are already queued
+        """
+        self._check(model, values)
+        self._reserve(1)
+        self._reserved += 1
+        session.info.setdefault(_PENDING_KEY, []).append(
+            (self, _Row(model, values, None))
+        )
+
+    def enqueue_for_session(
+        self, session: AsyncSession, model: type, values: Dict[str, Any]
+    ) -> None:
+        """
+        Queue a row that belongs to the work of a session.
+
+        In a unit of work the row waits for the request's commit; outside
+        of one the session's earlier writes are already committed.
+
+        Args:
+            session: Session the row belongs to
+            model: Mapped class of the target table
+            values: Column values
+
+        Raises:
+            IngestionBufferFull: max_rows rows are already queued
+        """
+        if in_unit_of_work(session):
+            self.enqueue_after_commit(session, model, values)
+        else:
+            self.enqueue(model, values)
+
+    def _check(self, model: type, values: Dict[str, Any]) -> None:
+        if not self.running or self._stopping:
+            raise RuntimeError("Ingestion buffer is not running")
+        unknown = set(values) - set(model.__table__.columns.keys())
+        if unknown:
+            raise ValueError(
+                f"Unknown {model.__name__} columns: {', '.join(sorted(unknown))}"
+            )
+
+    def _reserve(self, count: int) -> None:
+        if self._failing:
+            self._stats["rejected_rows"] += 1
+            raise IngestionBufferFull("Ingestion buffer flushes are failing")
+        if len(self._rows) + self._reserved + count > self.max_rows:
+            self._stats["rejected_rows"] += 1
+            raise IngestionBufferFull(
+                f"Ingestion buffer is full ({self.max_rows} rows queued)"
+            )
+
+    def _append(self, row: _Row) -> None:
+        self._rows.append(row)
+        self._stats["enqueued_rows"] += 1
+        if len(self._rows) >= self.flush_rows:
+            self._wakeup.set()
+
+    def _release(self, row: _Row) -> None:
+        """Move a row of a committed transaction into the queue."""
+        self._reserved -= 1
+        if not self.running:
+            # Committed after stop() flushed the queue
+            self._stats["dropped_rows"] += 1
+            logger.warning(
+                f"Ingestion buffer dropped a {row.model.__name__} row after commit"
+            )
+            return
+        self._append(row)
+
+    def _discard(self, row: _Row) -> None:
+        """Return the reservation of a row whose transaction rolled back."""
+        self._reserved -= 1
+
+    async def _run(self) -> None:
+        """Flush loop: wait for flush_rows rows or flush_interval, then write."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            while self._rows:
+                batch = [
+                    self._rows.popleft()
+                    for _ in range(min(self.flush_rows, len(self._rows)))
+                ]
+                if not await self._flush(batch):
+                    # Rows are back at the head of the queue, back off
+                    attempts = self._rows[0].attempts if self._rows else 1
+                    attempts = min(attempts, self.flush_retries + 1)
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempts - 1))
+                    continue
+                if len(self._rows) < self.flush_rows and not self._stopping:
+                    break
+
+            if self._stopping and not self._rows:
+                return
+
+    async def _flush(self, batch: List[_Row]) -> bool:
+        """
+        Write a batch, splitting it when the database rejects rows.
+
+        Returns:
+            False when rows were put back into the queue for a retry
+        """
+        started = time.perf_counter()
+        try:
+            await self._write(batch)
+        except Exception as exc:
+            self._stats["failed_flushes"] += 1
+            logger.error(f"Ingestion buffer flush of {len(batch)} rows failed: {exc}")
+            if not _is_rejected(exc):
+                return self._retry(batch, exc)
+            if len(batch) > 1:
+                # Isolate the rows the database rejects
+                self._stats["split_flushes"] += 1
+                middle = len(batch) // 2
+                if not await self._flush(batch[:middle]):
+                    self._rows.extendleft(reversed(batch[middle:]))
+                    return False
+                return await self._flush(batch[middle:])
+            self._drop(batch, exc)
+            return True
+
+        self._failing = False
+        self._stats["flushes"] += 1
+        self._stats["flushed_rows"] += len(batch)
+        self._stats["max_flush_size"] = max(self._stats["max_flush_size"], len(batch))
+        self._stats["last_flush_ms"] = (time.perf_counter() - started) * 1000
+        for row in batch:
+            if row.flushed is not None and not row.flushed.done():
+                row.flushed.set_result(None)
+        return True
+
+    def _retry(self, batch: List[_Row], exc: Exception) -> bool:
+        """Put the rows of a failed flush back at the head of the queue."""
+        for row in batch:
+            row.attempts += 1
+        if batch[0].attempts > self.flush_retries:
+            if self._stopping:
+                self._drop(batch, exc)
+                return True
+            self._failing = True
+        self._rows.extendleft(reversed(batch))
+        self._stats["retried_rows"] += len(batch)
+        return False
+
+    def _drop(self, batch: List[_Row], exc: Exception) -> None:
+        """Give up on rows, failing the flush futures of their waiters."""
+        self._stats["dropped_rows"] += len(batch)
+        logger.error(
+            f"Ingestion buffer dropped {len(batch)} {batch[0].model.__name__} "
+            f"rows: {exc}"
+        )
+        for row in batch:
+            if row.flushed is not None and not row.flushed.done():
+                row.flushed.set_exception(exc)
+
+    async def _write(self, batch: List[_Row]) -> None:
+        """Write a batch with one INSERT per table and column set."""
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in batch:
+            key = (row.model, tuple(sorted(row.values)))
+            groups.setdefault(key, []).append(row.values)
+
+        async with self.session_factory() as session:
+            is_postgresql = session.get_bind().dialect.name == "postgresql"
+            dialect_insert = postgresql.insert if is_postgresql else sqlite.insert
+            for (model, _), rows in groups.items():
+                await session.execute(
+                    dialect_insert(model.__table__).on_conflict_do_nothing(), rows
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get buffer statistics.
+
+        Returns:
+            Dictionary with row, flush and queue depth counters
+        """
+        flushes = self._stats["flushes"]
+        return {
+            **self._stats,
+            "running": self.running,
+            "failing": self._failing,
+            "queue_depth": len(self._rows),
+            "reserved_rows": self._reserved,
+            "max_rows": self.max_rows,
+            "avg_flush_size": (
+                round(self._stats["flushed_rows"] / flushes, 2) if flushes else 0.0
+            ),
+        }
+
+
+# Optional write-behind buffer, started and flushed by main.lifespan
+ingestion_buffer: Optional[IngestionBuffer] = (
+    IngestionBuffer(
+        max_rows=settings.ingestion_buffer_max_rows,
+        flush_rows=settings.ingestion_buffer_flush_rows,
+        flush_interval_ms=settings.ingestion_buffer_flush_interval_ms,
+        flush_retries=settings.ingestion_buffer_flush_retries,
+        retry_backoff_ms=settings.ingestion_buffer_retry_backoff_ms,
+    )
+    if settings.ingestion_buffer_enabled
+    else None
+)
+
+
+def get_ingestion_buffer() -> Optional[IngestionBuffer]:
+    """Get the running ingestion buffer, or None when it is disabled."""
+    if ingestion_buffer is None or not ingestion_buffer.running:
+        return None
+    return ingestion_buffer
+
+
+@event.listens_for(Session, "after_commit")
+def _release_after_commit(session):
+    for buffer, row in session.info.pop(_PENDING_KEY, ()):
+        buffer._release(row)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session, previous_transaction):
+    if previous_transaction.parent is None:
+        for buffer, row in session.info.pop(_PENDING_KEY, ()):
+            buffer._discard(row)
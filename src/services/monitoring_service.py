@@ -95,6 +95,7 @@ class MonitoringService:
         self.performance_data: dict[str, list[float]] = {}
         self.user_analytics: dict[str, Any] = {}
         self.system_stats: dict[str, Any] = {}
+        self.query_stats: dict[str, dict[str, Any]] = {}
 
         # Performance thresholds
         self.thresholds = {
@@ -151,24 +152,8 @@ class MonitoringService:
             if not redis_service:
                 return
 
-            # Increment action counter
-            await redis_service.increment_counter(f"user_action:{action}", ttl=86400)
-            await redis_service.increment_counter("user_action:total", ttl=86400)
-
-            # Track per-user actions
-            user_key = f"user_analytics:{user_id}"
-            current_data = await redis_service.get_hash(user_key)
-
-            action_count = int(current_data.get(action, 0)) + 1
-            current_data[action] = str(action_count)
-            current_data["last_action"] = action
-            current_data["last_seen"] = datetime.now().isoformat()
-
-            await redis_service.set_hash(user_key, current_data, ttl=604800)  # 7 days
-
-            # Track hourly analytics
-            hour_key = f"analytics:hourly:{datetime.now().strftime('%Y%m%d%H')}"
-            await redis_service.increment_counter(hour_key, ttl=172800)  # 48 hours
+            # Counters, per-user hash and hourly bucket in one atomic call
+            await redis_service.track_user_action(user_id, action)
 
         except Exception as e:
             logger.error(f"Error tracking user action: {e}")
@@ -210,6 +195,52 @@ class MonitoringService:
         except Exception as e:
             logger.error(f"Error tracking performance: {e}")
 
+    def record_query_stats(
+        self,
+        operation: str,
+        query_count: int,
+        db_time_ms: float,
+        n_plus_one: bool = False,
+    ):
+        """Aggregate per-request SQL query statistics by operation."""
+        stats = self.query_stats.setdefault(
+            operation,
+            {
+                "requests": 0,
+                "queries_total": 0,
+                "queries_max": 0,
+                "db_time_total_ms": 0.0,
+                "n_plus_one_requests": 0,
+            },
+        )
+        stats["requests"] += 1
+        stats["queries_total"] += query_count
+        stats["queries_max"] = max(stats["queries_max"], query_count)
+        stats["db_time_total_ms"] += db_time_ms
+        if n_plus_one:
+            stats["n_plus_one_requests"] += 1
+
+    def get_query_stats(self) -> dict[str, Any]:
+        """Get SQL query statistics per operation, heaviest first."""
+        operations = {
+            operation: {
+                **stats,
+                "queries_avg": round(stats["queries_total"] / stats["requests"], 2),
+                "db_time_avg_ms": round(
+                    stats["db_time_total_ms"] / stats["requests"], 2
+                ),
+                "db_time_total_ms": round(stats["db_time_total_ms"], 2),
+            }
+            for operation, stats in self.query_stats.items()
+        }
+        return dict(
+            sorted(
+                operations.items(),
+                key=lambda item: item[1]["queries_avg"],
+                reverse=True,
+            )
+        )
+
     async def get_system_health(self) -> dict[str, Any]:
         """Get comprehensive system health status."""
         try:
@@ -381,6 +412,7 @@ class MonitoringService:
                 "active_alerts": len([a for a in self.alerts if not a.resolved]),
                 "memory_usage": await self._get_memory_usage(),
                 "performance_avg": await self._get_avg_performance(),
+                "database_queries": self.get_query_stats(),
             }
 
         except Exception as e:
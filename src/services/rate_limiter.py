@@ -0,0 +1,117 @@
+"""
+Rate limiting dependency for the Quiz App.
+
+``RateLimiter`` instances are FastAPI dependencies counting each request
+against a Redis-backed limit (see ``RedisService.hit_rate_limit``). The
+remaining quota is returned in ``X-RateLimit-*`` headers; over the limit
+the request fails with 429 and ``Retry-After``. Without Redis requests
+are not limited.
+
+Usage:
+    email_batch_rate_limit = RateLimiter(10, 60, scope="validation:email_batch")
+
+    @router.post("/email/batch", dependencies=[Depends(email_batch_rate_limit)])
+    async def validate_emails_batch(...): ...
+
+Limits of authenticated endpoints should use ``key_func=current_user_key``
+so that a user is limited across addresses and users behind one address
+do not share a quota.
+"""
+
+import math
+from typing import Awaitable, Callable, Optional, Union
+
+from fastapi import HTTPException, Request, Response
+
+from config import settings
+from services.jwt_service import jwt_service
+from services.redis_service import (
+    RateLimitAlgorithm,
+    RateLimitResult,
+    get_redis_service,
+)
+
+KeyFunc = Callable[[Request], Union[str, Awaitable[str]]]
+
+
+def client_address(request: Request) -> str:
+    """
+    Identify the caller by its address.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client host, "unknown" when the server does not know it
+    """
+    return request.client.host if request.client else "unknown"
+
+
+def current_user_key(request: Request) -> str:
+    """
+    Identify the caller by the user of its access token.
+
+    The token is taken from the Bearer authorization header or the
+    ``token`` query parameter, like the endpoints read it.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        "user:<id>" for a valid token, the client address otherwise
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        token = request.query_params.get("token", "")
+    user = jwt_service.get_user_from_token(token) if token else None
+    if user and user.get("user_id"):
+        return f"user:{user['user_id']}"
+    return client_address(request)
+
+
+class RateLimiter:
+    """FastAPI dependency limiting requests per caller."""
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        *,
+        scope: str,
+        algorithm: Optional[Union[RateLimitAlgorithm, str]] = None,
+        key_func: KeyFunc = client_address,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            limit: Requests allowed per window
+            window: Window length in seconds
+            scope: Name separating this limit from others of the same caller
+            algorithm: Rate limiting algorithm, the configured one when None
+            key_func: Function (sync or async) identifying the caller
+        """
+        self.limit = limit
+        self.window = window
+        self.scope = scope
+        self.algorithm = RateLimitAlgorithm(algorithm or settings.rate_limit_algorithm)
+        self.key_func = key_func
+
+    async def __call__(self, request: Request, response: Response) -> RateLimitResult:
+        caller = self.key_func(request)
+        if not isinstance(caller, str):
+            caller = await caller
+
+        redis_service = await get_redis_service()
+        result = await redis_service.hit_rate_limit(
+            f"{self.scope}:{caller}", self.limit, self.window, self.algorithm
+        )
+
+        headers = result.headers()
+        if not result.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(result.reset_after)))
+            raise HTTPException(
+                status_code=429, detail="Rate limit exceeded", headers=headers
+            )
+        response.headers.update(headers)
+        return result
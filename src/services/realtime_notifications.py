@@ -17,14 +17,15 @@ from typing import Any, Optional
 import uuid
 
 from fastapi import WebSocket
-from sqlalchemy import and_, select
+from sqlalchemy import select
 
 from config import get_settings
-from database import get_async_session
-from models.question import Question
+from database import get_db_session
 from models.response import Response
 from models.survey import Survey
 from models.user import User
+from repositories.survey import SurveyRepository
+from repositories.user import UserRepository
 from services.telegram_service import get_telegram_service
 
 logger = logging.getLogger(__name__)
@@ -264,18 +265,16 @@ class RealtimeNotificationService:
 
             if notification.user_id:
                 # Send to specific user
-                async with get_async_session() as session:
-                    stmt = select(User).where(User.id == notification.user_id)
-                    result = await session.execute(stmt)
-                    user = result.scalar_one_or_none()
-
-                    if user and user.telegram_id:
-                        message = (
-                            f"🔔 <b>{notification.title}</b>\n\n{notification.message}"
-                        )
-                        return await telegram_service.send_notification(
-                            user.telegram_id, message
-                        )
+                async with get_db_session() as session:
+                    user = await UserRepository(session).get(notification.user_id)
+
+                if user and user.telegram_id:
+                    message = (
+                        f"🔔 <b>{notification.title}</b>\n\n{notification.message}"
+                    )
+                    return await telegram_service.send_notification(
+                        user.telegram_id, message
+                    )
             else:
                 # Send to admin chat
                 admin_message = (
@@ -294,7 +293,7 @@ class RealtimeNotificationService:
         try:
             if notification.user_id:
                 # Send to specific user's devices
-                async with get_async_session() as session:
+                async with get_db_session() as session:
                     stmt = select(User).where(User.id == notification.user_id)
                     result = await session.execute(stmt)
                     user = result.scalar_one_or_none()
@@ -329,10 +328,8 @@ class RealtimeNotificationService:
         self, survey_id: int, user_id: int | None = None
     ) -> Notification:
         """Create notification for new survey."""
-        async with get_async_session() as session:
-            stmt = select(Survey).where(Survey.id == survey_id)
-            result = await session.execute(stmt)
-            survey = result.scalar_one_or_none()
+        async with get_db_session() as session:
+            survey = await SurveyRepository(session).get(survey_id)
 
             if survey:
                 return Notification(
@@ -348,7 +345,7 @@ class RealtimeNotificationService:
         self, survey_id: int, user_id: int
     ) -> Notification:
         """Create notification for survey completion."""
-        async with get_async_session() as session:
+        async with get_db_session() as session:
             # Get survey info
             stmt = select(Survey).where(Survey.id == survey_id)
             result = await session.execute(stmt)
@@ -356,12 +353,8 @@ class RealtimeNotificationService:
 
             # Count user's responses
             response_stmt = select(Response).where(
-                and_(
-                    Response.user_id == user_id,
-                    Response.question_id.in_(
-                        select(Question.id).where(Question.survey_id == survey_id)
-                    ),
-                )
+                Response.survey_id == survey_id,
+                Response.user_id == user_id,
             )
             response_result = await session.execute(response_stmt)
             responses = response_result.scalars().all()
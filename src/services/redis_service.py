@@ -10,6 +10,7 @@ from datetime import datetime
 from enum import Enum
 import json
 import logging
+import math
 from typing import Any, Optional
 import uuid
 import asyncio
@@ -24,6 +25,7 @@ except ImportError:
     Redis = None
 
 from config import get_settings
+from services.cache_codec import CacheCodecError, decode, get_codec
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -33,15 +35,135 @@ class CacheKey(str, Enum):
     """Cache key patterns."""
 
     SURVEY_DATA = "survey:{survey_id}"
+    SURVEY_ACCESS_TOKEN = "survey_token:{access_token}"
     USER_SESSION = "session:{user_id}"
     SURVEY_RESPONSES = "responses:{survey_id}"
     USER_ANALYTICS = "analytics:{user_id}"
     TELEGRAM_STATE = "telegram_state:{user_id}"
     RATE_LIMIT = "rate_limit:{key}"
+    RATE_LIMIT_LOG = "rate_limit_log:{key}"
     WEBSOCKET_CONNECTION = "ws_conn:{user_id}"
     SURVEY_STATISTICS = "stats:{survey_id}"
     RECENT_SURVEYS = "recent_surveys:{user_id}"
     POPULAR_SURVEYS = "popular_surveys"
+    RESPONDENT_SESSION = "respondent_session:{session_id}"
+    USER_ACTION = "user_action:{action}"
+    USER_ACTION_STATS = "user_analytics:{user_id}"
+    HOURLY_ANALYTICS = "analytics:hourly:{hour}"
+    CACHE_VERSION = "{key}:version"
+
+
+# Counts one user action in a single round trip. Counters get their TTL
+# when created (or when a crash left them without one); the per-user
+# hash is extended on every action.
+#   KEYS: action counter, total counter, user hash, hourly counter
+#   ARGV: action, last_seen, counter TTL, user hash TTL, hourly TTL
+TRACK_USER_ACTION_SCRIPT = """
+local function incr(key, ttl)
+    local value = redis.call('INCR', key)
+    if redis.call('TTL', key) < 0 then
+        redis.call('EXPIRE', key, ttl)
+    end
+    return value
+end
+
+incr(KEYS[1], ARGV[3])
+incr(KEYS[2], ARGV[3])
+local count = redis.call('HINCRBY', KEYS[3], ARGV[1], 1)
+redis.call('HSET', KEYS[3], 'last_action', ARGV[1], 'last_seen', ARGV[2])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+incr(KEYS[4], ARGV[5])
+return count
+"""
+
+# Fixed window: counts every hit, the window starts with the first one.
+#   KEYS: counter; ARGV: window in ms
+#   Returns: {hits in window, ms until the window resets}
+FIXED_WINDOW_RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+    ttl = tonumber(ARGV[1])
+end
+return {count, ttl}
+"""
+
+# Sliding window log: a sorted set of accepted hit times (Redis server
+# time, so workers agree on the clock); rejected hits are not logged.
+#   KEYS: log; ARGV: window in ms, limit, unique member for this hit
+#   Returns: {1 if accepted, hits in window, ms until a slot frees up}
+SLIDING_WINDOW_RATE_LIMIT_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    count = count + 1
+    allowed = 1
+end
+redis.call('PEXPIRE', KEYS[1], window)
+
+local reset = window
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, count, reset}
+"""
+
+
+# Deletes cached values and bumps their versions, so writers that read
+# an older version do not store what they built before the invalidation.
+#   KEYS: value 1, version 1, value 2, version 2, ...; ARGV: version TTL
+INVALIDATE_VERSIONED_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    redis.call('DEL', KEYS[i])
+    redis.call('INCR', KEYS[i + 1])
+    redis.call('EXPIRE', KEYS[i + 1], ARGV[1])
+end
+return #KEYS / 2
+"""
+
+# Stores a value unless its version changed since the writer read it.
+#   KEYS: value, version; ARGV: expected version, value, TTL
+#   Returns: 1 if stored
+SET_IF_VERSION_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+class RateLimitAlgorithm(str, Enum):
+    """Rate limiting algorithms."""
+
+    FIXED_WINDOW = "fixed_window"
+    SLIDING_WINDOW = "sliding_window"
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of one rate limited hit."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # Seconds until the quota grows again
+
+    def headers(self) -> dict[str, str]:
+        """Get the X-RateLimit-* response headers."""
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_after)),
+        }
 
 
 @dataclass
@@ -63,6 +185,13 @@ class RedisService:
 
     def __init__(self):
         self.redis: Optional[Redis] = None
+        # Client without response decoding for codec-encoded values
+        self.redis_binary: Optional[Redis] = None
+        self.codec = get_codec(getattr(settings, "cache_codec", "json"))
+        self._track_user_action_script = None
+        self._rate_limit_scripts = {}
+        self._invalidate_versioned_script = None
+        self._set_if_version_script = None
         self.connection_pool = None
         self.connected = False
         self.default_ttl = 3600  # 1 hour
@@ -88,6 +217,33 @@ class RedisService:
                 retry_on_timeout=True,
                 health_check_interval=30,
             )
+            self.redis_binary = redis.from_url(
+                redis_url,
+                decode_responses=False,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=True,
+                health_check_interval=30,
+            )
+
+            # Lua scripts run through EVALSHA, loaded on first use
+            self._track_user_action_script = self.redis.register_script(
+                TRACK_USER_ACTION_SCRIPT
+            )
+            self._rate_limit_scripts = {
+                RateLimitAlgorithm.FIXED_WINDOW: self.redis.register_script(
+                    FIXED_WINDOW_RATE_LIMIT_SCRIPT
+                ),
+                RateLimitAlgorithm.SLIDING_WINDOW: self.redis.register_script(
+                    SLIDING_WINDOW_RATE_LIMIT_SCRIPT
+                ),
+            }
+            self._invalidate_versioned_script = self.redis.register_script(
+                INVALIDATE_VERSIONED_SCRIPT
+            )
+            self._set_if_version_script = self.redis.register_script(
+                SET_IF_VERSION_SCRIPT
+            )
 
             # Test connection
             await self.redis.ping()
@@ -103,6 +259,8 @@ class RedisService:
 
     async def disconnect(self):
         """Disconnect from Redis."""
+        if self.redis_binary:
+            await self.redis_binary.aclose()
         if self.redis:
             await self.redis.aclose()
             self.connected = False
@@ -136,11 +294,7 @@ class RedisService:
             return False
 
         try:
-            # Serialize value
-            if isinstance(value, (dict, list)):
-                serialized_value = json.dumps(value, default=str)
-            else:
-                serialized_value = str(value)
+            serialized_value = self._serialize(value)
 
             # Set with TTL
             cache_ttl = ttl or self.default_ttl
@@ -159,6 +313,45 @@ class RedisService:
             logger.error(f"Error setting cache key {key}: {e}")
             return False
 
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=str)
+        return str(value)
+
+    async def get_binary(self, key: str) -> Optional[Any]:
+        """Get a codec-encoded value from cache."""
+        if not self.connected:
+            return None
+
+        try:
+            data = await self.redis_binary.get(key)
+            if data is None:
+                return None
+            return decode(data)
+        except CacheCodecError as e:
+            logger.warning(f"Undecodable cache key {key}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting cache key {key}: {e}")
+            return None
+
+    async def set_binary(
+        self, key: str, value: Any, ttl: Optional[int] = None, nx: bool = False
+    ) -> bool:
+        """Set a value in cache encoded with the configured codec."""
+        if not self.connected:
+            return False
+
+        try:
+            result = await self.redis_binary.set(
+                key, self.codec.encode(value), ex=ttl or self.default_ttl, nx=nx
+            )
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error setting cache key {key}: {e}")
+            return False
+
     async def delete(self, *keys: str) -> int:
         """Delete keys from cache."""
         if not self.connected or not keys:
@@ -170,6 +363,86 @@ class RedisService:
             logger.error(f"Error deleting cache keys {keys}: {e}")
             return 0
 
+    async def get_version(self, key: str) -> int:
+        """
+        Get the invalidation version of a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Number of versioned invalidations of the key, 0 when unknown
+        """
+        if not self.connected:
+            return 0
+
+        version_key = CacheKey.CACHE_VERSION.value.format(key=key)
+        try:
+            return int(await self.redis.get(version_key) or 0)
+        except Exception as e:
+            logger.error(f"Error getting cache version {version_key}: {e}")
+            return 0
+
+    async def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: int,
+        ttl: Optional[int] = None,
+        binary: bool = False,
+    ) -> bool:
+        """
+        Set a value unless the key was invalidated since ``version`` was read.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            version: Version returned by get_version before building the value
+            ttl: Lifetime in seconds, the default TTL when None
+            binary: Encode the value with the cache codec instead of JSON
+
+        Returns:
+            True if the value was stored
+        """
+        if not self.connected:
+            return False
+
+        data = self.codec.encode(value) if binary else self._serialize(value)
+        try:
+            result = await self._set_if_version_script(
+                keys=[key, CacheKey.CACHE_VERSION.value.format(key=key)],
+                args=[version, data, ttl or self.default_ttl],
+            )
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error setting cache key {key}: {e}")
+            return False
+
+    async def invalidate_versioned(self, *keys: str, version_ttl: int = 86400) -> int:
+        """
+        Delete keys and bump their versions, see set_if_version.
+
+        Args:
+            keys: Cache keys
+            version_ttl: Lifetime of the version counters in seconds
+
+        Returns:
+            Number of invalidated keys
+        """
+        if not self.connected or not keys:
+            return 0
+
+        script_keys = []
+        for key in keys:
+            script_keys += [key, CacheKey.CACHE_VERSION.value.format(key=key)]
+        try:
+            return await self._invalidate_versioned_script(
+                keys=script_keys, args=[version_ttl]
+            )
+        except Exception as e:
+            logger.error(f"Error invalidating cache keys {keys}: {e}")
+            return 0
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         if not self.connected:
@@ -296,12 +569,12 @@ class RedisService:
     ) -> bool:
         """Cache survey data."""
         cache_key = CacheKey.SURVEY_DATA.format(survey_id=survey_id)
-        return await self.set(cache_key, survey_data, ttl=1800)  # 30 minutes
+        return await self.set_binary(cache_key, survey_data, ttl=1800)  # 30 minutes
 
     async def get_survey_data(self, survey_id: int) -> Optional[dict[str, Any]]:
         """Get cached survey data."""
         cache_key = CacheKey.SURVEY_DATA.format(survey_id=survey_id)
-        return await self.get(cache_key)
+        return await self.get_binary(cache_key)
 
     async def invalidate_survey_cache(self, survey_id: int) -> bool:
         """Invalidate survey cache."""
@@ -357,34 +630,65 @@ class RedisService:
         return bool(await self.delete(session_key))
 
     # Rate limiting
-    async def check_rate_limit(self, key: str, limit: int, window: int) -> bool:
-        """Check if rate limit is exceeded."""
+    async def hit_rate_limit(
+        self,
+        key: str,
+        limit: int,
+        window: float,
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.FIXED_WINDOW,
+    ) -> RateLimitResult:
+        """
+        Count a hit against a rate limit atomically in one round trip.
+
+        Requests are allowed when Redis is unavailable.
+
+        Args:
+            key: Rate limit key (caller and scope)
+            limit: Hits allowed per window
+            window: Window length in seconds
+            algorithm: Fixed window counter or sliding window log
+
+        Returns:
+            Whether the hit is allowed, the remaining quota and reset time
+        """
         if not self.connected:
-            return False
+            return RateLimitResult(True, limit, limit, 0.0)
 
+        window_ms = max(1, int(window * 1000))
         try:
-            rate_key = CacheKey.RATE_LIMIT.format(key=key)
-            current_count = await self.redis.get(rate_key)
-
-            if current_count is None:
-                await self.redis.setex(rate_key, window, 1)
-                return False
-
-            current_count = int(current_count)
-            if current_count >= limit:
-                return True
-
-            await self.redis.incr(rate_key)
-            return False
-
+            script = self._rate_limit_scripts[algorithm]
+            if algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
+                allowed, count, reset_ms = await script(
+                    keys=[CacheKey.RATE_LIMIT_LOG.format(key=key)],
+                    args=[window_ms, limit, uuid.uuid4().hex],
+                )
+                allowed = bool(allowed)
+            else:
+                count, reset_ms = await script(
+                    keys=[CacheKey.RATE_LIMIT.format(key=key)], args=[window_ms]
+                )
+                allowed = count <= limit
         except Exception as e:
             logger.error(f"Error checking rate limit for {key}: {e}")
-            return False
+            return RateLimitResult(True, limit, limit, 0.0)
+
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(0, limit - int(count)),
+            reset_after=max(0, int(reset_ms)) / 1000,
+        )
+
+    async def check_rate_limit(self, key: str, limit: int, window: int) -> bool:
+        """Check if rate limit is exceeded."""
+        result = await self.hit_rate_limit(key, limit, window)
+        return not result.allowed
 
     async def reset_rate_limit(self, key: str) -> bool:
         """Reset rate limit for key."""
         rate_key = CacheKey.RATE_LIMIT.format(key=key)
-        return bool(await self.delete(rate_key))
+        log_key = CacheKey.RATE_LIMIT_LOG.format(key=key)
+        return bool(await self.delete(rate_key, log_key))
 
     # WebSocket connection management
     async def register_websocket_connection(
@@ -453,6 +757,52 @@ class RedisService:
         """Set counter value."""
         return await self.set(key, value, ttl)
 
+    # User action analytics
+    async def track_user_action(
+        self,
+        user_id: int,
+        action: str,
+        timestamp: Optional[datetime] = None,
+        counter_ttl: int = 86400,
+        user_ttl: int = 604800,
+        hourly_ttl: int = 172800,
+    ) -> int:
+        """
+        Count a user action atomically in one round trip.
+
+        Increments the action and total counters, the action field of the
+        user's analytics hash (with last action and last seen time) and
+        the hourly counter.
+
+        Args:
+            user_id: User ID
+            action: Action name
+            timestamp: Action time, now when None
+            counter_ttl: Lifetime of the action and total counters
+            user_ttl: Lifetime of the user's hash after the last action
+            hourly_ttl: Lifetime of the hourly counter
+
+        Returns:
+            Number of such actions of the user, 0 on failure
+        """
+        if not self.connected:
+            return 0
+
+        timestamp = timestamp or datetime.now()
+        keys = [
+            CacheKey.USER_ACTION.format(action=action),
+            CacheKey.USER_ACTION.format(action="total"),
+            CacheKey.USER_ACTION_STATS.format(user_id=user_id),
+            CacheKey.HOURLY_ANALYTICS.format(hour=timestamp.strftime("%Y%m%d%H")),
+        ]
+        args = [action, timestamp.isoformat(), counter_ttl, user_ttl, hourly_ttl]
+
+        try:
+            return int(await self._track_user_action_script(keys=keys, args=args))
+        except Exception as e:
+            logger.error(f"Error tracking action {action} of user {user_id}: {e}")
+            return 0
+
     # Cache statistics
     async def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -578,6 +928,26 @@ class RedisService:
             logger.error(f"Error deleting keys by pattern {pattern}: {e}")
             return 0
 
+    # Pub/sub
+    async def publish(self, channel: str, message: Any) -> int:
+        """Publish message to channel, return number of receivers."""
+        if not self.connected:
+            return 0
+
+        try:
+            if isinstance(message, (dict, list)):
+                message = json.dumps(message, default=str)
+            return await self.redis.publish(channel, message)
+        except Exception as e:
+            logger.error(f"Error publishing to channel {channel}: {e}")
+            return 0
+
+    def pubsub(self):
+        """Get a pub/sub connection, None when disconnected."""
+        if not self.connected:
+            return None
+        return self.redis.pubsub(ignore_subscribe_messages=True)
+
     # Health check
     async def health_check(self) -> dict[str, Any]:
         """Perform health check."""
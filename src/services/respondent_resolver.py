@@ -0,0 +1,213 @@
+"""
+Session to respondent resolver for the Quiz App.
+
+Every answer of a session belongs to one respondent. The resolver maps
+``user_session_id`` to the respondent ID through an in-process LRU cache,
+an optional Redis cache shared by workers and finally the database,
+creating the respondent only for the first answer of a session.
+
+When a session's respondent is merged or deleted, the session is evicted
+from the in-process cache at flush and, once the transaction commits,
+from both caches again (the Redis key is deleted).
+"""
+
+import asyncio
+from collections import OrderedDict
+import threading
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.respondent import Respondent, RespondentCreate
+from repositories.respondent import RespondentRepository
+from services.redis_service import CacheKey, RedisService, get_redis_service
+
+# session.info key of the sessions to evict once the transaction commits
+_PENDING_KEY = "respondent_sessions_to_evict"
+
+# Running Redis evictions, kept referenced until they finish
+_eviction_tasks: Set[asyncio.Task] = set()
+
+
+class SessionRespondentCache:
+    """
+    Bounded LRU cache of session ID -> respondent ID.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached sessions
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        # Listeners run from sync session code, possibly in another thread
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[int]:
+        """
+        Get a cached respondent ID.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Respondent ID or None
+        """
+        with self._lock:
+            respondent_id = self._entries.get(session_id)
+            if respondent_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return respondent_id
+
+    def put(self, session_id: str, respondent_id: int) -> None:
+        """
+        Cache a respondent ID.
+
+        Args:
+            session_id: Session ID
+            respondent_id: Respondent ID
+        """
+        with self._lock:
+            self._entries[session_id] = respondent_id
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, session_id: str) -> None:
+        """
+        Forget a session.
+
+        Args:
+            session_id: Session ID
+        """
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Size, hits, misses and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+session_respondent_cache = SessionRespondentCache(
+    max_size=settings.respondent_cache_size
+)
+
+
+class RespondentResolver:
+    """Resolve the respondent of a session, creating it once per session."""
+
+    def __init__(
+        self,
+        respondent_repo: RespondentRepository,
+        redis_service: Optional[RedisService] = None,
+        cache: SessionRespondentCache = session_respondent_cache,
+    ):
+        self.respondent_repo = respondent_repo
+        self.redis_service = redis_service
+        self.cache = cache
+
+    async def resolve(self, obj_in: RespondentCreate) -> int:
+        """
+        Get the respondent ID of ``obj_in.session_id``.
+
+        Only IDs read back from the database are cached: a respondent
+        created by this call may still be rolled back with the request.
+
+        Args:
+            obj_in: Respondent data used when the session has no respondent
+
+        Returns:
+            Respondent ID
+        """
+        session_id = obj_in.session_id
+        respondent_id = self.cache.get(session_id)
+        if respondent_id is not None:
+            return respondent_id
+
+        redis_key = CacheKey.RESPONDENT_SESSION.format(session_id=session_id)
+        if self.redis_service is not None:
+            respondent_id = await self.redis_service.get(redis_key)
+            if respondent_id is not None:
+                self.cache.put(session_id, int(respondent_id))
+                return int(respondent_id)
+
+        respondent_id = await self.respondent_repo.get_id_by_session_id(session_id)
+        if respondent_id is None:
+            return await self.respondent_repo.get_or_create_id_by_session(
+                obj_in=obj_in
+            )
+
+        self.cache.put(session_id, respondent_id)
+        if self.redis_service is not None:
+            await self.redis_service.set(
+                redis_key, respondent_id, ttl=settings.respondent_cache_redis_ttl
+            )
+        return respondent_id
+
+
+async def _evict_redis(session_ids: Set[str]) -> None:
+    redis_service = await get_redis_service()
+    await redis_service.delete(
+        *(CacheKey.RESPONDENT_SESSION.format(session_id=i) for i in session_ids)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _evict_merged_respondents(session, flush_context):
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, Respondent) and obj.session_id:
+            if obj.is_merged or obj in session.deleted:
+                session_respondent_cache.evict(obj.session_id)
+                session.info.setdefault(_PENDING_KEY, set()).add(obj.session_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_after_commit(session):
+    session_ids = session.info.pop(_PENDING_KEY, None)
+    if not session_ids:
+        return
+    # Another request may have cached the old respondent before the commit
+    for session_id in session_ids:
+        session_respondent_cache.evict(session_id)
+    if not settings.respondent_cache_redis:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (scripts, migrations): Redis entries expire by TTL
+        return
+    task = loop.create_task(_evict_redis(session_ids))
+    _eviction_tasks.add(task)
+    task.add_done_callback(_eviction_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
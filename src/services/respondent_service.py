@@ -9,6 +9,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import uuid
 import hashlib
+import logging
 
 from fastapi import HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,9 +23,12 @@ from models.respondent import (
     RespondentRead,
     RespondentUpdate,
 )
-from models.respondent_event import RespondentEventCreate
+from models.respondent_event import RespondentEvent, RespondentEventCreate
 from schemas.respondent import RespondentMergeResult
 from schemas.consent_log import ConsentLogCreate
+from services.ingestion_buffer import IngestionBufferFull, get_ingestion_buffer
+
+logger = logging.getLogger(__name__)
 
 
 class RespondentService:
@@ -372,6 +376,23 @@ class RespondentService:
             event_source=source,
         )
 
+        buffer = get_ingestion_buffer()
+        if buffer is not None:
+            try:
+                buffer.enqueue_for_session(
+                    self.event_repo.db, RespondentEvent, event_create.model_dump()
+                )
+                return
+            except (IngestionBufferFull, RuntimeError):
+                # События не должны ронять запрос: буфер полон или
+                # останавливается, пишем синхронно
+                pass
+            except ValueError as e:
+                # Событие с неизвестными колонками записать нельзя ни
+                # через буфер, ни синхронно; запрос не роняем
+                logger.error(f"Respondent event {event_type} rejected: {e}")
+                return
+
         await self.event_repo.create(obj_in=event_create)
 
     def _generate_session_id(self, request: Request) -> str:
@@ -0,0 +1,189 @@
+"""
+Response submission service for the Quiz App.
+
+Stores all answers of a survey session at once: the questions of the
+survey are loaded with one query, every answer is validated against them
+in one pass and the accepted answers are written with one multi-row
+INSERT. Used by POST /responses/batch and the Telegram Web App.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import Depends, HTTPException
+
+from models.response import (
+    Response,
+    ResponseBatchItem,
+    ResponseBatchItemResult,
+    ResponseBatchResult,
+)
+from repositories.dependencies import (
+    get_question_repository,
+    get_response_repository,
+)
+from repositories.question import QuestionRepository
+from repositories.response import ResponseRepository
+from services.answer_validation import AnswerValidatorRegistry
+from services.ingestion_buffer import IngestionBuffer
+
+
+class ResponseSubmissionService:
+    """Validate and store the answers of a survey session in one pass."""
+
+    def __init__(
+        self, question_repo: QuestionRepository, response_repo: ResponseRepository
+    ):
+        self.question_repo = question_repo
+        self.response_repo = response_repo
+
+    async def submit_batch(
+        self,
+        survey_id: int,
+        user_session_id: str,
+        answers: Sequence[ResponseBatchItem],
+        *,
+        user_id: Optional[int] = None,
+        respondent_id: Optional[int] = None,
+        validators: Optional[AnswerValidatorRegistry] = None,
+        overwrite_answer: bool = False,
+        require_active: bool = True,
+        buffer: Optional[IngestionBuffer] = None,
+    ) -> ResponseBatchResult:
+        """
+        Store the answers of one session to one survey.
+
+        Answers are accepted or rejected one by one; the accepted ones
+        are written together, the caller's transaction commits them. With
+        a ``buffer`` they are handed to the write-behind buffer instead and
+        reported as accepted; conflicting answers are then skipped silently.
+
+        Args:
+            survey_id: Survey ID
+            user_session_id: Session ID of the user
+            answers: Answers to store
+            user_id: ID of the logged in user
+            respondent_id: ID of the respondent
+            validators: Compiled answer checks, None accepts all answers
+            overwrite_answer: Replace earlier answers instead of rejecting
+            require_active: Reject answers to inactive surveys
+            buffer: Ingestion buffer for acknowledge-after-enqueue writes
+
+        Returns:
+            Per-answer results in the order of ``answers``
+
+        Raises:
+            HTTPException: Survey not found or not active
+            IngestionBufferFull: The buffer cannot take the answers
+        """
+        contexts = {
+            context.question_id: context
+            for context in await self.question_repo.get_answer_contexts_by_survey(
+                survey_id
+            )
+        }
+        if not contexts:
+            raise HTTPException(status_code=404, detail="Survey not found")
+        if require_active and not next(iter(contexts.values())).survey_is_active:
+            raise HTTPException(status_code=400, detail="Survey is not active")
+
+        # Answers to known questions are checked in one pass
+        checked = [item for item in answers if item.question_id in contexts]
+        valid = (
+            validators.validate_many(
+                (contexts[item.question_id], item.answer) for item in checked
+            )
+            if validators is not None
+            else [True] * len(checked)
+        )
+        validity = iter(valid)
+
+        results: List[ResponseBatchItemResult] = []
+        rows: List[Dict[str, Any]] = []
+        seen = set()
+        for item in answers:
+            context = contexts.get(item.question_id)
+            is_valid = context is not None and next(validity)
+            if context is None:
+                results.append(
+                    ResponseBatchItemResult(
+                        question_id=item.question_id,
+                        status="unknown_question",
+                        detail="Question does not belong to the survey",
+                    )
+                )
+            elif item.question_id in seen:
+                results.append(
+                    ResponseBatchItemResult(
+                        question_id=item.question_id,
+                        status="duplicate",
+                        detail="Question answered more than once in the batch",
+                    )
+                )
+            elif not is_valid:
+                results.append(
+                    ResponseBatchItemResult(
+                        question_id=item.question_id,
+                        status="invalid",
+                        detail="Invalid response data for question type",
+                    )
+                )
+            else:
+                seen.add(item.question_id)
+                rows.append(
+                    {
+                        "question_id": item.question_id,
+                        "survey_id": survey_id,
+                        "user_id": user_id,
+                        "user_session_id": user_session_id,
+                        "respondent_id": respondent_id,
+                        "answer": item.answer,
+                    }
+                )
+                # Filled in once the rows are written
+                results.append(
+                    ResponseBatchItemResult(
+                        question_id=item.question_id, status="saved"
+                    )
+                )
+
+        if buffer is not None:
+            for row in rows:
+                buffer.enqueue_for_session(self.response_repo.db, Response, row)
+            for result in results:
+                if result.status == "saved":
+                    result.status = "accepted"
+            return ResponseBatchResult(
+                survey_id=survey_id, saved=len(rows), results=results
+            )
+
+        saved = {
+            response.question_id: response
+            for response in await self.response_repo.insert_many_if_absent(
+                rows, overwrite_answer=overwrite_answer
+            )
+        }
+        for result in results:
+            if result.status != "saved":
+                continue
+            response = saved.get(result.question_id)
+            if response is None:
+                result.status = "duplicate"
+                result.detail = (
+                    "Response already exists for this question. Editing is not allowed."
+                )
+            else:
+                result.response_id = response.id
+                if not overwrite_answer:
+                    result.status = "created"
+
+        return ResponseBatchResult(
+            survey_id=survey_id, saved=len(saved), results=results
+        )
+
+
+def get_response_submission_service(
+    question_repo: QuestionRepository = Depends(get_question_repository),
+    response_repo: ResponseRepository = Depends(get_response_repository),
+) -> ResponseSubmissionService:
+    """Get ResponseSubmissionService instance."""
+    return ResponseSubmissionService(question_repo, response_repo)
@@ -0,0 +1,242 @@
+"""
+Survey snapshot cache for the Quiz App.
+
+Public and private survey pages need the survey and its ordered
+questions. The serialized ``SurveyReadWithQuestions`` of a survey (its
+snapshot) is kept in a two-tier cache (in-process LRU and Redis) under
+``CacheKey.SURVEY_DATA`` and looked up by survey id or, through a small
+token -> id key, by access token. A hit costs no database query.
+
+Snapshots are dropped in all workers once a transaction that wrote the
+survey or one of its questions commits; the TTLs bound staleness
+otherwise. Without a Redis connection only the in-process tier is used.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from models.question import Question, QuestionRead
+from models.survey import Survey, SurveyRead, SurveyReadWithQuestions
+from repositories.question import QuestionRepository
+from repositories.survey import SurveyRepository
+from services.redis_service import CacheKey
+from services.tiered_cache import TieredCache, create_tiered_cache
+
+# Survey ids to invalidate when the session commits, in ``Session.info``
+_PENDING_KEY = "survey_snapshot_invalidations"
+
+# Redis lifetimes of snapshots and of access token -> survey id keys
+SNAPSHOT_TTL = 1800
+TOKEN_TTL = 1800
+
+
+def build_survey_snapshot(survey: Survey, questions: list) -> Dict[str, Any]:
+    """
+    Serialize a survey and its questions.
+
+    Args:
+        survey: Survey instance
+        questions: Questions of the survey
+
+    Returns:
+        JSON-compatible SurveyReadWithQuestions data
+    """
+    questions = sorted(questions, key=lambda q: q.order)
+    return SurveyReadWithQuestions(
+        **SurveyRead.model_validate(survey).model_dump(),
+        questions=[QuestionRead.model_validate(q).model_dump() for q in questions],
+    ).model_dump(mode="json")
+
+
+class SurveySnapshotCache:
+    """
+    Read-through cache of survey snapshots keyed by id and access token.
+    """
+
+    def __init__(self, cache: Optional[TieredCache] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache: Two-tier cache holding the snapshots
+        """
+        # Snapshots are large, Redis keeps them codec-encoded
+        self.cache = cache or create_tiered_cache(binary=True)
+        self.lookups = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Strong references to scheduled invalidations
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get_by_id(
+        self,
+        survey_id: int,
+        survey_repo: SurveyRepository,
+        question_repo: QuestionRepository,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the snapshot of a survey by ID.
+
+        Args:
+            survey_id: Survey ID
+            survey_repo: Survey repository used on a miss
+            question_repo: Question repository used on a miss
+
+        Returns:
+            Survey snapshot or None if the survey does not exist
+        """
+        self.lookups += 1
+        missed: List[bool] = []
+        snapshot = await self._snapshot(survey_id, survey_repo, question_repo, missed)
+        self.misses += bool(missed)
+        return snapshot
+
+    async def get_by_token(
+        self,
+        access_token: str,
+        survey_repo: SurveyRepository,
+        question_repo: QuestionRepository,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the snapshot of a survey by access token.
+
+        Args:
+            access_token: Access token of the survey
+            survey_repo: Survey repository used on a miss
+            question_repo: Question repository used on a miss
+
+        Returns:
+            Survey snapshot or None if no survey has the token
+        """
+        self.lookups += 1
+        token_key = CacheKey.SURVEY_ACCESS_TOKEN.format(access_token=access_token)
+        missed: List[bool] = []
+
+        async def load_survey_id() -> Optional[int]:
+            missed.append(True)
+            survey = await survey_repo.get_by_access_token(access_token)
+            return survey.id if survey else None
+
+        snapshot = None
+        for _ in range(2):
+            survey_id = await self.cache.get_or_load(
+                token_key, load_survey_id, ttl=TOKEN_TTL
+            )
+            if survey_id is None:
+                break
+            snapshot = await self._snapshot(
+                survey_id, survey_repo, question_repo, missed
+            )
+            if snapshot is not None and snapshot.get("access_token") == access_token:
+                break
+            # The token was changed since the key was written
+            snapshot = None
+            await self.cache.invalidate(token_key)
+
+        self.misses += bool(missed)
+        return snapshot
+
+    async def _snapshot(
+        self,
+        survey_id: int,
+        survey_repo: SurveyRepository,
+        question_repo: QuestionRepository,
+        missed: List[bool],
+    ) -> Optional[Dict[str, Any]]:
+        async def load() -> Optional[Dict[str, Any]]:
+            missed.append(True)
+            survey = await survey_repo.get(survey_id)
+            if not survey:
+                return None
+            questions = await question_repo.get_by_survey_id(survey.id)
+            return build_survey_snapshot(survey, questions)
+
+        return await self.cache.get_or_load(
+            CacheKey.SURVEY_DATA.format(survey_id=survey_id), load, ttl=SNAPSHOT_TTL
+        )
+
+    async def invalidate(self, *survey_ids: int) -> None:
+        """
+        Drop the snapshots of surveys in all workers.
+
+        Args:
+            survey_ids: Survey IDs
+        """
+        self.invalidations += len(survey_ids)
+        await self.cache.invalidate(*self._keys(survey_ids))
+
+    @staticmethod
+    def _keys(survey_ids: Iterable[int]) -> List[str]:
+        return [CacheKey.SURVEY_DATA.format(survey_id=i) for i in survey_ids]
+
+    def invalidate_after_commit(self, session: Session, survey_id: int) -> None:
+        """
+        Drop the snapshot of a survey once the session's transaction commits.
+
+        Args:
+            session: Session writing the survey
+            survey_id: Survey ID
+        """
+        session.info.setdefault(_PENDING_KEY, set()).add(survey_id)
+
+    def _schedule(self, survey_ids: Set[int]) -> None:
+        # This worker stops serving the snapshots right away
+        self.cache.discard_local(*self._keys(survey_ids))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, migrations): Redis entries expire by TTL
+            return
+        task = loop.create_task(self.invalidate(*sorted(survey_ids)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss and invalidation counters and the
+            counters of the two-tier cache
+        """
+        hits = self.lookups - self.misses
+        return {
+            "hits": hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(hits / self.lookups, 4) if self.lookups else 0.0,
+            "tiers": self.cache.stats(),
+        }
+
+
+# Process-wide cache used by the survey endpoints
+survey_snapshot_cache = SurveySnapshotCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_after_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Survey) and obj.id is not None:
+            survey_snapshot_cache.invalidate_after_commit(session, obj.id)
+        elif isinstance(obj, Question):
+            # A question moved to another survey changes both surveys
+            history = inspect(obj).attrs.survey_id.history
+            for survey_id in (obj.survey_id, *history.deleted):
+                if survey_id is not None:
+                    survey_snapshot_cache.invalidate_after_commit(session, survey_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    survey_ids = session.info.pop(_PENDING_KEY, None)
+    if survey_ids:
+        survey_snapshot_cache._schedule(survey_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -14,7 +14,7 @@ from typing import Any, Optional
 from urllib.parse import parse_qsl, unquote
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import get_settings
@@ -209,19 +209,17 @@ class TelegramWebAppService:
 
             for survey in surveys:
                 # Count questions
-                questions_stmt = select(Question).where(Question.survey_id == survey.id)
-                questions_result = await session.execute(questions_stmt)
-                questions_count = len(questions_result.scalars().all())
+                questions_stmt = select(func.count(Question.id)).where(
+                    Question.survey_id == survey.id
+                )
+                questions_count = (await session.execute(questions_stmt)).scalar()
 
                 # Count user's responses
-                responses_stmt = select(Response).where(
+                responses_stmt = select(func.count(Response.id)).where(
+                    Response.survey_id == survey.id,
                     Response.user_id == user_id,
-                    Response.question_id.in_(
-                        select(Question.id).where(Question.survey_id == survey.id)
-                    ),
                 )
-                responses_result = await session.execute(responses_stmt)
-                user_responses = len(responses_result.scalars().all())
+                user_responses = (await session.execute(responses_stmt)).scalar()
 
                 # Determine completion status
                 completion_percentage = (
@@ -271,8 +269,8 @@ class TelegramWebAppService:
 
             # Get user's responses
             responses_stmt = select(Response).where(
+                Response.survey_id == survey_id,
                 Response.user_id == user_id,
-                Response.question_id.in_([q.id for q in questions]),
             )
             responses_result = await session.execute(responses_stmt)
             responses = {r.question_id: r for r in responses_result.scalars().all()}
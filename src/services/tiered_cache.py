@@ -0,0 +1,380 @@
+"""
+Two-tier cache for the Quiz App.
+
+Values are looked up in a bounded in-process TTL/LRU tier first, then in
+Redis, and only then built by the caller's loader. Concurrent misses of
+a key are coalesced: one coroutine per process loads it and the others
+await its result, and a short Redis lock (SET NX) makes other workers
+wait for the value instead of rebuilding it as well.
+
+Expired local entries can be served for a while longer (stale while
+revalidate): the first request after expiry refreshes the entry inline,
+requests arriving during the refresh get the stale value at once. The
+loader always runs in the request that asked for it, so it may use that
+request's database session.
+
+Invalidations delete the Redis key, bump its version and are broadcast
+over Redis pub/sub, so the in-process tiers of all workers drop the key;
+the short local TTL bounds staleness when a message is lost. A value is
+written back to Redis only if the key's version did not change while it
+was being built, so a load racing an invalidation on another worker
+cannot restore the old value.
+
+In binary mode values are stored in Redis with the configured cache
+codec (see ``services.cache_codec``) instead of JSON text.
+"""
+
+import asyncio
+from collections import OrderedDict
+import json
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+import uuid
+
+from config import settings
+from services.redis_service import RedisService, get_redis_service
+
+logger = logging.getLogger(__name__)
+
+# Poll interval while another worker rebuilds a key
+LOCK_POLL_INTERVAL = 0.05
+
+# Lifetime of the per-key invalidation versions in Redis
+VERSION_TTL = 86400
+
+
+class _LoadCancelled(Exception):
+    """Set on an in-flight load whose leader was cancelled."""
+
+
+class _Entry:
+    """Cached value with its fresh and stale deadlines."""
+
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class TieredCache:
+    """
+    In-process LRU tier in front of Redis with single-flight loading.
+
+    Values must be serializable by the Redis encoding in use and are
+    shared between callers, so they must not be modified. None is never
+    cached.
+    """
+
+    def __init__(
+        self,
+        redis_service: Optional[RedisService] = None,
+        *,
+        max_size: int = 10000,
+        local_ttl: float = 5.0,
+        stale_ttl: float = 0.0,
+        lock_ttl: float = 5.0,
+        channel: str = "cache:invalidate",
+        binary: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_service: Redis service, the global one when None
+            max_size: Maximum number of in-process entries
+            local_ttl: In-process entry lifetime in seconds
+            stale_ttl: Serve expired entries this long while refreshing
+            lock_ttl: Lifetime of the cross-worker rebuild lock in seconds
+            channel: Redis pub/sub channel for invalidations
+            binary: Store Redis values with the cache codec instead of JSON
+        """
+        self.redis_service = redis_service
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.stale_ttl = stale_ttl
+        self.lock_ttl = lock_ttl
+        self.channel = channel
+        self.binary = binary
+        self._origin = uuid.uuid4().hex
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped by every invalidation; loads started before it are not stored
+        self._generation = 0
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._stats = {
+            "local_hits": 0,
+            "stale_hits": 0,
+            "redis_hits": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "lock_waits": 0,
+            "invalidations": 0,
+            "remote_invalidations": 0,
+        }
+
+    async def _redis(self) -> Optional[RedisService]:
+        redis_service = self.redis_service or await get_redis_service()
+        return redis_service if redis_service.connected else None
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Get a value, building it with ``loader`` when no tier has it.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function building the value, may return None
+            ttl: Redis lifetime in seconds, the Redis default when None
+
+        Returns:
+            Cached or loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                self._stats["local_hits"] += 1
+                return entry.value
+            if now < entry.stale_until and key in self._inflight:
+                self._stats["stale_hits"] += 1
+                return entry.value
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except _LoadCancelled:
+                # The leading request went away, one follower loads instead
+                return await self.get_or_load(key, loader, ttl=ttl)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._fetch(key, loader, ttl)
+        except asyncio.CancelledError:
+            # Only the leader is cancelled, its followers take over
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Nobody may be waiting, do not log the exception again
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[int]
+    ) -> Any:
+        generation = self._generation
+        redis_service = await self._redis()
+        if redis_service is None:
+            value = await self._load(loader)
+            self._store_local(key, value, generation)
+            return value
+
+        value = await self._redis_get(redis_service, key)
+        if value is not None:
+            self._stats["redis_hits"] += 1
+            self._store_local(key, value, generation)
+            return value
+
+        lock_key = f"{key}:rebuild"
+        locked = await redis_service.set(
+            lock_key, self._origin, ttl=math.ceil(self.lock_ttl), nx=True
+        )
+        if not locked:
+            # Another worker is building the value
+            self._stats["lock_waits"] += 1
+            value = await self._wait_for(redis_service, key)
+            if value is not None:
+                self._store_local(key, value, generation)
+                return value
+
+        try:
+            version = await redis_service.get_version(key)
+            value = await self._load(loader)
+            if value is not None and generation == self._generation:
+                await redis_service.set_if_version(
+                    key, value, version, ttl=ttl, binary=self.binary
+                )
+        finally:
+            if locked:
+                await redis_service.delete(lock_key)
+        self._store_local(key, value, generation)
+        return value
+
+    async def _load(self, loader: Callable[[], Awaitable[Any]]) -> Any:
+        self._stats["loads"] += 1
+        return await loader()
+
+    async def _wait_for(self, redis_service: RedisService, key: str) -> Any:
+        deadline = time.monotonic() + self.lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            value = await self._redis_get(redis_service, key)
+            if value is not None:
+                return value
+        return None
+
+    async def _redis_get(self, redis_service: RedisService, key: str) -> Any:
+        if self.binary:
+            return await redis_service.get_binary(key)
+        return await redis_service.get(key)
+
+    def _store_local(self, key: str, value: Any, generation: int) -> None:
+        if value is None or generation != self._generation or self.local_ttl <= 0:
+            return
+        fresh_until = time.monotonic() + self.local_ttl
+        self._entries[key] = _Entry(value, fresh_until, fresh_until + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        Drop keys from both tiers of all workers.
+
+        Args:
+            keys: Cache keys
+        """
+        if not keys:
+            return
+        self._stats["invalidations"] += len(keys)
+        self.discard_local(*keys)
+
+        redis_service = await self._redis()
+        if redis_service is None:
+            return
+        await redis_service.invalidate_versioned(*keys, version_ttl=VERSION_TTL)
+        await redis_service.publish(
+            self.channel, {"origin": self._origin, "keys": list(keys)}
+        )
+
+    def discard_local(self, *keys: str) -> None:
+        """
+        Drop keys from the in-process tier of this worker only.
+
+        Args:
+            keys: Cache keys
+        """
+        self._generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear_local(self) -> None:
+        """Drop all in-process entries."""
+        self._generation += 1
+        self._entries.clear()
+
+    async def start(self) -> None:
+        """Subscribe to invalidations of other workers."""
+        if self._listener is not None:
+            return
+        redis_service = await self._redis()
+        pubsub = redis_service.pubsub() if redis_service is not None else None
+        if pubsub is None:
+            return
+        await pubsub.subscribe(self.channel)
+        self._pubsub = pubsub
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+        try:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+        except Exception as e:
+            logger.error(f"Error closing cache invalidation subscription: {e}")
+        self._pubsub = None
+
+    async def _listen(self, pubsub) -> None:
+        try:
+            async for message in pubsub.listen():
+                self._on_message(message.get("data"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Local entries still expire after local_ttl
+            logger.error(f"Cache invalidation listener stopped: {e}")
+
+    def _on_message(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("origin") == self._origin:
+            return
+        self._generation += 1
+        for key in payload.get("keys", ()):
+            if self._entries.pop(key, None) is not None:
+                self._stats["remote_invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with per-tier hit, load and invalidation counters
+        """
+        hits = (
+            self._stats["local_hits"]
+            + self._stats["stale_hits"]
+            + self._stats["redis_hits"]
+        )
+        lookups = hits + self._stats["loads"] + self._stats["coalesced"]
+        return {
+            **self._stats,
+            "local_size": len(self._entries),
+            "max_size": self.max_size,
+            "listening": self._listener is not None,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def create_tiered_cache(
+    redis_service: Optional[RedisService] = None, *, binary: bool = False
+) -> TieredCache:
+    """
+    Create a two-tier cache with the configured settings.
+
+    Args:
+        redis_service: Redis service, the global one when None
+        binary: Store Redis values with the cache codec instead of JSON
+
+    Returns:
+        Two-tier cache
+    """
+    return TieredCache(
+        redis_service,
+        max_size=settings.tiered_cache_local_size,
+        local_ttl=settings.tiered_cache_local_ttl,
+        stale_ttl=settings.tiered_cache_stale_ttl,
+        lock_ttl=settings.tiered_cache_lock_ttl,
+        channel=settings.tiered_cache_channel,
+        binary=binary,
+    )
@@ -15,7 +15,9 @@
 """
 
 import asyncio
+import importlib.util
 import logging
+import math
 import os
 import sys
 from contextlib import asynccontextmanager
@@ -152,6 +154,31 @@ class MockRedisService:
                     del self.expires[key]
         return count
 
+    async def get_version(self, key: str) -> int:
+        """Версия ключа для инвалидации (0, если ключ не инвалидировался)."""
+        return await self.get(f"{key}:version") or 0
+
+    async def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: int,
+        ttl: Optional[int] = None,
+        binary: bool = False,
+    ) -> bool:
+        """Записать значение, если ключ не инвалидировали после чтения версии."""
+        if await self.get_version(key) != version:
+            return False
+        return await self.set(key, value, ttl=ttl)
+
+    async def invalidate_versioned(self, *keys: str, version_ttl: int = 86400) -> int:
+        """Удалить ключи и увеличить их версии."""
+        for key in keys:
+            version = await self.get_version(key)
+            await self.delete(key)
+            await self.set(f"{key}:version", version + 1, ttl=version_ttl)
+        return len(keys)
+
     async def publish(self, channel: str, message: Any) -> int:
         """Публикация сообщения в канал."""
         subscribers = self.subscribers.get(channel, [])
@@ -165,6 +192,36 @@ class MockRedisService:
             self.subscribers[channel] = []
         self.subscribers[channel].append(callback)
 
+    async def track_user_action(
+        self, user_id: int, action: str, timestamp=None, **ttls
+    ) -> int:
+        """Учет действия пользователя (счетчики в памяти)."""
+        async with self._lock:
+            for key in (f"user_action:{action}", "user_action:total"):
+                self.storage[key] = self.storage.get(key, 0) + 1
+            user_data = self.storage.setdefault(f"user_analytics:{user_id}", {})
+            user_data[action] = user_data.get(action, 0) + 1
+            user_data["last_action"] = action
+            return user_data[action]
+
+    async def hit_rate_limit(
+        self, key: str, limit: int, window: float, algorithm=None
+    ):
+        """Ограничение частоты запросов (фиксированное окно в памяти)."""
+        rate_key = f"rate_limit:{key}"
+        if await self.get(rate_key) is None:
+            await self.set(rate_key, 0, ttl=math.ceil(window))
+        async with self._lock:
+            self.storage[rate_key] += 1
+            count = self.storage[rate_key]
+        reset_after = (self.expires[rate_key] - datetime.utcnow()).total_seconds()
+        return load_real_redis_service().RateLimitResult(
+            allowed=count <= limit,
+            limit=limit,
+            remaining=max(0, limit - count),
+            reset_after=max(0.0, reset_after),
+        )
+
     async def health_check(self) -> Dict[str, Any]:
         """Проверка здоровья сервиса."""
         return {
@@ -292,6 +349,29 @@ _mock_services = MockExternalServices()
 # ============================================================================
 
 
+_real_redis_service = None
+
+
+def load_real_redis_service():
+    """
+    Загрузить настоящий модуль services.redis_service в обход мока.
+
+    При загрузке к Redis не подключается. Нужен тестам самого RedisService
+    и для типов данных, которые мок отдает приложению как есть.
+    """
+    global _real_redis_service
+    if _real_redis_service is None:
+        spec = importlib.util.spec_from_file_location(
+            "_real_redis_service",
+            PROJECT_ROOT / "src" / "services" / "redis_service.py",
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _real_redis_service = module
+    return _real_redis_service
+
+
 def setup_module_mocks():
     """
     Настройка всех системных моков.
@@ -307,6 +387,14 @@ def setup_module_mocks():
         return_value=_mock_services.redis
     )
     sys.modules["services.redis_service"].RedisService = MockRedisService
+    # Ключи кэша, результаты и параметры лимитера - настоящие типы данных
+    real_redis_service = load_real_redis_service()
+    for name in ("CacheKey", "RateLimitAlgorithm", "RateLimitResult"):
+        setattr(
+            sys.modules["services.redis_service"],
+            name,
+            getattr(real_redis_service, name),
+        )
 
     # Мокируем Telegram
     sys.modules["aiogram"] = MagicMock()
@@ -339,7 +427,7 @@ setup_module_mocks()
 
 # Импорты после мокирования
 from config import Settings
-from database import Base, get_async_session
+from database import Base, get_async_read_session, get_async_session
 from main import app
 
 
@@ -395,7 +483,7 @@ async def test_engine(test_settings):
     logger.info("Creating test database engine")
 
     engine = create_async_engine(
-        test_settings.DATABASE_URL,
+        test_settings.database_url,
         echo=False,  # Отключаем SQL логи в тестах
         poolclass=StaticPool,
         connect_args={
@@ -455,6 +543,7 @@ async def test_client(
         yield async_session
 
     app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_async_read_session] = override_get_async_session
 
     try:
         async with AsyncClient(
@@ -744,6 +833,12 @@ def mock_redis_service():
     return _mock_services.redis
 
 
+@pytest.fixture
+def real_redis_service_module():
+    """Настоящий модуль services.redis_service (без подключения к Redis)."""
+    return load_real_redis_service()
+
+
 @pytest.fixture
 def mock_telegram_service():
     """Mock Telegram сервиса для тестов."""
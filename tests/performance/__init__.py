@@ -0,0 +1,14 @@
+"""
+Бенчмарки производительности Quiz App.
+
+Скрипты в этом пакете не собираются pytest (имена bench_*.py) и
+запускаются вручную, например:
+
+    python -m tests.performance.bench_sqlite_profile
+
+Каждый бенчмарк сравнивает поведение "до" и "после" оптимизации на
+временной SQLite базе и печатает сводную таблицу.
+
+audit_indexes печатает EXPLAIN QUERY PLAN для запросов всех репозиториев
+и помечает полные сканы таблиц (make audit-indexes).
+"""
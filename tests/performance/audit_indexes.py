@@ -0,0 +1,296 @@
+"""
+Аудит индексов: EXPLAIN QUERY PLAN для всех запросов репозиториев.
+
+Создаёт временную SQLite базу по моделям, заполняет её небольшим набором
+данных и вызывает каждый читающий метод каждого репозитория (get_*,
+count*, find_*, search_*, has_*, exists, load*, export_*). Аргументы
+подбираются по имени и типу параметра. Для каждого уникального запроса
+печатается план выполнения; полные сканы таблиц помечаются.
+
+Запуск:
+    python -m tests.performance.audit_indexes [--only-scans] [--strict]
+
+С --strict команда завершается с кодом 1, если найден хотя бы один
+полный скан (удобно для CI).
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import inspect
+import logging
+import re
+import sys
+from typing import Any, get_origin
+
+from tests.performance.common import print_table, temp_database_url
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database import Base, SlowQueryLog
+import models  # noqa: F401  (регистрация всех таблиц)
+from models.consent_log import ConsentLog
+from models.question import Question
+from models.respondent import Respondent
+from models.respondent_event import RespondentEvent
+from models.respondent_survey import RespondentSurvey
+from models.response import Response
+from models.survey import Survey
+from models.user import User
+import repositories
+from repositories.base import BaseRepository
+
+# Методы, которые только читают данные
+READ_PREFIXES = (
+    "get",
+    "count",
+    "find",
+    "search",
+    "has",
+    "exists",
+    "load",
+    "export",
+)
+
+# Значения параметров по имени; совпадают с засеянными данными
+SAMPLE_VALUES = {
+    "session_id": "session-1",
+    "user_session_id": "session-1",
+    "access_token": "token-1",
+    "username": "user1",
+    "email": "user1@example.com",
+    "identifier": "user1",
+    "search_term": "user",
+    "fingerprint": "fp-1",
+    "ip_address": "127.0.0.1",
+    "event_type": "survey_started",
+    "event_types": ["survey_started"],
+    "consent_type": "data_processing",
+    "field_name": "id",
+    "field_values": [1],
+    "ids": [1, 2],
+    "value": 1,
+    "hours": 24,
+    "days": 30,
+}
+
+# "SCAN response" (SQLite >= 3.36) или "SCAN TABLE response" без индекса
+FULL_SCAN = re.compile(
+    r"^SCAN (?:TABLE )?(?!CONSTANT ROW|SUBQUERY)(\w+)(?!.*\bINDEX\b)"
+)
+
+
+async def _seed(conn) -> None:
+    await conn.execute(
+        insert(User),
+        [
+            {"username": f"user{i}", "email": f"user{i}@example.com"}
+            for i in range(1, 4)
+        ],
+    )
+    await conn.execute(
+        insert(Survey),
+        [
+            {"title": f"Survey {i}", "access_token": f"token-{i}", "created_by": 1}
+            for i in range(1, 4)
+        ],
+    )
+    await conn.execute(
+        insert(Question),
+        [
+            {"survey_id": s, "title": f"Q{j}", "question_type": "TEXT", "order": j}
+            for s in range(1, 4)
+            for j in range(3)
+        ],
+    )
+    await conn.execute(
+        insert(Respondent),
+        [
+            {"session_id": f"session-{i}", "user_id": i, "browser_fingerprint": "fp-1"}
+            for i in range(1, 4)
+        ],
+    )
+    await conn.execute(
+        insert(RespondentSurvey),
+        [
+            {"respondent_id": i, "survey_id": i, "total_questions": 3}
+            for i in range(1, 4)
+        ],
+    )
+    await conn.execute(
+        insert(Response),
+        [
+            {
+                "question_id": q,
+                "survey_id": (q - 1) // 3 + 1,
+                "user_id": 1,
+                "user_session_id": "session-1",
+                "respondent_id": 1,
+                "answer": {"value": "ok"},
+            }
+            for q in range(1, 10)
+        ],
+    )
+    await conn.execute(
+        insert(RespondentEvent),
+        [
+            {"respondent_id": 1, "survey_id": 1, "event_type": "survey_started"}
+            for _ in range(3)
+        ],
+    )
+    await conn.execute(
+        insert(ConsentLog),
+        [
+            {
+                "respondent_id": 1,
+                "survey_id": 1,
+                "consent_type": "data_processing",
+                "is_granted": True,
+            }
+        ],
+    )
+
+
+def _sample_argument(parameter: inspect.Parameter) -> Any:
+    """Подобрать значение обязательного параметра или вернуть KeyError."""
+    if parameter.name in SAMPLE_VALUES:
+        return SAMPLE_VALUES[parameter.name]
+    annotation = parameter.annotation
+    if parameter.name == "id" or parameter.name.endswith("_id") or annotation is int:
+        return 1
+    if annotation is datetime:
+        return datetime.utcnow() - (
+            timedelta(days=30) if "from" in parameter.name else timedelta()
+        )
+    if annotation is bool:
+        return True
+    if annotation is list or get_origin(annotation) is list:
+        return [1]
+    raise KeyError(parameter.name)
+
+
+def _read_methods(repository_class: type) -> list[str]:
+    return sorted(
+        name
+        for name, member in inspect.getmembers(repository_class)
+        if name.startswith(READ_PREFIXES) and inspect.iscoroutinefunction(member)
+    )
+
+
+async def _audit_repository(session, repository_class, log, results) -> list[dict]:
+    skipped = []
+    repository = repository_class(session)
+    for name in _read_methods(repository_class):
+        method = getattr(repository, name)
+        try:
+            kwargs = {
+                parameter.name: _sample_argument(parameter)
+                for parameter in inspect.signature(method).parameters.values()
+                if parameter.default is inspect.Parameter.empty
+                and parameter.kind
+                not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+            }
+        except KeyError as e:
+            skipped.append(
+                {"method": f"{repository_class.__name__}.{name}", "reason": f"arg {e}"}
+            )
+            continue
+
+        log.clear()
+        try:
+            await method(**kwargs)
+        except Exception as e:
+            skipped.append(
+                {
+                    "method": f"{repository_class.__name__}.{name}",
+                    "reason": type(e).__name__,
+                }
+            )
+            await session.rollback()
+            continue
+
+        for entry in reversed(log.entries()):
+            results.setdefault(
+                entry["statement"],
+                {
+                    "method": f"{repository_class.__name__}.{name}",
+                    "plan": entry["plan"] or [],
+                },
+            )
+    return skipped
+
+
+def _full_scans(plan: list[str]) -> list[str]:
+    return [
+        match.group(1)
+        for line in plan
+        if (match := FULL_SCAN.match(line.strip()))
+    ]
+
+
+async def main(only_scans: bool, strict: bool) -> int:
+    # Журнал медленных запросов с нулевым порогом видит каждый запрос
+    logging.getLogger("database").setLevel(logging.ERROR)
+    log = SlowQueryLog(threshold_ms=0, max_entries=1000)
+
+    engine = create_async_engine(temp_database_url("audit.db"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await _seed(conn)
+    log.install(engine)
+
+    repository_classes = [
+        getattr(repositories, name)
+        for name in repositories.__all__
+        if isinstance(getattr(repositories, name), type)
+        and issubclass(getattr(repositories, name), BaseRepository)
+        and getattr(repositories, name) is not BaseRepository
+    ]
+
+    results: dict[str, dict] = {}
+    skipped: list[dict] = []
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for repository_class in repository_classes:
+            skipped += await _audit_repository(
+                session, repository_class, log, results
+            )
+        # Аудит ничего не должен менять
+        await session.rollback()
+    await engine.dispose()
+
+    scans = []
+    for statement, result in results.items():
+        tables = _full_scans(result["plan"])
+        if tables:
+            scans.append(
+                {
+                    "method": result["method"],
+                    "full scan": ", ".join(sorted(set(tables))),
+                }
+            )
+        if only_scans and not tables:
+            continue
+        print(f"\n{result['method']}{'  !! FULL SCAN' if tables else ''}")
+        print(f"  {statement[:300]}")
+        for line in result["plan"]:
+            marker = "!!" if _full_scans([line]) else "  "
+            print(f"  {marker} {line}")
+
+    print(f"\nAudited {len(results)} query shapes")
+    print_table("Full table scans", scans)
+    print_table("Skipped methods", skipped)
+
+    return 1 if strict and scans else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--only-scans", action="store_true", help="print only plans with full scans"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="exit with 1 when full scans are found"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.only_scans, args.strict)))
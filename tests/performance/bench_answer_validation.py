@@ -0,0 +1,157 @@
+"""
+Микробенчмарк валидации ответов по типу вопроса.
+
+Сравнивает прежнюю цепочку if/elif (импорт re и поиск выражения в кэше
+re на каждый вызов) с реестром скомпилированных валидаторов: по одному
+ответу через ``validate`` и ``validator_for_type`` (настройки типа по
+умолчанию) и пакетом через ``validate_many``.
+
+Запуск:
+    python -m tests.performance.bench_answer_validation [--answers 200000]
+"""
+
+import argparse
+import time
+
+from tests.performance.common import print_table
+
+from repositories.answer_context import AnswerContext
+from services.answer_validation import AnswerValidatorRegistry
+
+ANSWERS = [
+    ("TEXT", {"value": "Отличный сервис"}),
+    ("YES_NO", {"value": "yes"}),
+    ("RATING_1_10", {"value": 8}),
+    ("EMAIL", {"value": "user@example.com"}),
+    ("PHONE", {"value": "+7 (999) 123-45-67"}),
+    ("GEOLOCATION", {"location": {"latitude": 55.75, "longitude": 37.62}}),
+    ("NFC_SCAN", {"nfc_data": {"tag_id": "04A224", "tag_type": "NTAG213"}}),
+    ("FILE_UPLOAD", {"file": {"filename": "a.pdf", "content_type": "application/pdf"}}),
+]
+
+
+def _legacy_validate(question_type: str, answer: dict) -> bool:
+    """Прежняя цепочка проверок ответа по типу вопроса из routers.responses."""
+    try:
+        if question_type in ["TEXT", "text"]:
+            value = answer.get("value")
+            return isinstance(value, str) and len(value.strip()) > 0
+        elif question_type in ["YES_NO", "boolean"]:
+            value = answer.get("value")
+            if isinstance(value, bool):
+                return True
+            elif isinstance(value, str):
+                return value.lower() in ["true", "false", "yes", "no"]
+            return False
+        elif question_type in ["RATING_1_10", "rating"]:
+            value = answer.get("value")
+            if not isinstance(value, (int, float)):
+                return False
+            return 1 <= value <= 10
+        elif question_type == "EMAIL":
+            email_value = answer.get("value")
+            if not isinstance(email_value, str):
+                return False
+            import re
+
+            email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+            return re.match(email_pattern, email_value) is not None
+        elif question_type == "PHONE":
+            phone_value = answer.get("value")
+            if not isinstance(phone_value, str):
+                return False
+            import re
+
+            return re.match(r"^\+?[\d\s\-\(\)]{7,15}$", phone_value) is not None
+        elif question_type == "FILE_UPLOAD":
+            file_data = answer.get("file")
+            if not file_data:
+                return False
+            return (
+                isinstance(file_data, dict)
+                and "filename" in file_data
+                and "content_type" in file_data
+                and len(file_data.get("filename", "")) > 0
+            )
+        elif question_type == "GEOLOCATION":
+            location = answer.get("location")
+            if not isinstance(location, dict):
+                return False
+            lat = location.get("latitude")
+            lng = location.get("longitude")
+            return (
+                isinstance(lat, (int, float))
+                and isinstance(lng, (int, float))
+                and -90 <= lat <= 90
+                and -180 <= lng <= 180
+            )
+        elif question_type == "NFC_SCAN":
+            nfc_data = answer.get("nfc_data")
+            if not isinstance(nfc_data, dict):
+                return False
+            return (
+                "tag_id" in nfc_data
+                and "tag_type" in nfc_data
+                and len(nfc_data.get("tag_id", "")) > 0
+            )
+        return True
+    except Exception:
+        return False
+
+
+def _context(question_id: int, question_type: str) -> AnswerContext:
+    return AnswerContext(
+        question_id=question_id,
+        question_type=question_type,
+        is_required=True,
+        options=None,
+        question_data=None,
+        survey_id=1,
+        survey_is_active=True,
+        survey_is_public=True,
+    )
+
+
+def _row(name: str, answers: int, elapsed: float) -> dict:
+    return {
+        "path": name,
+        "answers/s": answers / elapsed,
+        "ns/answer": elapsed / answers * 1e9,
+    }
+
+
+def main(answers: int) -> None:
+    contexts = [_context(i, t) for i, (t, _) in enumerate(ANSWERS)]
+    items = [
+        (contexts[i % len(ANSWERS)], ANSWERS[i % len(ANSWERS)][1])
+        for i in range(answers)
+    ]
+    registry = AnswerValidatorRegistry()
+
+    started = time.perf_counter()
+    legacy = [_legacy_validate(c.question_type, a) for c, a in items]
+    rows = [_row("if/elif chain", answers, time.perf_counter() - started)]
+
+    started = time.perf_counter()
+    single = [registry.validate(c, a) for c, a in items]
+    rows.append(_row("registry.validate", answers, time.perf_counter() - started))
+
+    started = time.perf_counter()
+    by_type = [registry.validator_for_type(c.question_type)(a) for c, a in items]
+    rows.append(
+        _row("registry.validator_for_type", answers, time.perf_counter() - started)
+    )
+
+    started = time.perf_counter()
+    batch = registry.validate_many(items)
+    rows.append(_row("registry.validate_many", answers, time.perf_counter() - started))
+
+    assert legacy == single == by_type == batch
+    print_table(f"Answer validation, {answers} answers", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--answers", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.answers)
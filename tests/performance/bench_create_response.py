@@ -0,0 +1,142 @@
+"""
+Бенчмарк горячего пути сохранения ответа (POST /responses/).
+
+Сравнивает старую последовательность запросов (вопрос, опрос по вопросу,
+проверка дубликата, вставка) с новой (answer context из кэша или одним
+JOIN и INSERT ... ON CONFLICT DO NOTHING RETURNING). Каждый ответ
+сохраняется в своей сессии и транзакции, как отдельный HTTP запрос.
+Респондент передаётся готовым, чтобы сравнивать только путь ответа.
+Строка batch сохраняет все ответы сессии одним POST /responses/batch
+(``ResponseSubmissionService.submit_batch``) в одной транзакции.
+
+Запуск:
+    python -m tests.performance.bench_create_response [--responses 5000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from tests.performance.common import print_table, temp_database_url
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from database import Base
+import models  # noqa: F401  (регистрация всех таблиц)
+from models.question import Question
+from models.response import ResponseBatchItem, ResponseCreate
+from models.survey import Survey
+from repositories.answer_context import answer_context_cache
+from repositories.question import QuestionRepository
+from repositories.response import ResponseRepository
+from services.response_submission import ResponseSubmissionService
+
+QUESTIONS = 20
+
+
+async def _create_before(session: AsyncSession, data: ResponseCreate) -> None:
+    questions = QuestionRepository(session)
+    responses = ResponseRepository(session)
+    question = await questions.get(data.question_id)
+    # Прежний QuestionRepository.get_survey_by_question_id
+    result = await session.execute(
+        select(Question)
+        .options(selectinload(Question.survey))
+        .where(Question.id == data.question_id)
+    )
+    survey = result.scalars().first().survey
+    assert question is not None and survey.is_active
+    existing = await responses.get_by_question_and_session(
+        data.question_id, data.user_session_id
+    )
+    assert existing is None
+    await responses.create(obj_in=data)
+
+
+async def _create_after(session: AsyncSession, data: ResponseCreate) -> None:
+    context = await QuestionRepository(session).get_answer_context(data.question_id)
+    assert context is not None and context.survey_is_active
+    _, created = await ResponseRepository(session).create_if_absent(
+        obj_in=data, survey_id=context.survey_id
+    )
+    assert created
+
+
+async def _submit_session(engine, name: str, start: int, responses: int) -> None:
+    answers = [
+        ResponseBatchItem(question_id=i % QUESTIONS + 1, answer={"value": "ok"})
+        for i in range(start, min(start + QUESTIONS, responses))
+    ]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        result = await ResponseSubmissionService(
+            QuestionRepository(session), ResponseRepository(session)
+        ).submit_batch(1, f"{name}-{start // QUESTIONS}", answers)
+        assert result.saved == len(answers)
+        await session.commit()
+
+
+async def _run(engine, name: str, create, responses: int) -> dict:
+    statements = {"count": 0}
+
+    def _on_execute(*args):
+        statements["count"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _on_execute)
+    started = time.perf_counter()
+    if create is None:
+        for start in range(0, responses, QUESTIONS):
+            await _submit_session(engine, name, start, responses)
+    else:
+        for i in range(responses):
+            data = ResponseCreate(
+                question_id=i % QUESTIONS + 1,
+                user_session_id=f"{name}-{i // QUESTIONS}",
+                answer={"value": "ok"},
+            )
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await create(session, data)
+    elapsed = time.perf_counter() - started
+    event.remove(engine.sync_engine, "before_cursor_execute", _on_execute)
+
+    return {
+        "path": name,
+        "responses/s": responses / elapsed,
+        "avg ms": elapsed / responses * 1000,
+        "statements/response": statements["count"] / responses,
+    }
+
+
+async def main(responses: int) -> None:
+    engine = create_async_engine(temp_database_url("create_response.db"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Survey), [{"title": "Survey", "is_active": True}])
+        await conn.execute(
+            insert(Question),
+            [
+                {"survey_id": 1, "title": f"Q{i}", "question_type": "TEXT", "order": i}
+                for i in range(QUESTIONS)
+            ],
+        )
+
+    answer_context_cache.clear()
+    rows = [
+        await _run(engine, "before", _create_before, responses),
+        await _run(engine, "after", _create_after, responses),
+    ]
+    rows[-1]["cache hit rate"] = answer_context_cache.stats()["hit_rate"]
+    rows[0]["cache hit rate"] = "-"
+    rows.append(await _run(engine, "batch", None, responses))
+    rows[-1]["cache hit rate"] = "-"
+
+    await engine.dispose()
+    print_table(f"POST /responses/ hot path, {responses} responses", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.responses))
@@ -0,0 +1,173 @@
+"""
+Бенчмарк денормализованного response.survey_id.
+
+Сравнивает запросы "по опросу" в старом виде (JOIN question и фильтр по
+question.survey_id, без индексов на response) с новым (фильтр по
+response.survey_id и составные индексы) на одной и той же базе.
+
+Запуск:
+    python -m tests.performance.bench_response_survey_id [--responses 1000000]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from tests.performance.common import (
+    mean,
+    percentile,
+    print_table,
+    temp_database_url,
+)
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database import Base
+import models  # noqa: F401  (регистрация всех таблиц)
+from models.question import Question
+from models.response import Response
+from models.survey import Survey
+
+SURVEYS = 50
+QUESTIONS_PER_SURVEY = 10
+SESSIONS_PER_SURVEY = 2000
+CHUNK_SIZE = 50000
+
+SURVEY_INDEXES = [
+    index
+    for index in Response.__table__.indexes
+    if "survey_id" in index.columns.keys()
+]
+
+
+def _queries(denormalized: bool) -> dict:
+    """Запросы репозиториев в старом (JOIN) и новом виде."""
+    if denormalized:
+        survey_filter = Response.survey_id
+
+        def scoped(query):
+            return query
+    else:
+        survey_filter = Question.survey_id
+
+        def scoped(query):
+            return query.join(Question, Response.question_id == Question.id)
+
+    return {
+        "count_responses_by_survey": lambda survey_id, session_id: scoped(
+            select(func.count(Response.id))
+        ).where(survey_filter == survey_id),
+        "get_by_user_session_and_survey": lambda survey_id, session_id: scoped(
+            select(Response.id, Response.answer)
+        ).where(survey_filter == survey_id, Response.user_session_id == session_id),
+        "survey_stats": lambda survey_id, session_id: scoped(
+            select(
+                func.count(func.distinct(Response.user_session_id)),
+                func.count(Response.id),
+                func.min(Response.created_at),
+                func.max(Response.created_at),
+            )
+        ).where(survey_filter == survey_id),
+    }
+
+
+async def _seed(conn, responses: int) -> None:
+    await conn.execute(
+        insert(Survey),
+        [
+            {"title": f"Survey {i}", "is_active": True, "is_public": True}
+            for i in range(SURVEYS)
+        ],
+    )
+    await conn.execute(
+        insert(Question),
+        [
+            {
+                "survey_id": survey_id,
+                "title": f"Q{j}",
+                "question_type": "TEXT",
+                "order": j,
+            }
+            for survey_id in range(1, SURVEYS + 1)
+            for j in range(QUESTIONS_PER_SURVEY)
+        ],
+    )
+
+    # Distinct (question, session) pairs: one response per question and session
+    question_count = SURVEYS * QUESTIONS_PER_SURVEY
+    pairs = random.Random(42).sample(
+        range(question_count * SESSIONS_PER_SURVEY), responses
+    )
+    for start in range(0, responses, CHUNK_SIZE):
+        rows = []
+        for pair in pairs[start : start + CHUNK_SIZE]:
+            question_id = pair % question_count + 1
+            survey_id = (question_id - 1) // QUESTIONS_PER_SURVEY + 1
+            rows.append(
+                {
+                    "question_id": question_id,
+                    "survey_id": survey_id,
+                    "user_session_id": f"s{survey_id}-{pair // question_count}",
+                    "answer": {"value": "ok"},
+                }
+            )
+        await conn.execute(insert(Response), rows)
+
+
+async def _measure(conn, name: str, denormalized: bool, repeat: int) -> list[dict]:
+    rng = random.Random(7)
+    rows = []
+    for query_name, build in _queries(denormalized).items():
+        latencies = []
+        for _ in range(repeat):
+            survey_id = rng.randint(1, SURVEYS)
+            session_id = f"s{survey_id}-{rng.randrange(SESSIONS_PER_SURVEY)}"
+            started = time.perf_counter()
+            (await conn.execute(build(survey_id, session_id))).all()
+            latencies.append((time.perf_counter() - started) * 1000)
+        rows.append(
+            {
+                "schema": name,
+                "query": query_name,
+                "avg ms": mean(latencies),
+                "p95 ms": percentile(latencies, 95),
+            }
+        )
+    return rows
+
+
+async def main(responses: int, repeat: int) -> None:
+    url = temp_database_url("survey_id.db")
+    engine = create_async_engine(url)
+
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for index in SURVEY_INDEXES:
+            await conn.run_sync(index.drop)
+        await _seed(conn, responses)
+    print(f"Seeded {responses} responses in {time.perf_counter() - started:.1f}s")
+
+    async with engine.connect() as conn:
+        rows = await _measure(conn, "join question", False, repeat)
+
+    async with engine.begin() as conn:
+        for index in SURVEY_INDEXES:
+            await conn.run_sync(index.create)
+        await conn.exec_driver_sql("ANALYZE")
+
+    async with engine.connect() as conn:
+        rows += await _measure(conn, "response.survey_id", True, repeat)
+
+    await engine.dispose()
+    print_table(f"Survey-scoped queries, {responses} responses, {repeat} runs", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.responses, args.repeat))
@@ -0,0 +1,152 @@
+"""
+Бенчмарк SQLite performance profile.
+
+Воспроизводит ситуацию из продакшена: писатели сохраняют ответы
+(как create_response), а читатели одновременно запрашивают активные
+опросы (как /surveys/active). Сравнивает стандартный rollback journal
+с профилем WAL/NORMAL/mmap/cache_size.
+
+Запуск:
+    python -m tests.performance.bench_sqlite_profile [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import time
+
+from tests.performance.common import (
+    mean,
+    percentile,
+    print_table,
+    temp_database_url,
+)
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database import (
+    Base,
+    build_engine_options,
+    get_sqlite_pragmas,
+    install_sqlite_pragmas,
+)
+import models  # noqa: F401  (регистрация всех таблиц)
+from models.question import Question
+from models.response import Response
+from models.survey import Survey
+
+DEFAULT_PROFILE = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+async def _seed(session_factory: async_sessionmaker) -> list[int]:
+    async with session_factory() as session:
+        surveys = [
+            Survey(title=f"Survey {i}", is_active=True, is_public=True)
+            for i in range(20)
+        ]
+        session.add_all(surveys)
+        await session.flush()
+        questions = [
+            Question(survey_id=survey.id, title=f"Q{j}", question_type="TEXT", order=j)
+            for survey in surveys
+            for j in range(5)
+        ]
+        session.add_all(questions)
+        await session.commit()
+        return [question.id for question in questions]
+
+
+async def _writer(session_factory, question_ids, deadline, stats, worker_id):
+    n = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with session_factory() as session:
+                session.add(
+                    Response(
+                        question_id=question_ids[n % len(question_ids)],
+                        user_session_id=f"bench-{worker_id}-{n}",
+                        answer={"value": "ok"},
+                    )
+                )
+                await session.commit()
+            stats["write_latency"].append((time.perf_counter() - started) * 1000)
+        except OperationalError:
+            stats["errors"] += 1
+        n += 1
+
+
+async def _reader(session_factory, deadline, stats):
+    query = (
+        select(Survey.id, func.count(Question.id))
+        .join(Question, Question.survey_id == Survey.id)
+        .where(Survey.is_active == True, Survey.is_public == True)  # noqa: E712
+        .group_by(Survey.id)
+        .limit(10)
+    )
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with session_factory() as session:
+                (await session.execute(query)).all()
+            stats["read_latency"].append((time.perf_counter() - started) * 1000)
+        except OperationalError:
+            stats["errors"] += 1
+
+
+async def run_profile(
+    name: str, pragmas: dict, seconds: float, writers: int, readers: int
+):
+    url = temp_database_url(f"{name}.db")
+    engine = create_async_engine(url, **build_engine_options(url))
+    install_sqlite_pragmas(engine, pragmas)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    question_ids = await _seed(session_factory)
+
+    stats = {"write_latency": [], "read_latency": [], "errors": 0}
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *(
+            _writer(session_factory, question_ids, deadline, stats, i)
+            for i in range(writers)
+        ),
+        *(_reader(session_factory, deadline, stats) for _ in range(readers)),
+    )
+    await engine.dispose()
+
+    return {
+        "profile": name,
+        "writes/s": len(stats["write_latency"]) / seconds,
+        "reads/s": len(stats["read_latency"]) / seconds,
+        "write p95 ms": percentile(stats["write_latency"], 95),
+        "read avg ms": mean(stats["read_latency"]),
+        "read p95 ms": percentile(stats["read_latency"], 95),
+        "lock errors": stats["errors"],
+    }
+
+
+async def main(seconds: float, writers: int, readers: int) -> None:
+    rows = [
+        await run_profile("default", DEFAULT_PROFILE, seconds, writers, readers),
+        await run_profile(
+            "performance", get_sqlite_pragmas(), seconds, writers, readers
+        ),
+    ]
+    print_table(
+        f"SQLite profile: {writers} writers / {readers} readers, {seconds}s each", rows
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.writers, args.readers))
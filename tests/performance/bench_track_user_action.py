@@ -0,0 +1,107 @@
+"""
+Бенчмарк учета действий пользователя в Redis.
+
+Сравнивает прежнюю последовательность команд (INCRBY/EXPIRE для
+счетчиков, HGETALL + HSET + EXPIRE для хэша пользователя, 6-9 обращений
+к Redis) с одним вызовом Lua-скрипта ``RedisService.track_user_action``.
+Нужен запущенный Redis; бенчмарк пишет ключи в отдельную базу и удаляет
+их после прогона.
+
+Запуск:
+    python -m tests.performance.bench_track_user_action \\
+        [--redis-url redis://localhost:6379/15] [--actions 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from tests.performance.common import print_table
+
+from services.redis_service import RedisService
+
+ACTIONS = ["survey_started", "survey_completed", "question_answered", "login"]
+
+
+async def _legacy_track(service: RedisService, user_id: int, action: str) -> None:
+    """Прежняя реализация MonitoringService.track_user_action."""
+    await service.increment_counter(f"user_action:{action}", ttl=86400)
+    await service.increment_counter("user_action:total", ttl=86400)
+
+    user_key = f"user_analytics:{user_id}"
+    current_data = await service.get_hash(user_key) or {}
+    current_data[action] = str(int(current_data.get(action, 0)) + 1)
+    current_data["last_action"] = action
+    current_data["last_seen"] = datetime.now().isoformat()
+    await service.set_hash(user_key, current_data, ttl=604800)
+
+    hour_key = f"analytics:hourly:{datetime.now().strftime('%Y%m%d%H')}"
+    await service.increment_counter(hour_key, ttl=172800)
+
+
+async def _script_track(service: RedisService, user_id: int, action: str) -> None:
+    await service.track_user_action(user_id, action)
+
+
+async def _run(service, track, actions: int, concurrency: int) -> tuple[float, int]:
+    await service.redis.flushdb()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await track(service, i % 100, ACTIONS[i % len(ACTIONS)])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(actions)))
+    elapsed = time.perf_counter() - started
+
+    # Сумма счетчиков всех пользователей: меньше числа действий при гонках
+    counted = 0
+    for user_id in range(100):
+        data = await service.redis.hgetall(f"user_analytics:{user_id}")
+        counted += sum(int(data.get(action, 0)) for action in ACTIONS)
+    return elapsed, counted
+
+
+async def main(redis_url: str, actions: int, concurrency: int) -> None:
+    service = RedisService()
+    # redis_url не входит в Settings, RedisService читает его через getattr
+    with patch("services.redis_service.settings", SimpleNamespace(redis_url=redis_url)):
+        initialized = await service.initialize()
+    if not initialized:
+        raise SystemExit(f"Redis is not available at {redis_url}")
+
+    rows = []
+    try:
+        for name, track in (
+            ("legacy commands", _legacy_track),
+            ("lua script", _script_track),
+        ):
+            elapsed, counted = await _run(service, track, actions, concurrency)
+            rows.append(
+                {
+                    "path": name,
+                    "actions/s": actions / elapsed,
+                    "ms/action": elapsed / actions * 1000,
+                    "lost updates": actions - counted,
+                }
+            )
+        await service.redis.flushdb()
+    finally:
+        await service.disconnect()
+
+    print_table(
+        f"track_user_action, {actions} actions, concurrency {concurrency}", rows
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--actions", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.actions, args.concurrency))
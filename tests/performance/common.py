@@ -0,0 +1,63 @@
+"""
+Общие утилиты для бенчмарков.
+"""
+
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+from typing import Iterable
+
+# Бенчмарки запускаются без pytest, поэтому добавляем src в путь сами
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def temp_database_url(name: str) -> str:
+    """Создать URL временной SQLite базы для одного прогона."""
+    directory = Path(tempfile.mkdtemp(prefix="quiz-bench-"))
+    return f"sqlite+aiosqlite:///{directory / name}"
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Перцентиль для списка значений (0 для пустого списка)."""
+    data = sorted(values)
+    if not data:
+        return 0.0
+    index = min(len(data) - 1, int(round(pct / 100 * (len(data) - 1))))
+    return data[index]
+
+
+def mean(values: Iterable[float]) -> float:
+    """Среднее значение (0 для пустого списка)."""
+    data = list(values)
+    return statistics.fmean(data) if data else 0.0
+
+
+def print_table(title: str, rows: list[dict]) -> None:
+    """Напечатать результаты в виде выровненной таблицы."""
+    print(f"\n{title}")
+    if not rows:
+        print("  (no results)")
+        return
+
+    columns = list(rows[0].keys())
+    widths = {
+        column: max(len(column), *(len(_format(row[column])) for row in rows))
+        for column in columns
+    }
+    print("  " + "  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print(
+            "  "
+            + "  ".join(
+                _format(row[column]).ljust(widths[column]) for column in columns
+            )
+        )
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
@@ -0,0 +1,75 @@
+"""
+Тесты кодеков значений кэша с байтом версии формата.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import uuid
+
+import pytest
+
+from services.cache_codec import (
+    CacheCodec,
+    CacheCodecError,
+    MsgpackCodec,
+    OrjsonCodec,
+    decode,
+    get_codec,
+)
+
+VALUE = {"id": 1, "title": "Опрос", "questions": [{"order": 0, "options": None}]}
+
+
+def _codecs():
+    codecs = [CacheCodec()]
+    try:
+        import orjson  # noqa: F401
+
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        pass
+    try:
+        import msgpack  # noqa: F401
+
+        codecs.append(MsgpackCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+class TestCacheCodec:
+    """Тесты кодирования и декодирования значений кэша."""
+
+    @pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+    def test_round_trip(self, codec):
+        data = codec.encode(VALUE)
+
+        assert data[0] == codec.header
+        assert decode(data) == VALUE
+
+    def test_msgpack_keeps_types(self):
+        pytest.importorskip("msgpack")
+        value = {
+            "created_at": datetime(2024, 1, 2, 3, 4, 5),
+            "day": date(2024, 1, 2),
+            "score": Decimal("4.50"),
+            "token": uuid.UUID(int=1),
+        }
+
+        assert decode(MsgpackCodec().encode(value)) == value
+
+    def test_legacy_text_values_are_decoded(self):
+        assert decode(json.dumps(VALUE).encode()) == VALUE
+        assert decode(b"test_value") == "test_value"
+
+    def test_unknown_header_is_rejected(self):
+        with pytest.raises(CacheCodecError):
+            decode(b"\x1f{}")
+
+    def test_invalid_payload_is_rejected(self):
+        with pytest.raises(CacheCodecError):
+            decode(b"\x01{not json")
+
+    def test_unavailable_codec_falls_back_to_json(self):
+        assert get_codec("unknown").name == "json"
@@ -0,0 +1,143 @@
+"""
+Тесты атомарных Lua-операций RedisService.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.redis_service import RateLimitAlgorithm
+
+
+@pytest.fixture
+def make_service(real_redis_service_module):
+    """Настоящий RedisService с замененными Lua-скриптами."""
+
+    def make(script_result=1):
+        service = real_redis_service_module.RedisService()
+        service.connected = True
+        service._track_user_action_script = AsyncMock(return_value=script_result)
+        service._rate_limit_scripts = {
+            algorithm: AsyncMock(return_value=script_result)
+            for algorithm in RateLimitAlgorithm
+        }
+        return service
+
+    return make
+
+
+class TestTrackUserAction:
+    """Тесты учета действий пользователя одним вызовом скрипта."""
+
+    @pytest.mark.asyncio
+    async def test_single_script_call(self, make_service):
+        service = make_service(script_result=3)
+
+        count = await service.track_user_action(
+            42, "survey_completed", timestamp=datetime(2024, 5, 6, 7, 8)
+        )
+
+        assert count == 3
+        service._track_user_action_script.assert_awaited_once_with(
+            keys=[
+                "user_action:survey_completed",
+                "user_action:total",
+                "user_analytics:42",
+                "analytics:hourly:2024050607",
+            ],
+            args=["survey_completed", "2024-05-06T07:08:00", 86400, 604800, 172800],
+        )
+
+    @pytest.mark.asyncio
+    async def test_disconnected_redis_is_skipped(self, make_service):
+        service = make_service()
+        service.connected = False
+
+        assert await service.track_user_action(42, "login") == 0
+        service._track_user_action_script.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_script_error_is_logged(self, make_service):
+        service = make_service()
+        service._track_user_action_script.side_effect = ConnectionError("down")
+
+        assert await service.track_user_action(42, "login") == 0
+
+
+class TestHitRateLimit:
+    """Тесты атомарного ограничения частоты запросов."""
+
+    @pytest.mark.asyncio
+    async def test_fixed_window_within_limit(self, make_service):
+        service = make_service(script_result=[3, 45000])
+
+        result = await service.hit_rate_limit("ip:1", limit=5, window=60)
+
+        assert result.allowed
+        assert result.remaining == 2
+        assert result.reset_after == 45.0
+        script = service._rate_limit_scripts[RateLimitAlgorithm.FIXED_WINDOW]
+        script.assert_awaited_once_with(keys=["rate_limit:ip:1"], args=[60000])
+
+    @pytest.mark.asyncio
+    async def test_fixed_window_over_limit(self, make_service):
+        service = make_service(script_result=[6, 1500])
+
+        result = await service.hit_rate_limit("ip:1", limit=5, window=60)
+
+        assert not result.allowed
+        assert result.remaining == 0
+        assert result.headers()["X-RateLimit-Reset"] == "2"
+        assert await service.check_rate_limit("ip:1", 5, 60) is True
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_rejection(self, make_service):
+        service = make_service(script_result=[0, 5, 12000])
+
+        result = await service.hit_rate_limit(
+            "ip:1", limit=5, window=60, algorithm=RateLimitAlgorithm.SLIDING_WINDOW
+        )
+
+        assert not result.allowed
+        assert result.remaining == 0
+        assert result.reset_after == 12.0
+        script = service._rate_limit_scripts[RateLimitAlgorithm.SLIDING_WINDOW]
+        keys = script.call_args.kwargs["keys"]
+        assert keys == ["rate_limit_log:ip:1"]
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(self, make_service):
+        service = make_service()
+        service.connected = False
+
+        result = await service.hit_rate_limit("ip:1", limit=5, window=60)
+
+        assert result.allowed
+        assert result.remaining == 5
+
+
+class TestVersionedCacheWrites:
+    """Тесты условной записи значения по версии ключа."""
+
+    @pytest.mark.asyncio
+    async def test_set_if_version_passes_expected_version(self, make_service):
+        service = make_service(script_result=0)
+        service._set_if_version_script = AsyncMock(return_value=0)
+
+        stored = await service.set_if_version("survey:1", {"v": 1}, 3, ttl=60)
+
+        assert stored is False
+        service._set_if_version_script.assert_awaited_once_with(
+            keys=["survey:1", "survey:1:version"], args=[3, '{"v": 1}', 60]
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_versioned_bumps_every_key(self, make_service):
+        service = make_service()
+        service._invalidate_versioned_script = AsyncMock(return_value=2)
+
+        assert await service.invalidate_versioned("a", "b", version_ttl=10) == 2
+        service._invalidate_versioned_script.assert_awaited_once_with(
+            keys=["a", "a:version", "b", "b:version"], args=[10]
+        )
@@ -0,0 +1,207 @@
+"""
+Тесты двухуровневого кэша (LRU в процессе + Redis).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from services.cache_codec import decode, get_codec
+from services.tiered_cache import TieredCache
+
+
+class FakeRedisService:
+    """Минимальная замена RedisService на словаре."""
+
+    def __init__(self):
+        self.connected = True
+        self.data = {}
+        self.versions = {}
+        self.published = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None, nx=False):
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def get_binary(self, key):
+        data = self.data.get(key)
+        return decode(data) if data is not None else None
+
+    async def set_binary(self, key, value, ttl=None, nx=False):
+        return await self.set(key, get_codec("json").encode(value), ttl=ttl, nx=nx)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def get_version(self, key):
+        return self.versions.get(key, 0)
+
+    async def set_if_version(self, key, value, version, ttl=None, binary=False):
+        if self.versions.get(key, 0) != version:
+            return False
+        self.data[key] = get_codec("json").encode(value) if binary else value
+        return True
+
+    async def invalidate_versioned(self, *keys, version_ttl=None):
+        for key in keys:
+            self.data.pop(key, None)
+            self.versions[key] = self.versions.get(key, 0) + 1
+        return len(keys)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+
+def _counting_loader(value, delay: float = 0.0):
+    calls = []
+
+    async def loader():
+        calls.append(True)
+        await asyncio.sleep(delay)
+        return value
+
+    return loader, calls
+
+
+class TestTieredCache:
+    """Тесты уровней кэша, single-flight и инвалидации."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        cache = TieredCache(FakeRedisService())
+        loader, calls = _counting_loader({"v": 1}, delay=0.01)
+
+        values = await asyncio.gather(
+            *(cache.get_or_load("k", loader) for _ in range(20))
+        )
+
+        assert values == [{"v": 1}] * 20
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] == 19
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_load_to_follower(self):
+        cache = TieredCache(FakeRedisService())
+        loader, calls = _counting_loader({"v": 1}, delay=0.05)
+
+        leader = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0.01)
+        followers = [
+            asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        # Отмена лидера не доходит до ожидающих: один из них грузит сам
+        assert await asyncio.gather(*followers) == [{"v": 1}] * 5
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared_between_workers(self):
+        redis_service = FakeRedisService()
+        first = TieredCache(redis_service)
+        second = TieredCache(redis_service)
+        loader, calls = _counting_loader("value")
+
+        await first.get_or_load("k", loader)
+        assert await second.get_or_load("k", loader) == "value"
+
+        assert len(calls) == 1
+        assert second.stats()["redis_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_rebuild_of_another_worker(self):
+        redis_service = FakeRedisService()
+        # Другой воркер держит блокировку пересборки ключа
+        redis_service.data["k:rebuild"] = "other"
+        cache = TieredCache(redis_service, lock_ttl=1.0)
+        loader, calls = _counting_loader("mine")
+
+        async def other_worker():
+            await asyncio.sleep(0.1)
+            redis_service.data["k"] = "theirs"
+
+        value, _ = await asyncio.gather(cache.get_or_load("k", loader), other_worker())
+
+        assert value == "theirs"
+        assert calls == []
+        assert cache.stats()["lock_waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_is_served_during_refresh(self):
+        redis_service = FakeRedisService()
+        redis_service.connected = False
+        cache = TieredCache(redis_service, local_ttl=0.01, stale_ttl=10.0)
+        await cache.get_or_load("k", _counting_loader("old")[0])
+        await asyncio.sleep(0.02)
+
+        refresh, _ = _counting_loader("new", delay=0.05)
+        refreshing = asyncio.create_task(cache.get_or_load("k", refresh))
+        await asyncio.sleep(0)
+        stale = await cache.get_or_load("k", refresh)
+
+        assert stale == "old"
+        assert await refreshing == "new"
+        assert cache.stats()["stale_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_broadcast(self):
+        redis_service = FakeRedisService()
+        cache = TieredCache(redis_service)
+        await cache.get_or_load("k", _counting_loader("value")[0])
+
+        await cache.invalidate("k")
+
+        assert "k" not in redis_service.data
+        channel, message = redis_service.published[0]
+        assert channel == cache.channel
+        assert message["keys"] == ["k"]
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_written_back(self):
+        redis_service = FakeRedisService()
+        loading = TieredCache(redis_service)
+        invalidating = TieredCache(redis_service)
+        loader, _ = _counting_loader("old", delay=0.05)
+
+        # Другой воркер инвалидирует ключ, пока первый строит значение
+        load = asyncio.create_task(loading.get_or_load("k", loader))
+        await asyncio.sleep(0.01)
+        await invalidating.invalidate("k")
+
+        assert await load == "old"
+        assert "k" not in redis_service.data
+        fresh, calls = _counting_loader("new")
+        assert await invalidating.get_or_load("k", fresh) == "new"
+        assert redis_service.data["k"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_local_entry(self):
+        cache = TieredCache(FakeRedisService())
+        await cache.get_or_load("k", _counting_loader("value")[0])
+
+        cache._on_message(json.dumps({"origin": "other-worker", "keys": ["k"]}))
+
+        assert cache.stats()["local_size"] == 0
+        assert cache.stats()["remote_invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_binary_mode_stores_encoded_values(self):
+        redis_service = FakeRedisService()
+        first = TieredCache(redis_service, binary=True)
+        second = TieredCache(redis_service, binary=True)
+
+        await first.get_or_load("k", _counting_loader({"v": 1})[0])
+
+        assert isinstance(redis_service.data["k"], bytes)
+        assert await second.get_or_load("k", _counting_loader(None)[0]) == {"v": 1}
+        assert second.stats()["redis_hits"] == 1
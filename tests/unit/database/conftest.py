@@ -0,0 +1,39 @@
+"""
+Fixtures для тестов слоя базы данных на файловой SQLite.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from database import Base, build_engine_options, install_sqlite_pragmas
+
+
+def create_schema(sync_conn) -> None:
+    """
+    Создает таблицы и индексы без дублей.
+
+    Импорт моделей через ``src.models`` регистрирует те же индексы в
+    ``Base.metadata`` повторно, поэтому ``create_all`` падает на
+    "index already exists".
+    """
+    for table in Base.metadata.sorted_tables:
+        sync_conn.execute(CreateTable(table))
+        seen = set()
+        for index in table.indexes:
+            if index.name in seen:
+                continue
+            seen.add(index.name)
+            sync_conn.execute(CreateIndex(index))
+
+
+@pytest_asyncio.fixture
+async def sqlite_url(tmp_path):
+    """URL файловой SQLite с созданной схемой."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    engine = create_async_engine(url, **build_engine_options(url))
+    install_sqlite_pragmas(engine, {"journal_mode": "WAL", "synchronous": "OFF"})
+    async with engine.begin() as conn:
+        await conn.run_sync(create_schema)
+    await engine.dispose()
+    return url
@@ -0,0 +1,260 @@
+"""
+Тесты буфера отложенной записи (write-behind ingestion buffer).
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database import build_engine_options
+from models.survey import Survey
+from services.ingestion_buffer import IngestionBuffer, IngestionBufferFull
+
+
+@pytest_asyncio.fixture
+async def session_maker(sqlite_url):
+    engine = create_async_engine(sqlite_url, **build_engine_options(sqlite_url))
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _committing_factory(session_maker):
+    @asynccontextmanager
+    async def factory():
+        async with session_maker() as session:
+            yield session
+            await session.commit()
+
+    return factory
+
+
+def _failing_factory(session_maker, failures: int):
+    """Фабрика сессий, первые failures сбросов которой теряют соединение."""
+    committing = _committing_factory(session_maker)
+    calls = {"count": 0}
+
+    @asynccontextmanager
+    async def factory():
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        async with committing() as session:
+            yield session
+
+    return factory
+
+
+async def _count_surveys(session_maker) -> int:
+    async with session_maker() as session:
+        return await session.scalar(select(func.count(Survey.id)))
+
+
+class TestIngestionBuffer:
+    """Тесты группового сброса и ограничения памяти."""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_flushed_in_batches(self, session_maker):
+        buffer = IngestionBuffer(
+            flush_rows=10,
+            flush_interval_ms=10,
+            session_factory=_committing_factory(session_maker),
+        )
+        await buffer.start()
+        try:
+            for i in range(25):
+                buffer.enqueue(Survey, {"title": f"Survey {i}"})
+            await buffer.put(Survey, {"title": "last"}, wait=True)
+            stats = buffer.stats()
+        finally:
+            await buffer.stop()
+
+        assert await _count_surveys(session_maker) == 26
+        assert stats["flushed_rows"] == 26
+        assert stats["flushes"] < 26
+        assert stats["max_flush_size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_rejects_rows(self, session_maker):
+        buffer = IngestionBuffer(
+            max_rows=3,
+            flush_rows=100,
+            flush_interval_ms=60_000,
+            session_factory=_committing_factory(session_maker),
+        )
+        await buffer.start()
+        try:
+            for i in range(3):
+                buffer.enqueue(Survey, {"title": f"Survey {i}"})
+            with pytest.raises(IngestionBufferFull):
+                buffer.enqueue(Survey, {"title": "overflow"})
+            assert buffer.stats()["rejected_rows"] == 1
+        finally:
+            await buffer.stop()
+
+        # Остаток сбрасывается при остановке
+        assert await _count_surveys(session_maker) == 3
+
+    @pytest.mark.asyncio
+    async def test_rows_wait_for_commit_of_session(self, session_maker):
+        buffer = IngestionBuffer(
+            flush_interval_ms=60_000,
+            session_factory=_committing_factory(session_maker),
+        )
+        await buffer.start()
+        try:
+            async with session_maker() as session:
+                await session.execute(select(1))
+                buffer.enqueue_after_commit(session, Survey, {"title": "rolled back"})
+                await session.rollback()
+                buffer.enqueue_after_commit(session, Survey, {"title": "committed"})
+                assert buffer.stats()["queue_depth"] == 0
+                await session.commit()
+            assert buffer.stats()["queue_depth"] == 1
+        finally:
+            await buffer.stop()
+
+        async with session_maker() as session:
+            titles = (await session.scalars(select(Survey.title))).all()
+        assert titles == ["committed"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_columns_are_rejected(self, session_maker):
+        buffer = IngestionBuffer(session_factory=_committing_factory(session_maker))
+        await buffer.start()
+        try:
+            with pytest.raises(ValueError):
+                buffer.enqueue(Survey, {"title": "x", "no_such_column": 1})
+        finally:
+            await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_reserved_rows_count_against_capacity(self, session_maker):
+        buffer = IngestionBuffer(
+            max_rows=2,
+            flush_interval_ms=60_000,
+            session_factory=_committing_factory(session_maker),
+        )
+        await buffer.start()
+        try:
+            async with session_maker() as first, session_maker() as second:
+                await first.execute(select(1))
+                await second.execute(select(1))
+                buffer.enqueue_after_commit(first, Survey, {"title": "first"})
+                buffer.enqueue_after_commit(second, Survey, {"title": "second"})
+                # Очередь пуста, но оба места заняты открытыми транзакциями
+                with pytest.raises(IngestionBufferFull):
+                    buffer.enqueue(Survey, {"title": "overflow"})
+                await first.commit()
+                await second.rollback()
+            stats = buffer.stats()
+            assert stats["queue_depth"] == 1
+            assert stats["reserved_rows"] == 0
+            buffer.enqueue(Survey, {"title": "after rollback"})
+        finally:
+            await buffer.stop()
+
+        assert buffer.stats()["dropped_rows"] == 0
+        assert await _count_surveys(session_maker) == 2
+
+    @pytest.mark.asyncio
+    async def test_committed_rows_are_not_dropped_when_full(self, session_maker):
+        buffer = IngestionBuffer(
+            max_rows=1,
+            flush_interval_ms=60_000,
+            session_factory=_committing_factory(session_maker),
+        )
+        await buffer.start()
+        try:
+            async with session_maker() as session:
+                await session.execute(select(1))
+                buffer.enqueue_after_commit(session, Survey, {"title": "reserved"})
+                with pytest.raises(IngestionBufferFull):
+                    buffer.enqueue(Survey, {"title": "overflow"})
+                await session.commit()
+            assert buffer.stats()["queue_depth"] == 1
+        finally:
+            await buffer.stop()
+
+        assert buffer.stats()["dropped_rows"] == 0
+        assert await _count_surveys(session_maker) == 1
+
+    @pytest.mark.asyncio
+    async def test_transient_flush_error_is_retried(self, session_maker):
+        buffer = IngestionBuffer(
+            flush_interval_ms=10,
+            retry_backoff_ms=1,
+            session_factory=_failing_factory(session_maker, failures=2),
+        )
+        await buffer.start()
+        try:
+            for i in range(5):
+                buffer.enqueue(Survey, {"title": f"Survey {i}"})
+            await buffer.put(Survey, {"title": "last"}, wait=True)
+        finally:
+            await buffer.stop()
+
+        stats = buffer.stats()
+        assert await _count_surveys(session_maker) == 6
+        assert stats["retried_rows"] > 0
+        assert stats["dropped_rows"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_flushes_refuse_rows_without_losing_queued(
+        self, session_maker
+    ):
+        buffer = IngestionBuffer(
+            flush_interval_ms=10,
+            flush_retries=1,
+            retry_backoff_ms=1,
+            session_factory=_failing_factory(session_maker, failures=5),
+        )
+        await buffer.start()
+        try:
+            for i in range(4):
+                buffer.enqueue(Survey, {"title": f"Survey {i}"})
+            while not buffer.stats()["failing"]:
+                await asyncio.sleep(0.005)
+
+            # Пока сбросы падают, новые строки получают 503, очередь не теряется
+            with pytest.raises(IngestionBufferFull):
+                buffer.enqueue(Survey, {"title": "refused"})
+            assert buffer.stats()["queue_depth"] == 4
+
+            while buffer.stats()["failing"]:
+                await asyncio.sleep(0.005)
+            buffer.enqueue(Survey, {"title": "after recovery"})
+        finally:
+            await buffer.stop()
+
+        stats = buffer.stats()
+        assert await _count_surveys(session_maker) == 5
+        assert stats["split_flushes"] == 0
+        assert stats["dropped_rows"] == 0
+        assert stats["failing"] is False
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_split_to_drop_only_bad_rows(self, session_maker):
+        buffer = IngestionBuffer(
+            flush_interval_ms=60_000,
+            session_factory=_committing_factory(session_maker),
+        )
+        await buffer.start()
+        try:
+            for i in range(3):
+                buffer.enqueue(Survey, {"title": f"Survey {i}"})
+            bad_row = buffer.enqueue(Survey, {"title": None}, wait=True)
+            for i in range(3, 6):
+                buffer.enqueue(Survey, {"title": f"Survey {i}"})
+        finally:
+            await buffer.stop()
+
+        assert bad_row.exception() is not None
+        stats = buffer.stats()
+        assert await _count_surveys(session_maker) == 6
+        assert stats["dropped_rows"] == 1
+        assert stats["split_flushes"] > 0
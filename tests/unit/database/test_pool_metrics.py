@@ -0,0 +1,97 @@
+"""
+Тесты настроек пула соединений и метрик пула.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from database import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMetrics,
+    build_engine_options,
+    pool_metrics,
+)
+
+
+class TestPoolMetrics:
+    """Тесты сбора статистики пула."""
+
+    def test_wait_histogram_is_cumulative(self):
+        metrics = PoolMetrics()
+        metrics.observe_wait(0.5)
+        metrics.observe_wait(7)
+        metrics.observe_wait(20000)
+
+        histogram = metrics.wait_histogram()
+
+        assert histogram["1"] == 1
+        assert histogram["10"] == 2
+        assert histogram["10000"] == 2
+        assert histogram["+Inf"] == 3
+
+    def test_timeouts_are_counted_separately(self):
+        metrics = PoolMetrics()
+        metrics.observe_wait(2)
+        metrics.observe_wait(30000, timed_out=True)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["checkouts_total"] == 1
+        assert snapshot["timeouts_total"] == 1
+        assert snapshot["wait_time_max_ms"] == 30000
+        assert snapshot["pool_size"] is None
+
+    def test_reset(self):
+        metrics = PoolMetrics()
+        metrics.observe_wait(3)
+        metrics.reset()
+
+        assert metrics.snapshot()["checkouts_total"] == 0
+        assert metrics.wait_histogram()["+Inf"] == 0
+
+
+class TestEngineOptions:
+    """Тесты построения параметров движка."""
+
+    def test_file_database_gets_sized_pool(self):
+        options = build_engine_options("sqlite+aiosqlite:///./quiz.db")
+
+        assert options["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+        assert options["pool_pre_ping"] is True
+        assert options["pool_size"] >= 1
+        assert options["connect_args"]["check_same_thread"] is False
+
+    @pytest.mark.parametrize(
+        "url", ["sqlite+aiosqlite:///:memory:", "sqlite+aiosqlite://"]
+    )
+    def test_memory_database_keeps_default_pool(self, url):
+        options = build_engine_options(url)
+
+        assert "poolclass" not in options
+        assert "pool_size" not in options
+
+    def test_postgres_has_no_sqlite_connect_args(self):
+        options = build_engine_options("postgresql+asyncpg://u:p@localhost/quiz")
+
+        assert "check_same_thread" not in options["connect_args"]
+        assert options["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+
+    @pytest.mark.asyncio
+    async def test_live_pool_reports_checkouts(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+        engine = create_async_engine(url, **build_engine_options(url))
+        before = pool_metrics.checkouts
+
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                snapshot = pool_metrics.snapshot(engine.pool)
+                assert snapshot["checked_out"] == 1
+                assert snapshot["pool_class"] == "InstrumentedAsyncAdaptedQueuePool"
+        finally:
+            await engine.dispose()
+
+        assert pool_metrics.checkouts == before + 1
+        assert not isinstance(engine.pool, StaticPool)
@@ -0,0 +1,103 @@
+"""
+Тесты журнала медленных SQL-запросов.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database import SlowQueryLog, build_engine_options
+from models.survey import Survey
+
+surveys = Survey.__table__
+
+
+@pytest.fixture
+def slow_log():
+    """Журнал с нулевым порогом, фиксирующий все запросы."""
+    log = SlowQueryLog(threshold_ms=0, max_entries=5)
+    # Кадры тестового модуля считаются "кодом приложения"
+    log._APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+    return log
+
+
+@pytest.fixture
+async def engine(sqlite_url, slow_log):
+    engine = create_async_engine(sqlite_url, **build_engine_options(sqlite_url))
+    slow_log.install(engine)
+    yield engine
+    await engine.dispose()
+
+
+class TestRedaction:
+    """Тесты маскирования параметров."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, None),
+            (True, True),
+            (42, 42),
+            (1.5, 1.5),
+            ("secret@example.com", "<str len=18>"),
+            (b"\x00\x01", "<bytes len=2>"),
+            ({"a": 1}, "<dict>"),
+        ],
+    )
+    def test_redact(self, value, expected):
+        assert SlowQueryLog.redact(value) == expected
+
+
+class TestSlowQueryLog:
+    """Тесты записи медленных запросов."""
+
+    @pytest.mark.asyncio
+    async def test_records_statement_with_plan_and_caller(self, engine, slow_log):
+        async with engine.connect() as conn:
+            await conn.execute(select(surveys.c.id).where(surveys.c.title == "secret"))
+
+        entry = slow_log.entries()[0]
+
+        assert entry["statement"].startswith("SELECT survey.id")
+        assert entry["parameters"] == ["<str len=6>"]
+        assert "secret" not in str(entry["parameters"])
+        assert entry["caller"].startswith("test_slow_query_log.py:")
+        assert any("SCAN" in line or "SEARCH" in line for line in entry["plan"])
+
+    @pytest.mark.asyncio
+    async def test_executemany_reports_row_count_without_plan(self, engine, slow_log):
+        async with engine.begin() as conn:
+            await conn.execute(insert(surveys), [{"title": "A"}, {"title": "B"}])
+
+        entry = next(
+            e for e in slow_log.entries() if e["statement"].startswith("INSERT")
+        )
+
+        assert entry["parameters"] == {"executemany_rows": 2}
+        assert entry["plan"] is None
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_not_recorded(self, engine, slow_log):
+        slow_log.threshold_ms = 60_000
+
+        async with engine.connect() as conn:
+            await conn.execute(select(surveys.c.id))
+
+        assert slow_log.entries() == []
+
+    @pytest.mark.asyncio
+    async def test_log_is_bounded_and_newest_first(self, engine, slow_log):
+        async with engine.connect() as conn:
+            for i in range(8):
+                await conn.execute(select(surveys.c.id).where(surveys.c.id == i))
+
+        entries = slow_log.entries()
+
+        assert len(entries) == 5
+        assert entries[0]["parameters"] == [7]
+        assert slow_log.entries(limit=2) == entries[:2]
+
+        slow_log.clear()
+        assert slow_log.entries() == []
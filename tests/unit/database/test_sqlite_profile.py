@@ -0,0 +1,66 @@
+"""
+Тесты SQLite performance profile (PRAGMA на каждое соединение).
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database import build_engine_options, get_sqlite_pragmas, install_sqlite_pragmas
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}"
+
+
+class TestSqliteProfile:
+    """Тесты применения PRAGMA."""
+
+    def test_default_profile(self):
+        pragmas = get_sqlite_pragmas()
+
+        assert pragmas["journal_mode"] == "WAL"
+        assert pragmas["synchronous"] == "NORMAL"
+        assert pragmas["temp_store"] == "MEMORY"
+        assert pragmas["busy_timeout"] > 0
+
+    @pytest.mark.asyncio
+    async def test_pragmas_applied_on_connect(self, sqlite_url):
+        engine = create_async_engine(sqlite_url, **build_engine_options(sqlite_url))
+        install_sqlite_pragmas(engine)
+
+        try:
+            async with engine.connect() as conn:
+                journal_mode = (
+                    await conn.execute(text("PRAGMA journal_mode"))
+                ).scalar()
+                synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+                temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar()
+                busy_timeout = (
+                    await conn.execute(text("PRAGMA busy_timeout"))
+                ).scalar()
+        finally:
+            await engine.dispose()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+        assert busy_timeout == get_sqlite_pragmas()["busy_timeout"]
+
+    @pytest.mark.asyncio
+    async def test_explicit_pragmas_override_profile(self, sqlite_url):
+        engine = create_async_engine(sqlite_url, **build_engine_options(sqlite_url))
+        install_sqlite_pragmas(engine, {"journal_mode": "DELETE", "cache_size": -2000})
+
+        try:
+            async with engine.connect() as conn:
+                journal_mode = (
+                    await conn.execute(text("PRAGMA journal_mode"))
+                ).scalar()
+                cache_size = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+        finally:
+            await engine.dispose()
+
+        assert journal_mode == "delete"
+        assert cache_size == -2000
@@ -0,0 +1,156 @@
+"""
+Тесты очереди единственного писателя для SQLite (group commit).
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import database
+from database import SQLiteWriteQueue, build_engine_options, install_sqlite_pragmas
+from models.survey import Survey
+
+# Core-таблица: не требует конфигурации мапперов
+surveys = Survey.__table__
+
+
+async def _count_surveys(url: str) -> int:
+    engine = create_async_engine(url, **build_engine_options(url))
+    try:
+        async with engine.connect() as conn:
+            return (await conn.execute(select(func.count(surveys.c.id)))).scalar()
+    finally:
+        await engine.dispose()
+
+
+class TestSQLiteWriteQueue:
+    """Тесты сериализации записей."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_group_committed(self, sqlite_url):
+        queue = SQLiteWriteQueue(sqlite_url, max_batch=100)
+
+        async def write(i: int) -> int:
+            async with queue.transaction() as session:
+                result = await session.execute(
+                    insert(surveys).values(title=f"Survey {i}").returning(surveys.c.id)
+                )
+                survey_id = result.scalar_one()
+                # Репозитории коммитят сами: это должно лишь отпустить SAVEPOINT
+                await session.commit()
+                return survey_id
+
+        try:
+            ids = await asyncio.gather(*(write(i) for i in range(30)))
+            stats = queue.stats()
+        finally:
+            await queue.stop()
+
+        assert len(set(ids)) == 30
+        assert await _count_surveys(sqlite_url) == 30
+        assert stats["transactions"] == 30
+        assert stats["batches"] < 30
+        assert stats["max_batch_size"] > 1
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_does_not_affect_batch(self, sqlite_url):
+        queue = SQLiteWriteQueue(sqlite_url)
+
+        async def write(title: str, fail: bool = False) -> None:
+            async with queue.transaction() as session:
+                await session.execute(insert(surveys).values(title=title))
+                if fail:
+                    raise ValueError("boom")
+
+        try:
+            results = await asyncio.gather(
+                write("ok-1"),
+                write("bad", fail=True),
+                write("ok-2"),
+                return_exceptions=True,
+            )
+            stats = queue.stats()
+        finally:
+            await queue.stop()
+
+        assert isinstance(results[1], ValueError)
+        assert results[0] is None and results[2] is None
+        assert await _count_surveys(sqlite_url) == 2
+        assert stats["failed_transactions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_restarts_lazily_after_stop(self, sqlite_url):
+        queue = SQLiteWriteQueue(sqlite_url)
+
+        try:
+            async with queue.transaction() as session:
+                await session.execute(insert(surveys).values(title="first"))
+            await queue.stop()
+            assert not queue.running
+
+            async with queue.transaction() as session:
+                await session.execute(insert(surveys).values(title="second"))
+            assert queue.running
+        finally:
+            await queue.stop()
+
+        assert await _count_surveys(sqlite_url) == 2
+
+    @pytest.mark.asyncio
+    async def test_guarded_sessions_wait_for_their_turn(self, sqlite_url):
+        queue = SQLiteWriteQueue(sqlite_url)
+        engine = create_async_engine(sqlite_url, **build_engine_options(sqlite_url))
+        # Без очереди второй писатель сразу получил бы "database is locked"
+        install_sqlite_pragmas(engine, {"journal_mode": "WAL", "busy_timeout": 0})
+        queue.guard_engine(engine)
+
+        async def request_write(i: int) -> None:
+            async with AsyncSession(engine) as session:
+                await session.execute(select(surveys.c.id).limit(1))
+                await session.execute(insert(surveys).values(title=f"Request {i}"))
+                # Остальная работа запроса идет, пока держится блокировка записи
+                await asyncio.sleep(0.01)
+                await session.commit()
+
+        async def queued_write(i: int) -> None:
+            async with queue.transaction() as session:
+                await session.execute(insert(surveys).values(title=f"Queued {i}"))
+
+        try:
+            await asyncio.gather(
+                *(request_write(i) for i in range(10)),
+                *(queued_write(i) for i in range(10)),
+            )
+            stats = queue.stats()
+        finally:
+            await queue.stop()
+            await engine.dispose()
+
+        assert await _count_surveys(sqlite_url) == 20
+        assert stats["guarded_transactions"] == 10
+        assert stats["transactions"] == 10
+
+    @pytest.mark.asyncio
+    async def test_get_write_session_falls_back_without_queue(self, monkeypatch):
+        calls = []
+
+        class _Session:
+            pass
+
+        async def fake_db_session():
+            calls.append("db")
+            yield _Session()
+
+        from contextlib import asynccontextmanager
+
+        monkeypatch.setattr(database, "write_queue", None)
+        monkeypatch.setattr(
+            database, "get_db_session", asynccontextmanager(fake_db_session)
+        )
+
+        async with database.get_write_session() as session:
+            assert isinstance(session, _Session)
+
+        assert calls == ["db"]
@@ -0,0 +1,132 @@
+"""
+Тесты подсчета SQL-запросов на запрос и детектора N+1.
+"""
+
+import logging
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from middleware.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryCounterMiddleware,
+    UNMATCHED_ROUTE,
+    QueryStats,
+    get_current_query_stats,
+    install_query_tracking,
+    report_query_stats,
+    track_queries,
+)
+from src.services.monitoring_service import MonitoringService
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    install_query_tracking(engine)
+    # Повторная установка не должна удваивать счетчики
+    install_query_tracking(engine)
+    yield engine
+    await engine.dispose()
+
+
+class TestQueryTracking:
+    """Тесты сбора статистики."""
+
+    @pytest.mark.asyncio
+    async def test_counts_queries_inside_block(self, engine):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+            with track_queries() as stats:
+                assert get_current_query_stats() is stats
+                for i in range(3):
+                    await conn.execute(text("SELECT :i"), {"i": i})
+
+        assert get_current_query_stats() is None
+        assert stats.count == 3
+        assert stats.time_ms >= 0
+        assert stats.statements == {"SELECT ?": 3}
+
+    def test_repeated_statements(self):
+        stats = QueryStats()
+        for _ in range(5):
+            stats.record("SELECT * FROM question WHERE survey_id = ?", 0.1)
+        stats.record("SELECT * FROM survey", 0.1)
+
+        assert stats.repeated(4) == [("SELECT * FROM question WHERE survey_id = ?", 5)]
+        assert stats.repeated(5) == []
+
+    def test_report_warns_about_n_plus_one(self, caplog):
+        stats = QueryStats()
+        for _ in range(3):
+            stats.record("SELECT *\n FROM question WHERE survey_id = ?", 0.1)
+
+        with caplog.at_level(logging.WARNING, logger="middleware.query_stats"):
+            repeated = report_query_stats(stats, "GET /surveys/active", threshold=2)
+
+        assert repeated == [("SELECT *\n FROM question WHERE survey_id = ?", 3)]
+        assert "Possible N+1 in GET /surveys/active" in caplog.text
+        assert "SELECT * FROM question WHERE survey_id = ?" in caplog.text
+
+
+class TestQueryCounterMiddleware:
+    """Тесты заголовков ответа."""
+
+    @pytest.mark.asyncio
+    async def test_headers_report_request_queries(self, engine):
+        app = FastAPI()
+        app.add_middleware(QueryCounterMiddleware)
+
+        @app.get("/items")
+        async def items():
+            async with engine.connect() as conn:
+                for _ in range(4):
+                    await conn.execute(text("SELECT 1"))
+            return {"ok": True}
+
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.get("/items")
+
+        assert response.status_code == 200
+        assert response.headers[QUERY_COUNT_HEADER] == "4"
+        assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+    @pytest.mark.asyncio
+    async def test_unmatched_paths_share_one_operation(self):
+        app = FastAPI()
+        app.add_middleware(QueryCounterMiddleware)
+
+        with patch("middleware.query_stats.report_query_stats") as report:
+            async with AsyncClient(app=app, base_url="http://testserver") as client:
+                await client.get("/wp-login.php")
+                await client.get("/random/123")
+
+        operations = {call.args[1] for call in report.call_args_list}
+        assert operations == {f"GET {UNMATCHED_ROUTE}"}
+
+
+class TestMonitoringQueryStats:
+    """Тесты агрегации в MonitoringService."""
+
+    def test_aggregates_by_operation(self):
+        service = MonitoringService()
+
+        service.record_query_stats("GET /a", 2, 1.0)
+        service.record_query_stats("GET /a", 4, 3.0, n_plus_one=True)
+        service.record_query_stats("GET /b", 30, 9.0)
+
+        stats = service.get_query_stats()
+
+        assert list(stats) == ["GET /b", "GET /a"]
+        assert stats["GET /a"]["requests"] == 2
+        assert stats["GET /a"]["queries_avg"] == 3.0
+        assert stats["GET /a"]["queries_max"] == 4
+        assert stats["GET /a"]["db_time_avg_ms"] == 2.0
+        assert stats["GET /a"]["n_plus_one_requests"] == 1
@@ -0,0 +1,114 @@
+"""
+Тесты зависимости FastAPI для ограничения частоты запросов.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+import pytest
+
+from services.jwt_service import jwt_service
+from services.rate_limiter import RateLimiter, current_user_key
+from services.redis_service import RateLimitAlgorithm, RateLimitResult
+
+
+def _app(limiter: RateLimiter) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/limited", dependencies=[Depends(limiter)])
+    async def limited():
+        return {"ok": True}
+
+    return app
+
+
+def _redis_service(*results: RateLimitResult) -> AsyncMock:
+    redis_service = AsyncMock()
+    redis_service.hit_rate_limit.side_effect = results
+    return redis_service
+
+
+class TestRateLimiter:
+    """Тесты зависимости RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request_gets_quota_headers(self):
+        limiter = RateLimiter(5, 60, scope="test")
+        redis_service = _redis_service(RateLimitResult(True, 5, 4, 59.2))
+
+        with patch(
+            "services.rate_limiter.get_redis_service", return_value=redis_service
+        ):
+            async with AsyncClient(
+                app=_app(limiter), base_url="http://testserver"
+            ) as client:
+                response = await client.post("/limited")
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "5"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+        assert response.headers["X-RateLimit-Reset"] == "60"
+        key = redis_service.hit_rate_limit.call_args.args[0]
+        assert key.startswith("test:")
+
+    @pytest.mark.asyncio
+    async def test_rejected_request_gets_429(self):
+        limiter = RateLimiter(
+            5, 60, scope="test", algorithm=RateLimitAlgorithm.FIXED_WINDOW
+        )
+        redis_service = _redis_service(RateLimitResult(False, 5, 0, 0.3))
+
+        with patch(
+            "services.rate_limiter.get_redis_service", return_value=redis_service
+        ):
+            async with AsyncClient(
+                app=_app(limiter), base_url="http://testserver"
+            ) as client:
+                response = await client.post("/limited")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        assert redis_service.hit_rate_limit.call_args.args[3] == (
+            RateLimitAlgorithm.FIXED_WINDOW
+        )
+
+    @pytest.mark.asyncio
+    async def test_custom_caller_key(self):
+        limiter = RateLimiter(5, 60, scope="test", key_func=lambda request: "user:7")
+        redis_service = _redis_service(RateLimitResult(True, 5, 4, 60))
+
+        with patch(
+            "services.rate_limiter.get_redis_service", return_value=redis_service
+        ):
+            async with AsyncClient(
+                app=_app(limiter), base_url="http://testserver"
+            ) as client:
+                await client.post("/limited")
+
+        assert redis_service.hit_rate_limit.call_args.args[0] == "test:user:7"
+
+    @pytest.mark.asyncio
+    async def test_current_user_key(self):
+        limiter = RateLimiter(5, 60, scope="test", key_func=current_user_key)
+        redis_service = _redis_service(
+            *(RateLimitResult(True, 5, 4, 60) for _ in range(3))
+        )
+        token = jwt_service.create_access_token(user_id=7)
+
+        with patch(
+            "services.rate_limiter.get_redis_service", return_value=redis_service
+        ):
+            async with AsyncClient(
+                app=_app(limiter), base_url="http://testserver"
+            ) as client:
+                await client.post(
+                    "/limited", headers={"Authorization": f"Bearer {token}"}
+                )
+                await client.post("/limited", params={"token": token})
+                await client.post("/limited", params={"token": "invalid"})
+
+        keys = [call.args[0] for call in redis_service.hit_rate_limit.call_args_list]
+        assert keys[:2] == ["test:user:7", "test:user:7"]
+        assert not keys[2].startswith("test:user:")
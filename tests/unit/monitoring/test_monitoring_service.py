@@ -184,7 +184,6 @@ class TestMonitoringServiceUserAnalytics:
 
         with patch("src.services.monitoring_service.get_redis_service") as mock_redis:
             mock_redis_service = AsyncMock()
-            mock_redis_service.get_hash.return_value = {}
             mock_redis.return_value = mock_redis_service
 
             # Act
@@ -193,8 +192,9 @@ class TestMonitoringServiceUserAnalytics:
             )
 
             # Assert
-            mock_redis_service.increment_counter.assert_called()
-            mock_redis_service.set_hash.assert_called()
+            mock_redis_service.track_user_action.assert_awaited_once_with(
+                user_id, action
+            )
 
     @pytest.mark.asyncio
     async def test_track_user_action_without_redis(self, monitoring_service):
@@ -209,69 +209,24 @@ class TestMonitoringServiceUserAnalytics:
             )
 
     @pytest.mark.asyncio
-    async def test_track_user_action_increments_counters(self, monitoring_service):
-        """Тест инкрементирования счетчиков пользователей."""
+    async def test_track_user_action_single_redis_call(self, monitoring_service):
+        """Тест: действие учитывается одним вызовом Redis без чтения хэша."""
         # Arrange
         user_id = 123
         action = "survey_started"
 
         with patch("src.services.monitoring_service.get_redis_service") as mock_redis:
             mock_redis_service = AsyncMock()
-            mock_redis_service.get_hash.return_value = {"survey_started": "5"}
-            mock_redis.return_value = mock_redis_service
-
-            # Act
-            await monitoring_service.track_user_action(user_id, action)
-
-            # Assert
-            calls = mock_redis_service.increment_counter.call_args_list
-            assert len(calls) >= 2
-            assert any(f"user_action:{action}" in str(call) for call in calls)
-            assert any("user_action:total" in str(call) for call in calls)
-
-    @pytest.mark.asyncio
-    async def test_track_user_action_updates_user_analytics(self, monitoring_service):
-        """Тест обновления аналитики пользователя."""
-        # Arrange
-        user_id = 123
-        action = "survey_completed"
-
-        with patch("src.services.monitoring_service.get_redis_service") as mock_redis:
-            mock_redis_service = AsyncMock()
-            mock_redis_service.get_hash.return_value = {"survey_completed": "2"}
-            mock_redis.return_value = mock_redis_service
-
-            # Act
-            await monitoring_service.track_user_action(user_id, action)
-
-            # Assert
-            mock_redis_service.set_hash.assert_called()
-            set_call = mock_redis_service.set_hash.call_args
-            assert f"user_analytics:{user_id}" in set_call[0][0]
-            assert set_call[0][2] == 604800  # TTL
-
-    @pytest.mark.asyncio
-    async def test_track_user_action_hourly_analytics(self, monitoring_service):
-        """Тест обновления почасовой аналитики."""
-        # Arrange
-        user_id = 123
-        action = "test_action"
-
-        with patch("src.services.monitoring_service.get_redis_service") as mock_redis:
-            mock_redis_service = AsyncMock()
-            mock_redis_service.get_hash.return_value = {}
             mock_redis.return_value = mock_redis_service
 
             # Act
             await monitoring_service.track_user_action(user_id, action)
 
             # Assert
-            hourly_calls = [
-                call
-                for call in mock_redis_service.increment_counter.call_args_list
-                if "analytics:hourly:" in str(call)
-            ]
-            assert len(hourly_calls) >= 1
+            mock_redis_service.track_user_action.assert_awaited_once()
+            mock_redis_service.get_hash.assert_not_called()
+            mock_redis_service.set_hash.assert_not_called()
+            mock_redis_service.increment_counter.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_track_user_action_error_handling(self, monitoring_service):
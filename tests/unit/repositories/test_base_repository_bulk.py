@@ -0,0 +1,176 @@
+"""
+Тесты массовых операций BaseRepository.
+
+Используется отдельная декларативная база, чтобы тесты не зависели от
+конфигурации мапперов моделей приложения.
+"""
+
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Column, DateTime, Integer, String, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from repositories.base import BaseRepository
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Item(_Base):
+    __tablename__ = "bulk_item"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+    note = Column(String(50), nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+
+
+class ItemCreate(BaseModel):
+    name: str
+    note: Optional[str] = None
+
+
+class ItemRepository(BaseRepository[Item, ItemCreate, ItemCreate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Item, db)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def statements(engine):
+    """Список выполненных INSERT/SELECT (без BEGIN/COMMIT)."""
+    executed = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _track(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split()[0].upper())
+
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", _track)
+
+
+class TestBulkCreate:
+    """Тесты bulk_create / bulk_insert."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_single_round_trip(self, engine, statements):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = ItemRepository(session)
+            items = await repo.bulk_create(
+                objs_in=[ItemCreate(name=f"item-{i}") for i in range(50)]
+            )
+
+        assert [item.name for item in items] == [f"item-{i}" for i in range(50)]
+        assert len({item.id for item in items}) == 50
+        assert all(item.created_at is not None for item in items)
+        assert statements.count("INSERT") == 1
+        assert "SELECT" not in statements
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_reloads_once_when_expiring(self, engine, statements):
+        async with AsyncSession(engine, expire_on_commit=True) as session:
+            repo = ItemRepository(session)
+            items = await repo.bulk_create(
+                objs_in=[ItemCreate(name="a"), ItemCreate(name="b")]
+            )
+            assert [item.name for item in items] == ["a", "b"]
+
+        assert statements.count("INSERT") == 1
+        assert statements.count("SELECT") == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_validates_dicts_with_schema(self, engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = ItemRepository(session)
+            items = await repo.bulk_create(
+                objs_in=[{"name": "x", "note": "n"}, {"name": "y"}],
+                schema=ItemCreate,
+            )
+            assert [(i.name, i.note) for i in items] == [("x", "n"), ("y", None)]
+
+            with pytest.raises(ValidationError):
+                await repo.bulk_create(objs_in=[{"note": "no name"}], schema=ItemCreate)
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_fast_mode(self, engine, statements):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = ItemRepository(session)
+            inserted = await repo.bulk_insert(
+                objs_in=[ItemCreate(name=f"fast-{i}") for i in range(20)]
+            )
+            assert inserted == 20
+            assert len(session.identity_map) == 0
+            assert await repo.count() == 20
+
+        assert statements.count("INSERT") == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self, engine, statements):
+        async with AsyncSession(engine) as session:
+            repo = ItemRepository(session)
+            assert await repo.bulk_create(objs_in=[]) == []
+            assert await repo.bulk_insert(objs_in=[]) == 0
+
+        assert statements == []
+
+
+class TestBulkUpdate:
+    """Тесты bulk_update."""
+
+    @pytest.mark.asyncio
+    async def test_groups_updates_by_column_set(self, engine, statements):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = ItemRepository(session)
+            items = await repo.bulk_create(
+                objs_in=[ItemCreate(name=f"item-{i}") for i in range(6)]
+            )
+            statements.clear()
+
+            updates = [
+                {"id": item.id, "name": f"renamed-{i}"}
+                for i, item in enumerate(items[:4])
+            ]
+            updates += [
+                {"id": item.id, "note": "n", "name": "both"} for item in items[4:]
+            ]
+            updated = await repo.bulk_update(updates=updates)
+
+            assert updated == 6
+            # Две группы колонок - два UPDATE (executemany)
+            assert statements.count("UPDATE") == 2
+
+            rows = (
+                await session.execute(select(Item.name, Item.note).order_by(Item.id))
+            ).all()
+            assert rows[:4] == [(f"renamed-{i}", None) for i in range(4)]
+            assert rows[4:] == [("both", "n"), ("both", "n")]
+
+    @pytest.mark.asyncio
+    async def test_reports_only_existing_rows(self, engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = ItemRepository(session)
+            [item] = await repo.bulk_create(objs_in=[ItemCreate(name="one")])
+
+            updates = [
+                {"id": item.id, "name": "changed"},
+                {"id": 999, "name": "missing"},
+                {"id": item.id},
+            ]
+            updated = await repo.bulk_update(updates=updates)
+
+            assert updated == 1
+            # Входные словари не изменяются
+            assert updates[0] == {"id": item.id, "name": "changed"}
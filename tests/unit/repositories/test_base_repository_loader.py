@@ -0,0 +1,181 @@
+"""
+Тесты батчевого загрузчика (DataLoader) BaseRepository.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel
+from sqlalchemy import Column, ForeignKey, Integer, String, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from repositories.base import BaseRepository
+from repositories.loader import DataLoader
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Deck(_Base):
+    __tablename__ = "loader_deck"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(50), nullable=False)
+
+
+class Card(_Base):
+    __tablename__ = "loader_card"
+
+    id = Column(Integer, primary_key=True)
+    deck_id = Column(Integer, ForeignKey("loader_deck.id"), nullable=False)
+    order = Column(Integer, nullable=False)
+
+
+class DeckCreate(BaseModel):
+    title: str
+
+
+class DeckRepository(BaseRepository[Deck, DeckCreate, DeckCreate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Deck, db)
+
+
+class CardRepository(BaseRepository[Card, DeckCreate, DeckCreate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Card, db)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        await conn.execute(
+            insert(Deck), [{"title": f"deck-{i}"} for i in range(1, 4)]
+        )
+        await conn.execute(
+            insert(Card),
+            [
+                {"deck_id": 1, "order": 2},
+                {"deck_id": 1, "order": 1},
+                {"deck_id": 2, "order": 1},
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+class TestRepositoryLoader:
+    """Тесты батчевой загрузки через репозиторий."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_same_tick_share_one_query(self, session, statements):
+        repo = DeckRepository(session)
+
+        decks = await asyncio.gather(repo.load(1), repo.load(3), repo.load(99))
+
+        assert [deck.title if deck else None for deck in decks] == [
+            "deck-1",
+            "deck-3",
+            None,
+        ]
+        assert len(statements) == 1
+        assert " IN " in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_loaded_records_are_cached(self, session, statements):
+        repo = DeckRepository(session)
+
+        await repo.load_many([1, 2])
+        await repo.load(2)
+
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_primes_loader(self, session, statements):
+        repo = DeckRepository(session)
+
+        deck = await repo.get(1)
+
+        assert await repo.load(1) is deck
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_many_groups_and_orders_records(self, session, statements):
+        loader = CardRepository(session).loader(
+            "deck_id", many=True, order_by=("order",)
+        )
+
+        cards = await loader.load_many([1, 2, 3])
+
+        assert [[card.order for card in group] for group in cards] == [
+            [1, 2],
+            [1],
+            [],
+        ]
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_clears_loaders(self, session):
+        repo = DeckRepository(session)
+        await repo.load(1)
+
+        await repo.create(obj_in=DeckCreate(title="new"))
+
+        assert "dataloaders" not in session.info
+        assert await repo.load(4) is not None
+
+
+class TestDataLoader:
+    """Тесты самого DataLoader."""
+
+    @pytest.mark.asyncio
+    async def test_splits_batches_by_max_size(self):
+        batches = []
+
+        async def batch_load(keys):
+            batches.append(keys)
+            return {key: key * 10 for key in keys}
+
+        loader = DataLoader(batch_load, max_batch_size=2)
+
+        assert await loader.load_many([1, 2, 3]) == [10, 20, 30]
+        assert batches == [[1, 2], [3]]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_cached(self):
+        calls = 0
+
+        async def batch_load(keys):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch_load)
+
+        with pytest.raises(RuntimeError):
+            await loader.load(1)
+        assert await loader.load(1) == 1
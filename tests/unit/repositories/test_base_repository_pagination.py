@@ -0,0 +1,235 @@
+"""
+Тесты keyset (cursor) пагинации BaseRepository.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    event,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from repositories.base import (
+    BaseRepository,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Event(_Base):
+    __tablename__ = "page_event"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(20), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+class StampedEvent(_Base):
+    __tablename__ = "page_stamped_event"
+
+    __table_args__ = (Index("ix_page_stamped_event_created_at", "created_at"),)
+
+    id = Column(Integer, primary_key=True)
+    # На SQLite func.now() пишет метку с микросекундами (см. database.py)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+
+
+class EventCreate(BaseModel):
+    kind: str
+
+
+class EventRepository(BaseRepository[Event, EventCreate, EventCreate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Event, db)
+
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        # По три события на одну метку времени - проверка tie-breaker по id
+        await conn.execute(
+            insert(Event),
+            [
+                {
+                    "kind": "even" if i % 2 == 0 else "odd",
+                    "created_at": BASE_TIME + timedelta(minutes=i // 3),
+                }
+                for i in range(25)
+            ],
+        )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+async def _walk(fetch_page) -> tuple[list, int]:
+    """Пройти все страницы, вернуть элементы по порядку и число страниц."""
+    items, cursor, pages = [], None, 0
+    while True:
+        page, cursor = await fetch_page(cursor)
+        items.extend(page)
+        pages += 1
+        if cursor is None:
+            return items, pages
+
+
+class TestCursorEncoding:
+    """Тесты кодирования курсора."""
+
+    def test_round_trip(self):
+        columns = (Event.created_at, Event.id)
+        cursor = encode_cursor([BASE_TIME, 42])
+
+        assert decode_cursor(cursor, columns) == [BASE_TIME, 42]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not-base64!!", encode_cursor([1]), encode_cursor(["x", "y"]), "e30"],
+    )
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, (Event.created_at, Event.id))
+
+
+class TestKeysetPagination:
+    """Тесты постраничного обхода."""
+
+    @pytest.mark.asyncio
+    async def test_get_multi_by_cursor_walks_all_rows(self, session):
+        repo = EventRepository(session)
+
+        items, pages = await _walk(
+            lambda cursor: repo.get_multi_by_cursor(cursor=cursor, limit=10)
+        )
+
+        assert [item.id for item in items] == list(range(1, 26))
+        assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_exact_last_page_has_no_cursor(self, session):
+        repo = EventRepository(session)
+
+        page, cursor = await repo.get_multi_by_cursor(limit=25)
+
+        assert len(page) == 25
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_created_at_desc_with_ties(self, session):
+        repo = EventRepository(session)
+        query = select(Event).where(Event.kind == "even")
+
+        items, _ = await _walk(
+            lambda cursor: repo.paginate_by_cursor(
+                query,
+                order_by=(Event.created_at, Event.id),
+                cursor=cursor,
+                limit=4,
+                descending=True,
+            )
+        )
+
+        assert [e.id for e in items] == list(range(25, 0, -2))
+
+    @pytest.mark.asyncio
+    async def test_row_mode_with_labeled_columns(self, session):
+        repo = EventRepository(session)
+        query = select(Event.id.label("event_id"), Event.kind)
+
+        rows, _ = await _walk(
+            lambda cursor: repo.paginate_by_cursor(
+                query, order_by=(Event.id,), cursor=cursor, limit=7, scalars=False
+            )
+        )
+
+        assert [row.event_id for row in rows] == list(range(1, 26))
+
+    @pytest.mark.asyncio
+    async def test_server_default_timestamps(self, session):
+        repo = EventRepository(session)
+        await session.execute(insert(StampedEvent), [{} for _ in range(5)])
+        stamp = await session.scalar(
+            select(StampedEvent.created_at)
+            .order_by(StampedEvent.created_at.desc())
+            .limit(1)
+        )
+        # Та же метка, но записанная из Python
+        session.add(StampedEvent(created_at=stamp))
+        await session.flush()
+
+        for descending in (True, False):
+            items, pages = await _walk(
+                lambda cursor: repo.paginate_by_cursor(
+                    select(StampedEvent),
+                    order_by=(StampedEvent.created_at, StampedEvent.id),
+                    cursor=cursor,
+                    limit=2,
+                    descending=descending,
+                )
+            )
+
+            expected = [6, 5, 4, 3, 2, 1] if descending else [1, 2, 3, 4, 5, 6]
+            assert [e.id for e in items] == expected
+            assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_keyset_query_uses_index(self, session):
+        """Курсорный запрос идет по индексу, без сортировки во временном B-дереве."""
+        repo = EventRepository(session)
+        await session.execute(insert(StampedEvent), [{} for _ in range(5)])
+        _, cursor = await repo.paginate_by_cursor(
+            select(StampedEvent),
+            order_by=(StampedEvent.created_at, StampedEvent.id),
+            limit=2,
+            descending=True,
+        )
+
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        engine = session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            await repo.paginate_by_cursor(
+                select(StampedEvent),
+                order_by=(StampedEvent.created_at, StampedEvent.id),
+                cursor=cursor,
+                limit=2,
+                descending=True,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        statement, parameters = statements[-1]
+        conn = await session.connection()
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        plan = " | ".join(row[-1] for row in result)
+
+        assert "ix_page_stamped_event_created_at" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,111 @@
+"""
+Тесты проекций колонок и режима "сырых" строк BaseRepository.
+"""
+
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel
+from sqlalchemy import JSON, Column, Integer, String, insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from repositories.base import BaseRepository
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Card(_Base):
+    __tablename__ = "projection_card"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(50), nullable=False)
+    kind = Column(String(20), nullable=False)
+    payload = Column(JSON, nullable=True)
+
+
+class CardCreate(BaseModel):
+    title: str
+
+
+class CardRepository(BaseRepository[Card, CardCreate, CardCreate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Card, db)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        await conn.execute(
+            insert(Card),
+            [
+                {
+                    "title": f"card-{i}",
+                    "kind": "a" if i < 3 else "b",
+                    "payload": {"blob": "x" * 100},
+                }
+                for i in range(5)
+            ],
+        )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+class TestEntityProjection:
+    """Тесты load_only/defer для сущностей."""
+
+    @pytest.mark.asyncio
+    async def test_fields_load_only_requested_columns(self, session):
+        repo = CardRepository(session)
+
+        cards = await repo.get_multi(fields=["title"])
+
+        assert [card.title for card in cards] == [f"card-{i}" for i in range(5)]
+        assert cards[0].id == 1
+        # Не загруженная колонка не подгружается лениво, а сразу падает
+        with pytest.raises(InvalidRequestError):
+            _ = cards[0].payload
+
+    @pytest.mark.asyncio
+    async def test_defer_fields(self, session):
+        repo = CardRepository(session)
+
+        card = await repo.get(2, defer_fields=["payload"])
+
+        assert card.kind == "a"
+        assert "payload" not in card.__dict__
+
+    @pytest.mark.asyncio
+    async def test_unknown_field(self, session):
+        repo = CardRepository(session)
+
+        with pytest.raises(ValueError, match="no column named 'missing'"):
+            await repo.get_multi(fields=["missing"])
+
+
+class TestRowMode:
+    """Тесты выборки строк без ORM-сущностей."""
+
+    @pytest.mark.asyncio
+    async def test_rows_as_dicts(self, session):
+        repo = CardRepository(session)
+
+        rows = await repo.get_rows(
+            ["id", "title"], filters={"kind": "b"}, order_by=["title"]
+        )
+
+        assert rows == [{"id": 4, "title": "card-3"}, {"id": 5, "title": "card-4"}]
+        assert len(session.identity_map) == 0
+
+    @pytest.mark.asyncio
+    async def test_rows_as_tuples_with_paging(self, session):
+        repo = CardRepository(session)
+
+        rows = await repo.get_rows(["id", "kind"], skip=1, limit=2, as_dict=False)
+
+        assert rows == [(2, "a"), (3, "a")]
@@ -0,0 +1,117 @@
+"""
+Тесты answer context: вопрос и опрос одним запросом с кэшем по question_id.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from models.question import Question
+from models.survey import Survey
+from repositories.answer_context import answer_context_cache
+from repositories.question import QuestionRepository
+
+
+@pytest_asyncio.fixture
+async def question(async_session):
+    answer_context_cache.clear()
+    survey = Survey(title="Survey", is_active=True, is_public=False)
+    async_session.add(survey)
+    await async_session.flush()
+    question = Question(
+        survey_id=survey.id, title="Q", question_type="RATING_1_10", order=0
+    )
+    async_session.add(question)
+    await async_session.commit()
+    yield question
+    answer_context_cache.clear()
+
+
+@pytest.fixture
+def statements(async_session):
+    executed = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _on_execute)
+
+
+class TestAnswerContext:
+    """Тесты получения и кэширования answer context."""
+
+    @pytest.mark.asyncio
+    async def test_returns_question_and_survey_fields(self, async_session, question):
+        repo = QuestionRepository(async_session)
+
+        context = await repo.get_answer_context(question.id)
+
+        assert context.question_type == "RATING_1_10"
+        assert context.survey_id == question.survey_id
+        assert context.survey_is_active is True
+        assert context.survey_is_public is False
+
+    @pytest.mark.asyncio
+    async def test_missing_question(self, async_session, question):
+        repo = QuestionRepository(async_session)
+
+        assert await repo.get_answer_context(question.id + 100) is None
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_cached(
+        self, async_session, question, statements
+    ):
+        repo = QuestionRepository(async_session)
+
+        await repo.get_answer_context(question.id)
+        await repo.get_answer_context(question.id)
+
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_survey_update_evicts_context(self, async_session, question):
+        repo = QuestionRepository(async_session)
+        await repo.get_answer_context(question.id)
+
+        survey = await async_session.get(Survey, question.survey_id)
+        survey.is_active = False
+        await async_session.commit()
+
+        context = await repo.get_answer_context(question.id)
+        assert context.survey_is_active is False
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_context_until_commit(self, async_session, question):
+        repo = QuestionRepository(async_session)
+        await repo.get_answer_context(question.id)
+
+        survey = await async_session.get(Survey, question.survey_id)
+        survey.is_active = False
+        await async_session.flush()
+
+        # До коммита другие сессии читают старую строку - запись остается
+        assert answer_context_cache.get(question.id) is not None
+
+        await async_session.commit()
+
+        assert answer_context_cache.get(question.id) is None
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_pending_eviction(self, async_session, question):
+        repo = QuestionRepository(async_session)
+        question_id, survey_id = question.id, question.survey_id
+        await repo.get_answer_context(question_id)
+
+        survey = await async_session.get(Survey, survey_id)
+        survey.is_active = False
+        await async_session.flush()
+        await async_session.rollback()
+        # Следующий коммит не должен вытеснять отмененные изменения
+        await async_session.commit()
+
+        context = answer_context_cache.get(question_id)
+        assert context is not None
+        assert context.survey_is_active is True
@@ -0,0 +1,74 @@
+"""
+Тесты денормализованного Response.survey_id.
+"""
+
+import pytest
+import pytest_asyncio
+
+from models.question import Question
+from models.response import Response, ResponseCreate
+from models.survey import Survey
+from repositories.response import ResponseRepository
+
+
+@pytest_asyncio.fixture
+async def questions(async_session):
+    surveys = [Survey(title="First"), Survey(title="Second")]
+    async_session.add_all(surveys)
+    await async_session.flush()
+    questions = [
+        Question(survey_id=survey.id, title="Q", question_type="TEXT", order=0)
+        for survey in surveys
+    ]
+    async_session.add_all(questions)
+    await async_session.commit()
+    return questions
+
+
+class TestResponseSurveyId:
+    """survey_id заполняется при любой вставке."""
+
+    @pytest.mark.asyncio
+    async def test_create_fills_survey_id_from_question(
+        self, async_session, questions
+    ):
+        repo = ResponseRepository(async_session)
+
+        response = await repo.create(
+            obj_in=ResponseCreate(
+                question_id=questions[1].id,
+                user_session_id="s1",
+                answer={"value": "ok"},
+            )
+        )
+
+        assert response.survey_id == questions[1].survey_id
+
+    @pytest.mark.asyncio
+    async def test_orm_insert_fills_survey_id(self, async_session, questions):
+        response = Response(
+            question_id=questions[0].id, user_session_id="s2", answer={"value": 1}
+        )
+        async_session.add(response)
+        await async_session.commit()
+        await async_session.refresh(response)
+
+        assert response.survey_id == questions[0].survey_id
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_fills_survey_id(self, async_session, questions):
+        repo = ResponseRepository(async_session)
+
+        await repo.bulk_insert(
+            objs_in=[
+                {
+                    "question_id": question.id,
+                    "user_session_id": "s3",
+                    "answer": {"value": "ok"},
+                }
+                for question in questions
+            ]
+        )
+
+        for question in questions:
+            assert await repo.count_responses_by_survey(question.survey_id) == 1
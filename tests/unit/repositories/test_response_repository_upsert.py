@@ -0,0 +1,89 @@
+"""
+Тесты идемпотентного создания ответа через INSERT ... ON CONFLICT DO NOTHING.
+"""
+
+import pytest
+import pytest_asyncio
+
+from models.question import Question
+from models.response import ResponseCreate
+from models.survey import Survey
+from repositories.response import ResponseRepository
+
+
+@pytest_asyncio.fixture
+async def question(async_session):
+    survey = Survey(title="Survey")
+    async_session.add(survey)
+    await async_session.flush()
+    question = Question(survey_id=survey.id, title="Q", question_type="TEXT", order=0)
+    async_session.add(question)
+    await async_session.commit()
+    return question
+
+
+def _response(question, session_id="s1", value="ok") -> ResponseCreate:
+    return ResponseCreate(
+        question_id=question.id, user_session_id=session_id, answer={"value": value}
+    )
+
+
+class TestCreateIfAbsent:
+    """Один ответ на вопрос и сессию."""
+
+    @pytest.mark.asyncio
+    async def test_creates_response(self, async_session, question):
+        repo = ResponseRepository(async_session)
+
+        response, created = await repo.create_if_absent(obj_in=_response(question))
+
+        assert created is True
+        assert response.id is not None
+        assert response.survey_id == question.survey_id
+
+    @pytest.mark.asyncio
+    async def test_survey_id_is_set_server_side(self, async_session, question):
+        repo = ResponseRepository(async_session)
+        # survey_id не входит в публичную схему и не принимается от клиента
+        obj_in = ResponseCreate(
+            question_id=question.id,
+            user_session_id="s1",
+            answer={"value": "ok"},
+            survey_id=question.survey_id + 100,
+        )
+        assert "survey_id" not in ResponseCreate.model_json_schema()["properties"]
+
+        response, created = await repo.create_if_absent(
+            obj_in=obj_in, survey_id=question.survey_id
+        )
+
+        assert created is True
+        assert response.survey_id == question.survey_id
+
+    @pytest.mark.asyncio
+    async def test_duplicate_returns_existing(self, async_session, question):
+        repo = ResponseRepository(async_session)
+        first, _ = await repo.create_if_absent(obj_in=_response(question))
+
+        second, created = await repo.create_if_absent(
+            obj_in=_response(question, value="other")
+        )
+
+        assert created is False
+        assert second.id == first.id
+        assert len(await repo.get_by_question_id(question.id)) == 1
+
+    @pytest.mark.asyncio
+    async def test_idempotent_replay(self, async_session, question):
+        repo = ResponseRepository(async_session)
+        first, _ = await repo.create_if_absent(
+            obj_in=_response(question), idempotency_key="key-1"
+        )
+
+        replay, created = await repo.create_if_absent(
+            obj_in=_response(question), idempotency_key="key-1"
+        )
+
+        assert created is False
+        assert replay.id == first.id
+        assert (await repo.get_by_idempotency_key("key-1")).id == first.id
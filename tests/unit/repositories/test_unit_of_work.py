@@ -0,0 +1,135 @@
+"""
+Тесты режима unit of work: один коммит на запрос вместо коммита на вызов.
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from httpx import AsyncClient
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from database import get_async_session
+from repositories.base import BaseRepository
+from repositories.unit_of_work import (
+    UnitOfWorkRoute,
+    get_unit_of_work_session,
+    in_unit_of_work,
+)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Note(_Base):
+    __tablename__ = "uow_note"
+
+    id = Column(Integer, primary_key=True)
+    text = Column(String(50), nullable=False)
+
+
+class NoteCreate(BaseModel):
+    text: str
+
+
+class NoteRepository(BaseRepository[Note, NoteCreate, NoteCreate]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Note, db)
+
+
+def get_note_repository(
+    db: AsyncSession = Depends(get_unit_of_work_session),
+) -> NoteRepository:
+    return NoteRepository(db)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def commits(engine):
+    counter = {"count": 0}
+
+    def _on_commit(conn):
+        counter["count"] += 1
+
+    event.listen(engine.sync_engine, "commit", _on_commit)
+    yield counter
+    event.remove(engine.sync_engine, "commit", _on_commit)
+
+
+@pytest.fixture
+def app(engine):
+    router = APIRouter(route_class=UnitOfWorkRoute)
+
+    @router.post("/notes")
+    async def create_notes(repo: NoteRepository = Depends(get_note_repository)):
+        first = await repo.create(obj_in=NoteCreate(text="first"))
+        second = await repo.create(obj_in=NoteCreate(text="second"))
+        return {"ids": [first.id, second.id]}
+
+    @router.post("/notes/fail")
+    async def create_and_fail(repo: NoteRepository = Depends(get_note_repository)):
+        await repo.create(obj_in=NoteCreate(text="lost"))
+        raise HTTPException(status_code=400, detail="rejected")
+
+    async def override_session():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_session] = override_session
+    return app
+
+
+async def _count_notes(engine) -> int:
+    async with AsyncSession(engine) as session:
+        return await session.scalar(select(func.count(Note.id)))
+
+
+class TestUnitOfWorkRoute:
+    """Тесты коммита на уровне запроса."""
+
+    @pytest.mark.asyncio
+    async def test_request_commits_once(self, app, engine, commits):
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.post("/notes")
+
+        assert response.status_code == 200
+        assert response.json() == {"ids": [1, 2]}
+        assert commits["count"] == 1
+        assert await _count_notes(engine) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_response_rolls_back(self, app, engine, commits):
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.post("/notes/fail")
+
+        assert response.status_code == 400
+        assert commits["count"] == 0
+        assert await _count_notes(engine) == 0
+
+
+class TestRepositoryCommit:
+    """Тесты поведения репозитория вне и внутри unit of work."""
+
+    @pytest.mark.asyncio
+    async def test_plain_session_commits_each_write(self, engine, commits):
+        async with AsyncSession(engine) as session:
+            repo = NoteRepository(session)
+
+            await repo.create(obj_in=NoteCreate(text="one"))
+            await repo.create(obj_in=NoteCreate(text="two"))
+
+        assert not in_unit_of_work(session)
+        assert commits["count"] == 2
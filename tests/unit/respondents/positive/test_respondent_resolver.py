@@ -0,0 +1,99 @@
+"""
+Тесты RespondentResolver: один респондент на сессию.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+
+from models.respondent import Respondent, RespondentCreate
+from repositories.respondent import RespondentRepository
+from services import respondent_resolver
+from services.respondent_resolver import (
+    RespondentResolver,
+    SessionRespondentCache,
+    session_respondent_cache,
+)
+
+
+def _respondent(session_id: str) -> RespondentCreate:
+    return RespondentCreate(session_id=session_id, entry_point="web")
+
+
+async def _count_respondents(session) -> int:
+    return await session.scalar(select(func.count(Respondent.id)))
+
+
+class TestRespondentResolver:
+    """Тесты переиспользования респондента сессии."""
+
+    @pytest.mark.asyncio
+    async def test_same_session_reuses_respondent(self, async_session):
+        resolver = RespondentResolver(
+            RespondentRepository(async_session), cache=SessionRespondentCache()
+        )
+
+        first = await resolver.resolve(_respondent("s1"))
+        second = await resolver.resolve(_respondent("s1"))
+        other = await resolver.resolve(_respondent("s2"))
+
+        assert first == second
+        assert other != first
+        assert await _count_respondents(async_session) == 2
+
+    @pytest.mark.asyncio
+    async def test_known_session_is_served_from_cache(self, async_session):
+        cache = SessionRespondentCache()
+        repo = RespondentRepository(async_session)
+        respondent_id = await repo.get_or_create_id_by_session(
+            obj_in=_respondent("s1")
+        )
+        resolver = RespondentResolver(repo, cache=cache)
+
+        await resolver.resolve(_respondent("s1"))
+        assert cache.get("s1") == respondent_id
+
+        repo.get_id_by_session_id = AsyncMock()
+        assert await resolver.resolve(_respondent("s1")) == respondent_id
+        repo.get_id_by_session_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_used_before_database(self, async_session):
+        redis_service = AsyncMock()
+        redis_service.get.return_value = 42
+        repo = RespondentRepository(async_session)
+        repo.get_id_by_session_id = AsyncMock()
+        resolver = RespondentResolver(
+            repo, redis_service=redis_service, cache=SessionRespondentCache()
+        )
+
+        assert await resolver.resolve(_respondent("s1")) == 42
+        repo.get_id_by_session_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_merge_evicts_both_caches_after_commit(self, async_session):
+        redis_service = AsyncMock()
+        repo = RespondentRepository(async_session)
+        respondent_id = await repo.get_or_create_id_by_session(
+            obj_in=_respondent("s-merged")
+        )
+        await async_session.commit()
+        session_respondent_cache.put("s-merged", respondent_id)
+
+        respondent = await async_session.get(Respondent, respondent_id)
+        respondent.is_merged = True
+        with (
+            patch.object(respondent_resolver.settings, "respondent_cache_redis", True),
+            patch.object(
+                respondent_resolver, "get_redis_service", return_value=redis_service
+            ),
+        ):
+            await async_session.flush()
+            redis_service.delete.assert_not_called()
+            await async_session.commit()
+            await asyncio.gather(*respondent_resolver._eviction_tasks)
+
+        assert session_respondent_cache.get("s-merged") is None
+        redis_service.delete.assert_awaited_once_with("respondent_session:s-merged")
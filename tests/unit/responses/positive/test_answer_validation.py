@@ -0,0 +1,110 @@
+"""
+Тесты реестра валидаторов ответов по типу вопроса.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from repositories.answer_context import AnswerContext
+from services.answer_validation import AnswerValidatorRegistry, compile_validator
+
+
+def _context(question_type: str, **fields) -> AnswerContext:
+    values = {
+        "question_id": 1,
+        "question_type": question_type,
+        "is_required": True,
+        "options": None,
+        "question_data": None,
+        "survey_id": 1,
+        "survey_is_active": True,
+        "survey_is_public": True,
+    }
+    values.update(fields)
+    return AnswerContext(**values)
+
+
+class TestCompileValidator:
+    """Тесты проверок отдельных типов вопросов."""
+
+    @pytest.mark.parametrize(
+        "question_type, answer, expected",
+        [
+            ("TEXT", {"value": "ok"}, True),
+            ("TEXT", {"value": "  "}, False),
+            ("YES_NO", {"value": "Yes"}, True),
+            ("YES_NO", {"value": "maybe"}, False),
+            ("RATING_1_10", {"value": 10}, True),
+            ("RATING_1_10", {"value": 11}, False),
+            ("EMAIL", {"value": "user@example.com"}, True),
+            ("EMAIL", {"value": "user@"}, False),
+            ("PHONE", {"value": "+7 (999) 123-45-67"}, True),
+            ("PHONE", {"value": "call me"}, False),
+            ("GEOLOCATION", {"location": {"latitude": 55.7, "longitude": 37.6}}, True),
+            ("GEOLOCATION", {"location": {"latitude": 91, "longitude": 0}}, False),
+            ("NFC_SCAN", {"nfc_data": {"tag_id": "04A2", "tag_type": "NTAG"}}, True),
+            ("NFC_SCAN", {"nfc_data": {"tag_id": "", "tag_type": "NTAG"}}, False),
+            ("date", {"value": "2026-10-16T10:00:00Z"}, True),
+            ("date", {"value": "yesterday"}, False),
+            ("UNKNOWN", {}, True),
+        ],
+    )
+    def test_question_types(self, question_type, answer, expected):
+        assert compile_validator(question_type)(answer) is expected
+
+    def test_rating_bounds_from_options(self):
+        validator = compile_validator("RATING_1_10", options={"min": 1, "max": 5})
+
+        assert validator({"value": 5}) is True
+        assert validator({"value": 6}) is False
+
+    def test_multiple_choice_uses_question_options(self):
+        validator = compile_validator(
+            "multiple_choice", question_data={"options": [{"id": "a"}, {"id": "b"}]}
+        )
+
+        assert validator({"selected": "a"}) is True
+        assert validator({"selected": "c"}) is False
+        # Без вариантов ответа выбрать нечего
+        assert compile_validator("multiple_choice")({"selected": "a"}) is False
+
+
+class TestAnswerValidatorRegistry:
+    """Тесты кэша скомпилированных валидаторов."""
+
+    def test_validator_is_cached_per_question(self):
+        registry = AnswerValidatorRegistry()
+        context = _context("TEXT")
+
+        first = registry.validator_for(context)
+        second = registry.validator_for(context)
+
+        assert first is second
+        assert registry.stats()["hits"] == 1
+
+    def test_changed_question_is_recompiled(self):
+        registry = AnswerValidatorRegistry()
+        context = _context("RATING_1_10")
+        assert registry.validate(context, {"value": 8}) is True
+
+        changed = replace(context, options={"max": 5})
+
+        assert registry.validate(changed, {"value": 8}) is False
+
+    def test_validate_many_keeps_order(self):
+        registry = AnswerValidatorRegistry()
+        text = _context("TEXT")
+        email = _context("EMAIL", question_id=2)
+
+        results = registry.validate_many(
+            [
+                (text, {"value": "ok"}),
+                (email, {"value": "bad"}),
+                (text, {"value": ""}),
+                (email, {"value": "user@example.com"}),
+            ]
+        )
+
+        assert results == [True, False, False, True]
+        assert registry.stats()["size"] == 2
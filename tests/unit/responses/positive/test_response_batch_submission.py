@@ -0,0 +1,113 @@
+"""
+Positive тесты пакетного сохранения ответов (POST /responses/batch).
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from models.question import Question
+from models.response import ResponseBatchItem
+from models.survey import Survey
+from repositories.question import QuestionRepository
+from repositories.response import ResponseRepository
+from services.answer_validation import AnswerValidatorRegistry
+from services.response_submission import ResponseSubmissionService
+
+
+@pytest_asyncio.fixture
+async def survey_questions(async_session):
+    survey = Survey(title="Batch", is_active=True)
+    async_session.add(survey)
+    await async_session.flush()
+    questions = [
+        Question(survey_id=survey.id, title=f"Q{i}", question_type="TEXT", order=i)
+        for i in range(3)
+    ]
+    async_session.add_all(questions)
+    await async_session.commit()
+    return questions
+
+
+@pytest.fixture
+def service(async_session):
+    return ResponseSubmissionService(
+        QuestionRepository(async_session), ResponseRepository(async_session)
+    )
+
+
+class TestResponseBatchSubmission:
+    """Тесты пакетного сохранения ответов."""
+
+    @pytest.mark.asyncio
+    async def test_saves_all_answers_with_one_insert(
+        self, async_session, service, survey_questions
+    ):
+        inserts = []
+
+        def _on_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
+        engine = async_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _on_execute)
+        try:
+            result = await service.submit_batch(
+                survey_questions[0].survey_id,
+                "batch-1",
+                [
+                    ResponseBatchItem(question_id=q.id, answer={"value": "ok"})
+                    for q in survey_questions
+                ],
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _on_execute)
+
+        assert result.saved == 3
+        assert [r.status for r in result.results] == ["created"] * 3
+        assert all(r.response_id for r in result.results)
+        assert len(inserts) == 1
+
+    @pytest.mark.asyncio
+    async def test_reports_per_item_results(self, service, survey_questions):
+        first, second, _ = survey_questions
+        await service.submit_batch(
+            first.survey_id,
+            "batch-2",
+            [ResponseBatchItem(question_id=first.id, answer={"value": "ok"})],
+        )
+
+        result = await service.submit_batch(
+            first.survey_id,
+            "batch-2",
+            [
+                ResponseBatchItem(question_id=first.id, answer={"value": "again"}),
+                ResponseBatchItem(question_id=second.id, answer={"value": ""}),
+                ResponseBatchItem(question_id=9999, answer={"value": "ok"}),
+            ],
+            validators=AnswerValidatorRegistry(),
+        )
+
+        assert result.saved == 0
+        assert [r.status for r in result.results] == [
+            "duplicate",
+            "invalid",
+            "unknown_question",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_overwrite_replaces_answer(self, service, survey_questions):
+        question = survey_questions[0]
+        items = [ResponseBatchItem(question_id=question.id, answer={"value": "old"})]
+        await service.submit_batch(question.survey_id, "batch-3", items)
+
+        result = await service.submit_batch(
+            question.survey_id,
+            "batch-3",
+            [ResponseBatchItem(question_id=question.id, answer={"value": "new"})],
+            overwrite_answer=True,
+        )
+
+        assert result.results[0].status == "saved"
+        response = await service.response_repo.get(result.results[0].response_id)
+        assert response.answer == {"value": "new"}
@@ -210,7 +210,9 @@ class TestResponsesRouterCreation:
             patch(
                 "src.routers.responses.get_response_repository"
             ) as mock_response_repo,
-            patch("src.routers.responses._validate_response_data") as mock_validate,
+            patch(
+                "src.routers.responses.answer_validators.validate"
+            ) as mock_validate,
         ):
             mock_question_repo.return_value.get.return_value = question
             mock_question_repo.return_value.get_survey_by_question_id.return_value = (
@@ -917,86 +919,86 @@ class TestResponsesRouterValidation:
 class TestResponsesRouterValidationHelpers:
     """Тесты вспомогательных функций валидации."""
 
-    def test_validate_response_data_text_question(self):
+    def test_validator_for_type_text_question(self):
         """Тест валидации текстового вопроса."""
         # Arrange
-        from src.routers.responses import _validate_response_data
+        from src.services.answer_validation import answer_validators
 
         question_type = "TEXT"
-        answer = {"text": "Valid text answer"}
+        answer = {"value": "Valid text answer"}
 
         # Act
-        result = _validate_response_data(question_type, answer)
+        result = answer_validators.validator_for_type(question_type)(answer)
 
         # Assert
         assert result is True
 
-    def test_validate_response_data_text_question_empty(self):
+    def test_validator_for_type_text_question_empty(self):
         """Тест валидации пустого текстового ответа."""
         # Arrange
-        from src.routers.responses import _validate_response_data
+        from src.services.answer_validation import answer_validators
 
         question_type = "TEXT"
-        answer = {"text": ""}
+        answer = {"value": ""}
 
         # Act
-        result = _validate_response_data(question_type, answer)
+        result = answer_validators.validator_for_type(question_type)(answer)
 
         # Assert
         assert result is False
 
-    def test_validate_response_data_single_choice(self):
+    def test_validator_for_type_single_choice(self):
         """Тест валидации одиночного выбора."""
         # Arrange
-        from src.routers.responses import _validate_response_data
+        from src.services.answer_validation import answer_validators
 
         question_type = "SINGLE_CHOICE"
         answer = {"selected_option": "Option 1"}
 
         # Act
-        result = _validate_response_data(question_type, answer)
+        result = answer_validators.validator_for_type(question_type)(answer)
 
         # Assert
         assert result is True
 
-    def test_validate_response_data_multiple_choice(self):
+    def test_validator_for_type_multiple_choice(self):
         """Тест валидации множественного выбора."""
         # Arrange
-        from src.routers.responses import _validate_response_data
+        from src.services.answer_validation import answer_validators
 
         question_type = "MULTIPLE_CHOICE"
         answer = {"selected_options": ["Option 1", "Option 2"]}
 
         # Act
-        result = _validate_response_data(question_type, answer)
+        result = answer_validators.validator_for_type(question_type)(answer)
 
         # Assert
         assert result is True
 
-    def test_validate_response_data_scale(self):
+    def test_validator_for_type_scale(self):
         """Тест валидации шкалы."""
         # Arrange
-        from src.routers.responses import _validate_response_data
+        from src.services.answer_validation import answer_validators
 
         question_type = "SCALE"
         answer = {"scale_value": 3}
 
         # Act
-        result = _validate_response_data(question_type, answer)
+        result = answer_validators.validator_for_type(question_type)(answer)
 
         # Assert
         assert result is True
 
-    def test_validate_response_data_invalid_format(self):
+    def test_validator_for_type_invalid_format(self):
         """Тест валидации с неправильным форматом."""
         # Arrange
-        from src.routers.responses import _validate_response_data
+        from src.services.answer_validation import answer_validators
 
         question_type = "TEXT"
         answer = {"wrong_key": "value"}
 
         # Act
-        result = _validate_response_data(question_type, answer)
+        result = answer_validators.validator_for_type(question_type)(answer)
 
         # Assert
         assert result is False
@@ -1009,7 +1011,7 @@ class TestResponsesRouterValidationHelpers:
         question = QuestionModelFactory.build(
             question_type="TEXT", title="Test Question", is_required=True
         )
-        answer = {"text": ""}
+        answer = {"value": ""}
 
         # Act
         result = _get_validation_message(question, answer)
@@ -0,0 +1,141 @@
+"""
+Тесты кэша снимков опросов (опрос + упорядоченные вопросы).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from models.question import Question
+from models.survey import Survey
+from repositories.question import QuestionRepository
+from repositories.survey import SurveyRepository
+from services.cache_codec import decode, get_codec
+from services.survey_snapshot import SurveySnapshotCache, survey_snapshot_cache
+from services.tiered_cache import TieredCache
+
+
+class FakeRedisService:
+    """Минимальная замена RedisService на словаре."""
+
+    def __init__(self):
+        self.connected = True
+        self.data = {}
+        self.versions = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None, nx=False):
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def get_binary(self, key):
+        data = self.data.get(key)
+        return decode(data) if data is not None else None
+
+    async def set_binary(self, key, value, ttl=None, nx=False):
+        return await self.set(key, get_codec("json").encode(value), ttl=ttl, nx=nx)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def get_version(self, key):
+        return self.versions.get(key, 0)
+
+    async def set_if_version(self, key, value, version, ttl=None, binary=False):
+        if self.versions.get(key, 0) != version:
+            return False
+        self.data[key] = get_codec("json").encode(value) if binary else value
+        return True
+
+    async def invalidate_versioned(self, *keys, version_ttl=None):
+        for key in keys:
+            self.data.pop(key, None)
+            self.versions[key] = self.versions.get(key, 0) + 1
+        return len(keys)
+
+    async def publish(self, channel, message):
+        return 0
+
+
+def _cache() -> SurveySnapshotCache:
+    return SurveySnapshotCache(TieredCache(FakeRedisService(), binary=True))
+
+
+@pytest_asyncio.fixture
+async def survey(async_session):
+    # Опросы прошлых тестов остаются в базе, токен должен быть уникальным
+    survey = Survey(title="Snapshot", is_active=True, access_token=uuid.uuid4().hex)
+    async_session.add(survey)
+    await async_session.flush()
+    async_session.add_all(
+        [
+            Question(survey_id=survey.id, title=f"Q{i}", question_type="TEXT", order=i)
+            for i in (2, 0, 1)
+        ]
+    )
+    await async_session.commit()
+    return survey
+
+
+@pytest.fixture
+def repos(async_session):
+    return SurveyRepository(async_session), QuestionRepository(async_session)
+
+
+class TestSurveySnapshotCache:
+    """Тесты read-through кэша снимков опросов."""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_served_from_cache(self, survey, repos):
+        cache = _cache()
+        survey_repo, question_repo = repos
+
+        first = await cache.get_by_id(survey.id, survey_repo, question_repo)
+        survey_repo.get = AsyncMock()
+        second = await cache.get_by_id(survey.id, survey_repo, question_repo)
+
+        assert second == first
+        assert [q["order"] for q in first["questions"]] == [0, 1, 2]
+        survey_repo.get.assert_not_called()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_access_token(self, survey, repos):
+        cache = _cache()
+        survey_repo, question_repo = repos
+
+        await cache.get_by_token(survey.access_token, survey_repo, question_repo)
+        snapshot = await cache.get_by_token(
+            survey.access_token, survey_repo, question_repo
+        )
+
+        assert snapshot["id"] == survey.id
+        assert cache.stats()["hits"] == 1
+        assert await cache.get_by_token("unknown", survey_repo, question_repo) is None
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_snapshot(
+        self, async_session, survey, repos, monkeypatch
+    ):
+        monkeypatch.setattr(
+            survey_snapshot_cache.cache, "redis_service", FakeRedisService()
+        )
+        survey_repo, question_repo = repos
+        await survey_snapshot_cache.get_by_id(survey.id, survey_repo, question_repo)
+
+        survey.title = "Renamed"
+        await async_session.commit()
+        await asyncio.sleep(0)
+
+        snapshot = await survey_snapshot_cache.get_by_id(
+            survey.id, survey_repo, question_repo
+        )
+        assert snapshot["title"] == "Renamed"